@@ -0,0 +1,56 @@
+"""Make events sync lookup index unique for set-based upsert
+
+설계 의도:
+- INSERT ... ON CONFLICT는 충돌 대상이 unique 인덱스여야 함
+- idx_events_sync_lookup을 같은 컬럼의 unique 인덱스로 교체
+- 교체 전 기존 중복 행은 external_updated_at이 가장 최신인 행만 남김
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-01-27 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Remove duplicate external events, keeping the most recently updated row
+    op.execute("""
+        DELETE FROM events
+        WHERE ctid IN (
+            SELECT ctid FROM (
+                SELECT ctid, row_number() OVER (
+                    PARTITION BY user_id, source_platform, external_calendar_id, external_event_id
+                    ORDER BY external_updated_at DESC NULLS LAST, updated_at DESC NULLS LAST
+                ) AS rn
+                FROM events
+                WHERE external_event_id IS NOT NULL
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+
+    # Replace lookup index with a unique one usable as ON CONFLICT target
+    op.drop_index('idx_events_sync_lookup', table_name='events')
+    op.create_index(
+        'idx_events_sync_lookup', 'events',
+        ['user_id', 'source_platform', 'external_calendar_id', 'external_event_id'],
+        unique=True
+    )
+
+def downgrade():
+    op.drop_index('idx_events_sync_lookup', table_name='events')
+    op.create_index(
+        'idx_events_sync_lookup', 'events',
+        ['user_id', 'source_platform', 'external_calendar_id', 'external_event_id']
+    )
+
+# Acceptance Criteria:
+# - idx_events_sync_lookup is unique so upserts can target it with ON CONFLICT
+# - Existing duplicates are collapsed to the latest external version before the swap
+# - Migration is reversible
@@ -0,0 +1,51 @@
+"""Add page checkpoint columns to sync_state for resumable syncs
+
+설계 의도:
+- 페이지 커밋마다 다음 페이지 토큰, 동기화 창, 누적 건수를 체크포인트로 저장
+- 크래시/배포/429로 중단된 동기화는 마지막 체크포인트부터 재개
+- 동기화가 끝까지 성공하면 체크포인트 컬럼은 비워짐
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-02-03 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Resume position of an in-progress sync
+    op.add_column('sync_state', sa.Column('checkpoint_page_token', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('checkpoint_window_start', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('sync_state', sa.Column('checkpoint_window_end', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('sync_state', sa.Column('checkpoint_delta', sa.Boolean(), nullable=False, server_default='false'))
+
+    # Partial counts accumulated before the checkpoint
+    op.add_column('sync_state', sa.Column('checkpoint_events_processed', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('sync_state', sa.Column('checkpoint_events_created', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('sync_state', sa.Column('checkpoint_events_updated', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('sync_state', sa.Column('checkpoint_events_deleted', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('sync_state', sa.Column('checkpoint_max_updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('sync_state', sa.Column('checkpointed_at', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    op.drop_column('sync_state', 'checkpointed_at')
+    op.drop_column('sync_state', 'checkpoint_max_updated_at')
+    op.drop_column('sync_state', 'checkpoint_events_deleted')
+    op.drop_column('sync_state', 'checkpoint_events_updated')
+    op.drop_column('sync_state', 'checkpoint_events_created')
+    op.drop_column('sync_state', 'checkpoint_events_processed')
+    op.drop_column('sync_state', 'checkpoint_delta')
+    op.drop_column('sync_state', 'checkpoint_window_end')
+    op.drop_column('sync_state', 'checkpoint_window_start')
+    op.drop_column('sync_state', 'checkpoint_page_token')
+
+# Acceptance Criteria:
+# - sync_state stores page token, window and partial counts of an unfinished sync
+# - Columns default to an empty checkpoint for existing rows
+# - Migration is reversible
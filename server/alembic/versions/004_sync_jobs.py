@@ -0,0 +1,62 @@
+"""Add sync_jobs table for the durable sync job queue
+
+설계 의도:
+- /api/sync/pull은 작업을 적재만 하고 별도 워커 프로세스가 실행
+- 워커는 FOR UPDATE SKIP LOCKED로 작업을 중복 없이 가져감
+- 캘린더당 대기 중(queued) 작업은 하나만 허용하여 중복 적재 방지
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-02-10 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=False), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('user_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('connection_id', postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column('external_calendar_id', sa.Text(), nullable=False),
+        sa.Column('options', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('status', sa.Text(), nullable=False, server_default='queued'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('run_after', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('locked_by', sa.Text(), nullable=True),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('result', postgresql.JSONB(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
+        sa.ForeignKeyConstraint(['connection_id'], ['external_connections.id'], ondelete='CASCADE'),
+    )
+
+    # Claim query: status = 'queued' AND run_after <= now() ORDER BY run_after
+    op.create_index('idx_sync_jobs_claim', 'sync_jobs', ['status', 'run_after'])
+
+    # At most one queued job per calendar
+    op.create_index(
+        'uq_sync_jobs_queued_calendar', 'sync_jobs', ['connection_id', 'external_calendar_id'],
+        unique=True, postgresql_where=sa.text("status = 'queued'")
+    )
+
+def downgrade():
+    op.drop_index('uq_sync_jobs_queued_calendar', table_name='sync_jobs')
+    op.drop_index('idx_sync_jobs_claim', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
+
+# Acceptance Criteria:
+# - sync_jobs persists queued sync work across API and worker restarts
+# - Indexes support SKIP LOCKED claiming and enqueue de-duplication
+# - Migration is reversible
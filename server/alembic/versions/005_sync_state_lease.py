@@ -0,0 +1,32 @@
+"""Add lease columns to sync_state for cross-node sync exclusion
+
+설계 의도:
+- 여러 서버 레플리카/워커가 같은 캘린더를 동시에 동기화하지 않도록 lease 기록
+- lease는 만료 시각을 가지므로 죽은 노드가 잡은 lease는 자동으로 회수됨
+- 조건부 UPDATE 한 번으로 획득하므로 세션 단위 advisory lock과 달리 커넥션 풀과 무관
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-02-17 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('sync_state', sa.Column('lease_owner', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    op.drop_column('sync_state', 'lease_expires_at')
+    op.drop_column('sync_state', 'lease_owner')
+
+# Acceptance Criteria:
+# - sync_state records which node currently syncs the calendar and until when
+# - Expired leases can be taken over by another node
+# - Migration is reversible
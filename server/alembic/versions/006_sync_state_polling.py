@@ -0,0 +1,38 @@
+"""Add adaptive polling columns to sync_state
+
+설계 의도:
+- 캘린더별 관측 변경률(EWMA)과 폴링 간격, 다음 폴링 시각을 영속화
+- 스케줄러는 next_sync_due_at 인덱스로 도래한 캘린더만 조회
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-02-24 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('sync_state', sa.Column('change_rate', sa.Float(), nullable=True))  # changes per hour (EWMA)
+    op.add_column('sync_state', sa.Column('poll_interval_seconds', sa.Integer(), nullable=True))
+    op.add_column('sync_state', sa.Column('last_polled_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('sync_state', sa.Column('next_sync_due_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.create_index('idx_sync_state_next_sync_due_at', 'sync_state', ['next_sync_due_at'])
+
+def downgrade():
+    op.drop_index('idx_sync_state_next_sync_due_at', table_name='sync_state')
+    op.drop_column('sync_state', 'next_sync_due_at')
+    op.drop_column('sync_state', 'last_polled_at')
+    op.drop_column('sync_state', 'poll_interval_seconds')
+    op.drop_column('sync_state', 'change_rate')
+
+# Acceptance Criteria:
+# - sync_state persists observed change rate and the next due time per calendar
+# - Due calendars can be found through an index
+# - Migration is reversible
@@ -0,0 +1,41 @@
+"""Add push notification channel columns to sync_state
+
+설계 의도:
+- 캘린더별 Google events.watch 채널 ID/리소스 ID/검증 토큰/만료 시각 저장
+- 웹훅 알림은 채널 ID로 sync_state를 바로 찾으므로 유니크 인덱스 사용
+- 갱신 루프는 watch_expires_at으로 만료 임박 채널만 조회
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-03-03 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('sync_state', sa.Column('watch_channel_id', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('watch_resource_id', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('watch_token', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('watch_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.create_index('uq_sync_state_watch_channel_id', 'sync_state', ['watch_channel_id'], unique=True)
+    op.create_index('idx_sync_state_watch_expires_at', 'sync_state', ['watch_expires_at'])
+
+def downgrade():
+    op.drop_index('idx_sync_state_watch_expires_at', table_name='sync_state')
+    op.drop_index('uq_sync_state_watch_channel_id', table_name='sync_state')
+    op.drop_column('sync_state', 'watch_expires_at')
+    op.drop_column('sync_state', 'watch_token')
+    op.drop_column('sync_state', 'watch_resource_id')
+    op.drop_column('sync_state', 'watch_channel_id')
+
+# Acceptance Criteria:
+# - sync_state stores the active push channel for each calendar
+# - Incoming notifications resolve their calendar by channel id through an index
+# - Migration is reversible
@@ -0,0 +1,33 @@
+"""Add content fingerprint to events
+
+설계 의도:
+- 정규화된 이벤트 내용의 SHA-256 지문을 저장해 재전송된 동일 이벤트는 다시 쓰지 않음
+- Naver ICS처럼 external_version이 없고 DTSTAMP가 매번 바뀌는 피드의 불필요한 UPDATE/WAL 제거
+- 기존 행은 NULL이므로 다음 동기화에서 한 번 쓰이며 지문이 채워짐
+- 체크포인트 재개 시에도 unchanged 집계를 이어가도록 sync_state에 카운터 추가
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-03-10 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('events', sa.Column('content_hash', sa.Text(), nullable=True))
+    op.add_column('sync_state', sa.Column('checkpoint_events_unchanged', sa.Integer(), nullable=False, server_default='0'))
+
+def downgrade():
+    op.drop_column('sync_state', 'checkpoint_events_unchanged')
+    op.drop_column('events', 'content_hash')
+
+# Acceptance Criteria:
+# - events stores a content fingerprint used to skip no-op writes
+# - Existing rows get their fingerprint on the next sync that touches them
+# - Migration is reversible
@@ -0,0 +1,40 @@
+"""Add calendar_list_cache table
+
+설계 의도:
+- 연결별 캘린더 목록을 ETag/Last-Modified와 함께 저장하여 TTL마다 조건부 재검증
+- /api/sync/pull의 캘린더 목록 조회를 캐시로 대체
+- 연결 삭제 시 캐시도 함께 삭제
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-03-24 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'calendar_list_cache',
+        sa.Column('connection_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('calendars', postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('etag', sa.Text(), nullable=True),
+        sa.Column('last_modified', sa.Text(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('validated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['connection_id'], ['external_connections.id'], ondelete='CASCADE'),
+    )
+
+def downgrade():
+    op.drop_table('calendar_list_cache')
+
+# Acceptance Criteria:
+# - calendar_list_cache stores one calendar list per connection with its validators
+# - Rows are removed with their connection
+# - Migration is reversible
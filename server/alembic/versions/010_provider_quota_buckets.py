@@ -0,0 +1,40 @@
+"""Add provider_quota_buckets table
+
+설계 의도:
+- 제공자/사용자별 토큰 버킷을 DB에 두어 모든 워커와 레플리카가 같은 쿼터를 공유
+- 429를 받은 뒤 대기하는 대신 요청 전에 토큰을 받아 호출
+- 누적 허용/대기 횟수로 쿼터 사용량 확인
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-03-31 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'provider_quota_buckets',
+        sa.Column('bucket_key', sa.Text(), primary_key=True),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('refilled_at', sa.Float(), nullable=False),
+        sa.Column('rate_per_second', sa.Float(), nullable=False),
+        sa.Column('burst', sa.Integer(), nullable=False),
+        sa.Column('granted_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('throttled_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('last_granted', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+def downgrade():
+    op.drop_table('provider_quota_buckets')
+
+# Acceptance Criteria:
+# - provider_quota_buckets holds one token bucket per provider or provider/user key
+# - Migration is reversible
@@ -0,0 +1,38 @@
+"""Add access token expiry to external_connections
+
+설계 의도:
+- 연결별 access token 만료 시각을 저장하여 만료 전에 백그라운드에서 미리 갱신
+- 갱신 루프는 token_expires_at으로 만료 임박 연결만 조회
+- refresh token은 connection_id를 AAD로 암호화하여 저장 (이 리비전에서 추가하고 downgrade에서 함께 제거)
+- 기존 연결은 만료 시각을 모르므로 NULL (첫 401 갱신 때 채워짐)
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-04-07 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Encrypted refresh token and access token expiry, both owned by this revision
+    op.add_column('external_connections', sa.Column('refresh_token_encrypted', sa.Text(), nullable=True))
+    op.add_column('external_connections', sa.Column('token_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Refresh-ahead loop scans connections by expiry
+    op.create_index('idx_external_connections_token_expires_at', 'external_connections', ['token_expires_at'])
+
+def downgrade():
+    op.drop_index('idx_external_connections_token_expires_at', table_name='external_connections')
+    op.drop_column('external_connections', 'token_expires_at')
+    op.drop_column('external_connections', 'refresh_token_encrypted')
+
+# Acceptance Criteria:
+# - external_connections stores the encrypted refresh token and when each access token expires
+# - The refresh-ahead loop finds expiring connections through an index
+# - Migration is reversible
@@ -0,0 +1,29 @@
+"""Add token refresh retry time to external_connections
+
+설계 의도:
+- 선제 갱신 루프는 연결을 선점할 때 다음 시도 시각을 기록하고 잠금을 바로 해제
+- 일시적으로 갱신에 실패한 연결은 이 시각까지 다시 선점하지 않음 (실패 연결이 루프를 점유하지 않음)
+- 갱신에 성공하면 NULL로 되돌림
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-04-14 10:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('external_connections', sa.Column('token_refresh_retry_at', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    op.drop_column('external_connections', 'token_refresh_retry_at')
+
+# Acceptance Criteria:
+# - external_connections records when a failed token refresh may be retried
+# - Migration is reversible
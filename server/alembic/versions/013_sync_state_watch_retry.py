@@ -0,0 +1,29 @@
+"""Add watch channel retry time to sync_state
+
+설계 의도:
+- 채널 갱신 루프는 캘린더를 선점할 때 다음 시도 시각을 기록하고 행 잠금을 바로 해제
+- 채널 생성에 실패한 캘린더는 이 시각까지 다시 선점하지 않음 (실패 캘린더가 묶음을 차지하지 않음)
+- 채널 생성에 성공하면 NULL로 되돌림
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-04-14 11:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('sync_state', sa.Column('watch_retry_at', sa.DateTime(timezone=True), nullable=True))
+
+def downgrade():
+    op.drop_column('sync_state', 'watch_retry_at')
+
+# Acceptance Criteria:
+# - sync_state records when a failed watch channel renewal may be retried
+# - Migration is reversible
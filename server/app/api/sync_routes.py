@@ -7,25 +7,36 @@
 - state: 동기화 상태 조회로 UI 상태 표시 지원
 
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from ..services.sync_service import CalendarSyncService, SyncOptions
-from ..models.sync_models import SyncState, ExternalConnection
+from ..services.sync_queue import SyncJobQueue, SyncJobRequest, PostgresSyncJobQueue
+from ..services.watch_service import WatchChannelService
+from ..services.push_executor import PushExecutor
+from ..services.calendar_list_service import CalendarListService
+from ..models.sync_models import SyncState, ExternalConnection, Event
 from ..core.database import get_db_session
 from ..core.auth import get_current_user
-from ..integrations.base import CalendarEventDTO
+from ..integrations.base import CalendarEventDTO, EventWriteOperation
+from ..integrations.registry import ProviderRegistry, get_provider_registry
+from ..integrations.quota import quota_user
 
+import dataclasses
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/sync", tags=["sync"])
 
+# push 시 동시에 처리할 이벤트(또는 batch 요청) 수
+PUSH_MAX_CONCURRENCY = int(os.getenv('SYNC_PUSH_MAX_CONCURRENCY', '8'))
+
 # Request/Response Models
 class SyncPullRequest(BaseModel):
     """서버 동기화 요청"""
@@ -72,22 +83,45 @@ class SyncResultResponse(BaseModel):
     results: List[Dict[str, Any]]
 
 # Dependencies
-async def get_sync_service(db: AsyncSession = Depends(get_db_session)) -> CalendarSyncService:
-    """동기화 서비스 의존성 주입"""
-    return CalendarSyncService(db)
+def get_provider_registry_dependency(request: Request) -> ProviderRegistry:
+    """lifespan에서 만든 앱 범위 제공자 레지스트리 (lifespan 미사용 시 전역 레지스트리)"""
+    return getattr(request.app.state, 'provider_registry', None) or get_provider_registry()
+
+async def get_sync_service(
+    db: AsyncSession = Depends(get_db_session),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+) -> CalendarSyncService:
+    """동기화 서비스 의존성 주입 (제공자와 HTTP 풀은 요청 간 공유)"""
+    # 공유 쿼터 버킷은 앱 시작 시 provider_registry_lifespan에서 한 번 연결
+    return CalendarSyncService(db, providers=registry.providers)
+
+async def get_sync_queue(
+    sync_service: CalendarSyncService = Depends(get_sync_service)
+) -> SyncJobQueue:
+    """동기화 작업 큐 의존성 주입"""
+    return PostgresSyncJobQueue(sync_service.session_factory)
+
+async def get_watch_service(
+    sync_service: CalendarSyncService = Depends(get_sync_service),
+    sync_queue: SyncJobQueue = Depends(get_sync_queue)
+) -> WatchChannelService:
+    """변경 알림 채널 서비스 의존성 주입"""
+    return WatchChannelService(
+        sync_service.session_factory, sync_queue, providers=sync_service.providers
+    )
 
 # Endpoints
 @router.post("/pull", response_model=SyncResultResponse)
 async def sync_pull(
     request: SyncPullRequest,
-    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user),
-    sync_service: CalendarSyncService = Depends(get_sync_service)
+    sync_service: CalendarSyncService = Depends(get_sync_service),
+    sync_queue: SyncJobQueue = Depends(get_sync_queue)
 ):
     """
     외부 캘린더에서 서버로 이벤트 동기화
     
-    백그라운드에서 실행하여 응답 시간 단축
+    sync_jobs 큐에 적재만 하고 실제 동기화는 워커 프로세스가 실행
     """
     user_id = current_user["sub"]
     
@@ -107,29 +141,38 @@ async def sync_pull(
             window_days_future=request.window_days_future
         )
         
-        # 백그라운드에서 동기화 실행
-        sync_results = []
+        # 연결별 동기화 대상 캘린더를 작업으로 구성
+        jobs = []
         for connection in valid_connections:
-            # 해당 연결의 모든 캘린더 또는 지정된 캘린더만 동기화
+            # 해당 연결의 모든 캘린더(캐시된 목록) 또는 지정된 캘린더만 동기화
             calendars_to_sync = request.calendar_ids or await _get_user_calendars(
-                sync_service, connection.id, connection.access_token_encrypted
+                sync_service, connection
             )
             
             for calendar_id in calendars_to_sync:
-                background_tasks.add_task(
-                    _sync_calendar_background,
-                    sync_service, user_id, connection.id, calendar_id, sync_options
-                )
-                
-                sync_results.append({
-                    'connection_id': connection.id,
-                    'calendar_id': calendar_id,
-                    'status': 'queued'
-                })
+                jobs.append(SyncJobRequest(
+                    user_id=user_id,
+                    connection_id=connection.id,
+                    external_calendar_id=calendar_id,
+                    options=sync_options
+                ))
+        
+        # 작업 큐에 적재 (이미 대기 중인 캘린더는 기존 작업 유지)
+        job_ids = await sync_queue.enqueue(jobs)
+        
+        sync_results = [
+            {
+                'connection_id': job.connection_id,
+                'calendar_id': job.external_calendar_id,
+                'job_id': job_id,
+                'status': 'queued' if job_id else 'already_queued'
+            }
+            for job, job_id in zip(jobs, job_ids)
+        ]
         
         return SyncResultResponse(
             success=True,
-            message=f"Queued {len(sync_results)} calendar sync tasks",
+            message=f"Queued {sum(1 for job_id in job_ids if job_id)} calendar sync jobs",
             results=sync_results
         )
         
@@ -172,22 +215,33 @@ async def sync_push(
             request.connection_id
         )
         
-        # 각 이벤트 처리
-        results = []
-        for event_data in request.events:
-            try:
-                result = await _process_event_push(
-                    provider, access_token, event_data, connection.platform_type
+        # 마지막으로 동기화된 상태 (수정 시 변경분만 보내거나 전송 생략, 쓰기 성공 시 갱신)
+        stored_events = await _get_stored_events(
+            sync_service.db, user_id, connection.platform_type, request.events
+        )
+        
+        # 서로 다른 이벤트는 동시에, 같은 이벤트의 작업은 요청 순서대로 실행
+        # (제공자 호출은 사용자별 쿼터 버킷에 집계)
+        executor = PushExecutor(PUSH_MAX_CONCURRENCY)
+        with quota_user(user_id):
+            if provider.capabilities.batch:
+                # batch 지원 제공자는 여러 이벤트를 한 요청으로 묶어 전송
+                results = await executor.run_batched(
+                    request.events, _push_keys,
+                    lambda events: _process_event_push_batch(provider, access_token, events, stored_events)
+                )
+            else:
+                results = await executor.run(
+                    request.events, _push_keys,
+                    lambda event_data: _process_event_push(
+                        provider, access_token, event_data, connection.platform_type, stored_events
+                    ),
+                    on_error=_push_error_result
                 )
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Failed to push event {event_data.local_id}: {e}")
-                results.append({
-                    'local_id': event_data.local_id,
-                    'success': False,
-                    'error': str(e)
-                })
+        
+        # 수정 결과(etag/지문/내용)를 저장된 행에 반영
+        if stored_events:
+            await sync_service.db.commit()
         
         # 성공한 작업 수 계산
         success_count = sum(1 for r in results if r.get('success', False))
@@ -254,6 +308,99 @@ async def get_sync_state(
         logger.error(f"Get sync state failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/jobs/{job_id}")
+async def get_sync_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    sync_queue: SyncJobQueue = Depends(get_sync_queue)
+):
+    """
+    적재된 동기화 작업 상태 조회
+    """
+    job = await sync_queue.get_job(job_id)
+    if not job or str(job.user_id) != str(current_user["sub"]):
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    
+    return {
+        'job_id': str(job.id),
+        'connection_id': str(job.connection_id),
+        'calendar_id': job.external_calendar_id,
+        'status': job.status,
+        'attempts': job.attempts,
+        'last_error': job.last_error,
+        'result': job.result,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None
+    }
+
+@router.post("/webhooks/google")
+async def google_push_notification(
+    request: Request,
+    watch_service: WatchChannelService = Depends(get_watch_service)
+):
+    """
+    Google Calendar events.watch 변경 알림 수신
+    
+    사용자 인증 대신 채널 토큰으로 검증하며, 알 수 없는 채널이어도 200을 반환해 재전송을 막음
+    """
+    accepted = await watch_service.handle_notification(
+        channel_id=request.headers.get('X-Goog-Channel-ID'),
+        resource_id=request.headers.get('X-Goog-Resource-ID'),
+        resource_state=request.headers.get('X-Goog-Resource-State'),
+        channel_token=request.headers.get('X-Goog-Channel-Token')
+    )
+    return {'accepted': accepted}
+
+@router.get("/providers/pool-stats")
+async def get_provider_pool_stats(
+    current_user: dict = Depends(get_current_user),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+):
+    """
+    제공자별 공유 HTTP 커넥션 풀 통계 조회
+    """
+    return registry.pool_stats()
+
+@router.get("/providers/quota")
+async def get_provider_quota_usage(
+    current_user: dict = Depends(get_current_user),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+):
+    """
+    제공자 전체 쿼터 버킷과 현재 사용자의 쿼터 버킷 사용량 조회
+    """
+    return await registry.quota_usage(current_user["sub"])
+
+@router.get("/providers/circuits")
+async def get_provider_circuits(
+    current_user: dict = Depends(get_current_user),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+):
+    """
+    제공자/엔드포인트별 circuit breaker 상태 조회
+    """
+    return registry.circuit_stats()
+
+@router.get("/providers/hedging")
+async def get_provider_hedging(
+    current_user: dict = Depends(get_current_user),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+):
+    """
+    엔드포인트별 GET hedging 발생/승리 횟수와 현재 임계값 조회
+    """
+    return registry.hedge_stats()
+
+@router.get("/providers/parsing")
+async def get_provider_parsing(
+    current_user: dict = Depends(get_current_user),
+    registry: ProviderRegistry = Depends(get_provider_registry_dependency)
+):
+    """
+    응답 파싱 인라인/프로세스 풀 횟수와 누적 네트워크/파싱 시간 조회
+    """
+    return registry.parse_stats()
+
 # Helper Functions
 async def _validate_connections(
     db: AsyncSession, 
@@ -286,92 +433,282 @@ async def _get_connection(
 
 async def _get_user_calendars(
     sync_service: CalendarSyncService,
-    connection_id: str,
-    encrypted_token: str
+    connection: ExternalConnection
 ) -> List[str]:
-    """사용자의 캘린더 ID 목록 조회"""
-    # 실제 구현에서는 캐시된 캘린더 목록 또는 제공자 API 호출
-    # 여기서는 기본 캘린더 반환
-    return ["primary"]
+    """사용자의 캘린더 ID 목록 조회 (calendar_list_cache, TTL 경과 시 조건부 재검증)"""
+    calendar_list = CalendarListService(sync_service.db, sync_service.providers)
+    calendars = await calendar_list.get_calendars(connection)
+    return [calendar.external_calendar_id for calendar in calendars]
 
-async def _sync_calendar_background(
-    sync_service: CalendarSyncService,
+@dataclasses.dataclass
+class _PushBaseline:
+    """수정 push의 비교 기준 (같은 이벤트의 다음 작업은 앞 작업이 쓴 결과를 기준으로 사용)"""
+    row: Event
+    event: CalendarEventDTO  # 마지막으로 알려진 원격 상태 (PATCH 비교 기준, If-Match etag)
+    content_hash: Optional[str]  # 원격 상태와 같다고 알려진 지문, 모르면 None (전송 생략 안 함)
+
+async def _get_stored_events(
+    db: AsyncSession,
     user_id: str,
-    connection_id: str, 
-    calendar_id: str,
-    options: SyncOptions
-):
-    """백그라운드 캘린더 동기화 실행"""
-    try:
-        result = await sync_service.sync_calendar(
-            user_id, connection_id, calendar_id, options
+    platform: str,
+    events: List[EventPushData]
+) -> Dict[Tuple[str, str], _PushBaseline]:
+    """수정 대상 이벤트의 저장된 행을 기준으로 한 번에 조회 ((외부 캘린더 ID, 외부 이벤트 ID) 키)"""
+    keys = {
+        (event_data.external_calendar_id, event_data.external_event_id)
+        for event_data in events
+        if event_data.action == 'update' and event_data.external_event_id
+    }
+    if not keys:
+        return {}
+    
+    query = select(Event).where(
+        and_(
+            Event.user_id == user_id,
+            Event.source_platform == platform,
+            Event.external_event_id.in_([event_id for _, event_id in keys]),
+            Event.deleted == False
         )
-        logger.info(f"Background sync completed: {result}")
-    except Exception as e:
-        logger.error(f"Background sync failed: {e}")
+    )
+    rows = (await db.execute(query)).scalars().all()
+    return {
+        (row.external_calendar_id, row.external_event_id): _PushBaseline(
+            row, _stored_event_dto(row), row.content_hash
+        )
+        for row in rows
+        if (row.external_calendar_id, row.external_event_id) in keys
+    }
+
+def _stored_event_dto(row: Event) -> CalendarEventDTO:
+    """저장된 행을 PATCH 비교 기준 DTO로 변환 (참석자는 저장하지 않으므로 모름으로 표시: 항상 전송, 없으면 []로 제거)"""
+    return CalendarEventDTO(
+        external_event_id=row.external_event_id,
+        calendar_id=row.external_calendar_id,
+        title=row.title,
+        description=row.description,
+        start_utc=row.start_datetime,
+        end_utc=row.end_datetime,
+        all_day=row.all_day,
+        location=row.location,
+        recurrence_rule=row.recurrence_rule,
+        external_updated_at=row.external_updated_at,
+        external_version=row.external_version,
+        attendees_known=False
+    )
+
+def _unchanged_push_result(
+    event_data: EventPushData,
+    baseline: Optional[_PushBaseline]
+) -> Optional[Dict[str, Any]]:
+    """원격 상태로 알려진 내용과 같은 수정이면 외부 호출 없이 돌려줄 결과, 아니면 None"""
+    if baseline is None or not baseline.content_hash:
+        return None
+    if baseline.content_hash != _to_event_dto(event_data).content_fingerprint():
+        return None
+    return {
+        'local_id': event_data.local_id,
+        'action': event_data.action,
+        'success': True,
+        'skipped': True,
+        'external_event_id': baseline.event.external_event_id,
+        'external_version': baseline.event.external_version,
+        'external_updated_at': _isoformat(baseline.event.external_updated_at)
+    }
+
+def _record_push_write(baseline: Optional[_PushBaseline], result_event: CalendarEventDTO):
+    """성공한 수정 결과를 기준과 저장된 행에 반영
+    
+    같은 이벤트의 다음 작업은 새 etag/내용으로 비교하고, 다음 pull은 같은 지문이면 다시 쓰지 않음
+    """
+    if baseline is None:
+        return
+    content_hash = result_event.content_fingerprint()
+    baseline.event = result_event
+    baseline.content_hash = content_hash
+    
+    row = baseline.row
+    row.title = result_event.title
+    row.description = result_event.description
+    row.start_datetime = result_event.start_utc
+    row.end_datetime = result_event.end_utc
+    row.all_day = result_event.all_day
+    row.location = result_event.location
+    row.recurrence_rule = result_event.recurrence_rule
+    row.external_version = result_event.external_version
+    row.external_updated_at = result_event.external_updated_at
+    row.content_hash = content_hash
+    row.updated_at = datetime.now(timezone.utc)
+
+def _record_push_failure(baseline: Optional[_PushBaseline]):
+    """실패한 수정 뒤에는 원격 상태를 확신할 수 없으므로 전송 생략 기준에서 제외 (다음 pull이 행을 다시 씀)"""
+    if baseline is None:
+        return
+    baseline.content_hash = None
+    baseline.row.content_hash = None
+
+def _push_keys(event_data: EventPushData) -> List[Optional[str]]:
+    """같은 이벤트로 취급할 키 (로컬 ID, 외부 ID 중 하나라도 같으면 순서 유지)"""
+    return [f"local:{event_data.local_id}", event_data.external_event_id]
+
+def _push_error_result(event_data: EventPushData, error: Exception) -> Dict[str, Any]:
+    """push 실패 결과"""
+    logger.error(f"Failed to push event {event_data.local_id}: {error}")
+    return {
+        'local_id': event_data.local_id,
+        'success': False,
+        'error': str(error)
+    }
+
+async def _process_event_push_batch(
+    provider,
+    access_token: str,
+    events: List[EventPushData],
+    stored_events: Optional[Dict[Tuple[str, str], _PushBaseline]] = None
+) -> List[Dict[str, Any]]:
+    """batch_write로 여러 이벤트를 묶어 push 처리 (결과는 이벤트 순서 유지)"""
+    stored_events = stored_events or {}
+    results: List[Optional[Dict[str, Any]]] = [None] * len(events)
+    baselines: List[Optional[_PushBaseline]] = [None] * len(events)
+    operations = []
+    operation_indexes = []
+    
+    for index, event_data in enumerate(events):
+        if event_data.action == 'update':
+            baselines[index] = stored_events.get((event_data.external_calendar_id, event_data.external_event_id))
+        stored = baselines[index]
+        skipped = _unchanged_push_result(event_data, stored)
+        if skipped is not None:
+            results[index] = skipped
+            continue
+        
+        operations.append(EventWriteOperation(
+            action='delete' if event_data.action == 'delete' else 'upsert',
+            calendar_id=event_data.external_calendar_id,
+            event=_to_event_dto(event_data) if event_data.action != 'delete' else None,
+            external_event_id=event_data.external_event_id,
+            previous=stored.event if stored is not None else None
+        ))
+        operation_indexes.append(index)
+    
+    write_results = await provider.batch_write(access_token, operations) if operations else []
+    
+    for index, write_result in zip(operation_indexes, write_results):
+        event_data = events[index]
+        if not write_result.success:
+            logger.error(f"Failed to push event {event_data.local_id}: {write_result.error}")
+            _record_push_failure(baselines[index])
+            results[index] = {
+                'local_id': event_data.local_id,
+                'success': False,
+                'error': write_result.error
+            }
+        elif event_data.action == 'delete':
+            results[index] = {
+                'local_id': event_data.local_id,
+                'action': 'delete',
+                'success': True
+            }
+        else:
+            _record_push_write(baselines[index], write_result.event)
+            results[index] = {
+                'local_id': event_data.local_id,
+                'action': event_data.action,
+                'success': True,
+                'external_event_id': write_result.event.external_event_id,
+                'external_version': write_result.event.external_version,
+                'external_updated_at': _isoformat(write_result.event.external_updated_at)
+            }
+    return results
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def _to_event_dto(event_data: EventPushData) -> CalendarEventDTO:
+    """push 데이터를 CalendarEventDTO로 변환"""
+    return CalendarEventDTO(
+        external_event_id=event_data.external_event_id,
+        calendar_id=event_data.external_calendar_id,
+        title=event_data.title,
+        description=event_data.description,
+        start_utc=event_data.start_utc,
+        end_utc=event_data.end_utc,
+        all_day=event_data.all_day,
+        location=event_data.location,
+        recurrence_rule=event_data.recurrence_rule,
+        attendees=event_data.attendees
+    )
 
 async def _process_event_push(
     provider,
     access_token: str,
     event_data: EventPushData,
-    platform: str
+    platform: str,
+    stored_events: Optional[Dict[Tuple[str, str], _PushBaseline]] = None
 ) -> Dict[str, Any]:
     """개별 이벤트 push 처리"""
-    try:
-        # DTO 변환
-        event_dto = CalendarEventDTO(
-            external_event_id=event_data.external_event_id,
-            calendar_id=event_data.external_calendar_id,
-            title=event_data.title,
-            description=event_data.description,
-            start_utc=event_data.start_utc,
-            end_utc=event_data.end_utc,
-            all_day=event_data.all_day,
-            location=event_data.location,
-            recurrence_rule=event_data.recurrence_rule,
-            attendees=event_data.attendees
+    # DTO 변환
+    event_dto = _to_event_dto(event_data)
+    
+    if event_data.action == "delete":
+        # 삭제 처리
+        if not event_data.external_event_id:
+            raise ValueError("external_event_id required for delete")
+        
+        await provider.delete_event(
+            access_token,
+            event_data.external_calendar_id,
+            event_data.external_event_id
         )
         
-        if event_data.action == "delete":
-            # 삭제 처리
-            if not event_data.external_event_id:
-                raise ValueError("external_event_id required for delete")
-            
-            await provider.delete_event(
-                access_token,
-                event_data.external_calendar_id,
-                event_data.external_event_id
-            )
-            
-            return {
-                'local_id': event_data.local_id,
-                'action': 'delete',
-                'success': True
-            }
+        return {
+            'local_id': event_data.local_id,
+            'action': 'delete',
+            'success': True
+        }
+    
+    else:
+        # 생성/수정 처리 (저장된 내용과 같으면 호출 생략, 다르면 이전 상태를 함께 전달)
+        stored = (stored_events or {}).get(
+            (event_data.external_calendar_id, event_data.external_event_id)
+        ) if event_data.action == 'update' else None
+        skipped = _unchanged_push_result(event_data, stored)
+        if skipped is not None:
+            return skipped
         
-        else:
-            # 생성/수정 처리
+        try:
             result_event = await provider.upsert_event(
                 access_token,
                 event_data.external_calendar_id,
-                event_dto
+                event_dto,
+                previous=stored.event if stored is not None else None
             )
-            
-            return {
-                'local_id': event_data.local_id,
-                'action': event_data.action,
-                'success': True,
-                'external_event_id': result_event.external_event_id,
-                'external_version': result_event.external_version,
-                'external_updated_at': result_event.external_updated_at.isoformat()
-            }
-            
-    except Exception as e:
-        raise e
+        except Exception:
+            _record_push_failure(stored)
+            raise
+        _record_push_write(stored, result_event)
+        
+        return {
+            'local_id': event_data.local_id,
+            'action': event_data.action,
+            'success': True,
+            'external_event_id': result_event.external_event_id,
+            'external_version': result_event.external_version,
+            'external_updated_at': _isoformat(result_event.external_updated_at)
+        }
 
 # Acceptance Criteria:
 # - /api/sync/pull로 외부 캘린더에서 서버로 이벤트 동기화
-# - /api/sync/push로 클라이언트 변경사항을 외부 캘린더에 반영
+# - /api/sync/push로 클라이언트 변경사항을 외부 캘린더에 반영 (batch 지원 제공자는 묶어서 전송)
+# - push는 이벤트 간 제한 동시 실행, 같은 이벤트의 작업 순서와 결과 순서는 요청 순서 유지
+# - 수정 push는 저장된 내용과 같으면 외부 호출 생략, 다르면 변경 필드만 조건부(If-Match) 전송
+# - 수정 결과의 etag/지문은 저장된 행에 반영되고, 같은 이벤트의 다음 작업은 새 etag를 기준으로 전송
 # - /api/sync/state로 동기화 상태 조회 및 UI 표시 지원
-# - 백그라운드 작업으로 동기화 성능 최적화
+# - /api/sync/webhooks/google 알림은 변경된 캘린더만 delta 동기화로 적재
+# - 제공자/HTTP 풀은 앱 범위 레지스트리에서 공유, /api/sync/providers/pool-stats로 풀 상태 확인
+# - 제공자 호출은 쿼터 토큰 버킷을 거치며 /api/sync/providers/quota로 사용량 확인
+# - 제공자 장애 시 circuit breaker로 즉시 실패, /api/sync/providers/circuits로 상태 확인
+# - Google GET hedging 효과는 /api/sync/providers/hedging으로 확인
+# - 파싱 오프로드와 네트워크/파싱 시간 분리는 /api/sync/providers/parsing으로 확인
+# - pull은 sync_jobs 큐에 적재만 하고 워커가 실행하여 API 응답 지연 최소화
+# - calendar_ids 없는 pull은 연결별 캐시된 캘린더 목록 사용 (TTL 경과 시 조건부 재검증)
 # - 적절한 오류 처리와 로깅으로 디버깅 지원
\ No newline at end of file
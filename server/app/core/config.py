@@ -0,0 +1,174 @@
+"""Application settings loaded from environment variables
+
+설계 의도:
+- 외부 캘린더 OAuth 자격 증명과 HTTP 커넥션 풀, 쿼터 설정을 환경변수 한 곳에서 로드
+- 코드에 박힌 placeholder 자격 증명 제거
+- 필드 기본값은 로컬 개발용, 운영 값은 환경변수로 주입
+
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Dict
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+@dataclass
+class OAuthClientSettings:
+    """OAuth 클라이언트 자격 증명"""
+    client_id: str = ''
+    client_secret: str = ''
+
+@dataclass
+class HttpPoolSettings:
+    """제공자 HTTP 클라이언트 커넥션 풀 설정"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0  # 유휴 커넥션 유지 시간 (초)
+    http2: bool = True  # h2 패키지가 없으면 HTTP/1.1로 동작
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+
+@dataclass
+class ProviderQuotaSettings:
+    """제공자 토큰 버킷 설정 (rate 0이면 해당 버킷 제한 없음)"""
+    rate_per_second: float = 0.0  # 제공자 전체 (프로젝트 쿼터)
+    burst: int = 0
+    user_rate_per_second: float = 0.0  # 사용자별 쿼터
+    user_burst: int = 0
+
+@dataclass
+class QuotaSettings:
+    """제공자 호출 쿼터 설정"""
+    store: str = 'memory'  # memory: 프로세스 내, postgres: 워커/레플리카 간 공유
+    max_wait: float = 60.0  # 토큰 대기 상한 (초), 넘으면 RateLimitError
+    providers: Dict[str, ProviderQuotaSettings] = field(default_factory=dict)
+
+@dataclass
+class RetrySettings:
+    """제공자 호출 재시도/circuit breaker 설정"""
+    max_attempts: int = 4
+    deadline: float = 30.0  # 호출 하나의 재시도 전체 상한 (초)
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    budget_ratio: float = 0.2  # 재시도는 최근 요청 수의 20%까지
+    budget_min_retries: int = 10
+    breaker_failure_threshold: int = 5  # 연속 실패 수
+    breaker_reset_timeout: float = 30.0  # open 후 시험 호출까지 (초)
+
+@dataclass
+class HedgeSettings:
+    """멱등 GET 요청 hedging 설정"""
+    enabled: bool = False
+    percentile: float = 0.95  # 최근 지연 분포의 이 백분위를 넘으면 중복 요청
+    min_samples: int = 20  # 표본이 이보다 적으면 hedging하지 않음
+    min_delay: float = 0.05  # 임계값 하한/상한 (초)
+    max_delay: float = 5.0
+    max_extra_ratio: float = 0.05  # 중복 요청은 최근 요청 수의 5%까지
+
+@dataclass
+class ParseSettings:
+    """응답 파싱 프로세스 풀 오프로드 설정"""
+    enabled: bool = False
+    threshold_bytes: int = 512 * 1024  # 압축 해제 후 이 크기 이상인 응답만 프로세스 풀에서 파싱
+    max_workers: int = 2  # 0이면 CPU 수
+
+@dataclass
+class ProviderSettings:
+    """캘린더 제공자 설정"""
+    google: OAuthClientSettings = field(default_factory=OAuthClientSettings)
+    naver: OAuthClientSettings = field(default_factory=OAuthClientSettings)
+    kakao: OAuthClientSettings = field(default_factory=OAuthClientSettings)
+    http: HttpPoolSettings = field(default_factory=HttpPoolSettings)
+    quota: QuotaSettings = field(default_factory=QuotaSettings)
+    retry: RetrySettings = field(default_factory=RetrySettings)
+    google_hedge: HedgeSettings = field(default_factory=HedgeSettings)
+    parse: ParseSettings = field(default_factory=ParseSettings)
+    google_page_size: int = 1000
+    google_partial_response: bool = True  # fields= 로 필요한 필드만 조회
+
+def load_provider_settings() -> ProviderSettings:
+    """환경변수에서 제공자 설정 로드"""
+    def oauth(prefix: str) -> OAuthClientSettings:
+        return OAuthClientSettings(
+            client_id=os.getenv(f'{prefix}_CLIENT_ID', ''),
+            client_secret=os.getenv(f'{prefix}_CLIENT_SECRET', '')
+        )
+
+    def provider_quota(prefix: str, rate: float, burst: int, user_rate: float, user_burst: int) -> ProviderQuotaSettings:
+        return ProviderQuotaSettings(
+            rate_per_second=float(os.getenv(f'{prefix}_QUOTA_RATE', rate)),
+            burst=int(os.getenv(f'{prefix}_QUOTA_BURST', burst)),
+            user_rate_per_second=float(os.getenv(f'{prefix}_USER_QUOTA_RATE', user_rate)),
+            user_burst=int(os.getenv(f'{prefix}_USER_QUOTA_BURST', user_burst))
+        )
+
+    defaults = HttpPoolSettings()
+    retry_defaults = RetrySettings()
+    hedge_defaults = HedgeSettings()
+    parse_defaults = ParseSettings()
+    return ProviderSettings(
+        google=oauth('GOOGLE'),
+        naver=oauth('NAVER'),
+        kakao=oauth('KAKAO'),
+        http=HttpPoolSettings(
+            max_connections=int(os.getenv('PROVIDER_HTTP_MAX_CONNECTIONS', defaults.max_connections)),
+            max_keepalive_connections=int(os.getenv(
+                'PROVIDER_HTTP_MAX_KEEPALIVE', defaults.max_keepalive_connections
+            )),
+            keepalive_expiry=float(os.getenv('PROVIDER_HTTP_KEEPALIVE_EXPIRY', defaults.keepalive_expiry)),
+            http2=_env_bool('PROVIDER_HTTP2', defaults.http2),
+            timeout=float(os.getenv('PROVIDER_HTTP_TIMEOUT', defaults.timeout)),
+            connect_timeout=float(os.getenv('PROVIDER_HTTP_CONNECT_TIMEOUT', defaults.connect_timeout))
+        ),
+        google_page_size=int(os.getenv('GOOGLE_PAGE_SIZE', 1000)),
+        google_partial_response=_env_bool('GOOGLE_PARTIAL_RESPONSE', True),
+        quota=QuotaSettings(
+            store=os.getenv('PROVIDER_QUOTA_STORE', 'memory'),
+            max_wait=float(os.getenv('PROVIDER_QUOTA_MAX_WAIT', 60.0)),
+            providers={
+                # Google Calendar 기본 쿼터(사용자당 분당 600회)보다 낮게 잡아 429 방지
+                'google': provider_quota('GOOGLE', 50.0, 100, 8.0, 20),
+                'naver': provider_quota('NAVER', 10.0, 20, 0.0, 0)
+            }
+        ),
+        retry=RetrySettings(
+            max_attempts=int(os.getenv('PROVIDER_RETRY_MAX_ATTEMPTS', retry_defaults.max_attempts)),
+            deadline=float(os.getenv('PROVIDER_RETRY_DEADLINE', retry_defaults.deadline)),
+            base_delay=float(os.getenv('PROVIDER_RETRY_BASE_DELAY', retry_defaults.base_delay)),
+            max_delay=float(os.getenv('PROVIDER_RETRY_MAX_DELAY', retry_defaults.max_delay)),
+            budget_ratio=float(os.getenv('PROVIDER_RETRY_BUDGET_RATIO', retry_defaults.budget_ratio)),
+            budget_min_retries=int(os.getenv('PROVIDER_RETRY_BUDGET_MIN', retry_defaults.budget_min_retries)),
+            breaker_failure_threshold=int(os.getenv(
+                'PROVIDER_BREAKER_FAILURE_THRESHOLD', retry_defaults.breaker_failure_threshold
+            )),
+            breaker_reset_timeout=float(os.getenv(
+                'PROVIDER_BREAKER_RESET_TIMEOUT', retry_defaults.breaker_reset_timeout
+            ))
+        ),
+        google_hedge=HedgeSettings(
+            enabled=_env_bool('GOOGLE_HEDGE_REQUESTS', hedge_defaults.enabled),
+            percentile=float(os.getenv('GOOGLE_HEDGE_PERCENTILE', hedge_defaults.percentile)),
+            min_samples=int(os.getenv('GOOGLE_HEDGE_MIN_SAMPLES', hedge_defaults.min_samples)),
+            min_delay=float(os.getenv('GOOGLE_HEDGE_MIN_DELAY', hedge_defaults.min_delay)),
+            max_delay=float(os.getenv('GOOGLE_HEDGE_MAX_DELAY', hedge_defaults.max_delay)),
+            max_extra_ratio=float(os.getenv('GOOGLE_HEDGE_MAX_EXTRA_RATIO', hedge_defaults.max_extra_ratio))
+        ),
+        parse=ParseSettings(
+            enabled=_env_bool('PROVIDER_PARSE_OFFLOAD', parse_defaults.enabled),
+            threshold_bytes=int(os.getenv('PROVIDER_PARSE_OFFLOAD_THRESHOLD', parse_defaults.threshold_bytes)),
+            max_workers=int(os.getenv('PROVIDER_PARSE_WORKERS', parse_defaults.max_workers))
+        )
+    )
+
+# Acceptance Criteria:
+# - 제공자별 OAuth 자격 증명을 환경변수에서 로드
+# - 커넥션 풀 크기/keep-alive/HTTP/2/타임아웃을 환경변수로 조정 가능
+# - 재시도 횟수/deadline/budget과 circuit breaker 임계값을 환경변수로 조정 가능
+# - 제공자/사용자별 토큰 버킷 속도와 버스트, 공유 저장소 종류를 환경변수로 조정 가능
+# - Google partial response는 GOOGLE_PARTIAL_RESPONSE=false로 끄고 전송량 비교 가능
+# - Google GET hedging은 GOOGLE_HEDGE_REQUESTS=true로 켜고 백분위/추가 요청 비율 조정 가능
+# - 큰 응답 파싱은 PROVIDER_PARSE_OFFLOAD=true로 프로세스 풀에 넘기고 임계값/작업자 수 조정 가능
@@ -0,0 +1,37 @@
+"""In-process single-flight call coalescing
+
+설계 의도:
+- 같은 키로 동시에 들어온 호출은 하나의 실행에 합류하여 결과를 공유
+- 실행은 별도 태스크로 돌고 호출자는 shield로 대기하므로, 한 호출자가 취소되어도
+  다른 호출자의 결과에는 영향 없음
+- 실행이 끝나면 키가 해제되어 다음 호출은 새로 실행
+
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+class SingleFlight:
+    """키별 진행 중 호출 합류"""
+    
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """진행 중인 같은 키의 실행이 있으면 합류, 없으면 fn 실행"""
+        task = self._in_flight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._release(key, done))
+        return await asyncio.shield(task)
+    
+    def _release(self, key: Hashable, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+# Acceptance Criteria:
+# - 같은 키의 동시 호출은 한 번만 실행되고 모두 같은 결과(또는 예외)를 받음
+# - 호출자 취소가 공유 실행을 취소하지 않음
+# - 완료 후에는 키가 해제되어 재호출 시 새로 실행
@@ -3,11 +3,14 @@
 설계 의도:
 - Protocol 기반 인터페이스로 다양한 캘린더 제공자 지원
 - ProviderCapabilities로 각 제공자의 read/write/delta 지원 여부 명시
-- CalendarEventDTO로 제공자 중립적인 데이터 교환
+- CalendarEventDTO로 제공자 중립적인 데이터 교환 (페이지당 수천 개가 만들어지므로 __slots__로 가볍게)
 
 """
-from typing import Protocol, Optional, List, Tuple, Dict, Any
-from datetime import datetime
+import hashlib
+import json
+import sys
+from typing import Protocol, Optional, List, Sequence, Tuple, Dict, Any, AsyncIterator
+from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -15,6 +18,8 @@ class SyncCapability(Enum):
     READ = "read"
     WRITE = "write" 
     DELTA = "delta"  # incremental sync support
+    PUSH = "push"  # change notification (webhook) support
+    BATCH = "batch"  # multiple writes per HTTP request
 
 @dataclass
 class ProviderCapabilities:
@@ -22,11 +27,16 @@ class ProviderCapabilities:
     read: bool = False
     write: bool = False
     delta: bool = False  # 증분 동기화 지원 여부
+    push: bool = False  # 변경 알림(웹훅) 채널 지원 여부
+    batch: bool = False  # 여러 쓰기를 한 요청으로 묶는 batch_write 지원 여부
     
     def supports(self, capability: SyncCapability) -> bool:
         return getattr(self, capability.value, False)
 
-@dataclass
+# 대량으로 생성되는 DTO는 인스턴스 __dict__ 없이 slots 사용 (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class CalendarEventDTO:
     """제공자 중립적인 캘린더 이벤트 DTO (모든 시간은 UTC)"""
     external_event_id: str
@@ -38,10 +48,11 @@ class CalendarEventDTO:
     all_day: bool = False
     location: Optional[str] = None
     recurrence_rule: Optional[str] = None  # RRULE format
-    attendees: List[Dict[str, Any]] = field(default_factory=list)
+    attendees: Sequence[Dict[str, Any]] = ()  # 참석자 없는 이벤트는 빈 tuple 공유 (이벤트마다 list 할당 안 함)
     external_updated_at: datetime = field(default_factory=datetime.utcnow)
     external_version: Optional[str] = None  # etag, version string
     deleted: bool = False
+    attendees_known: bool = True  # False면 attendees는 "모름" (저장된 행에서 만든 비교 기준 등, 비어 있어도 참석자 없음이 아님)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -54,12 +65,52 @@ class CalendarEventDTO:
             'all_day': self.all_day,
             'location': self.location,
             'recurrence_rule': self.recurrence_rule,
-            'attendees': self.attendees,
+            'attendees': list(self.attendees),
             'external_updated_at': self.external_updated_at.isoformat(),
             'external_version': self.external_version,
             'deleted': self.deleted
         }
 
+    def content_fingerprint(self) -> str:
+        """내용 변경 감지용 지문 (SHA-256)
+        
+        external_updated_at/external_version/DTSTAMP처럼 내용과 무관하게 바뀌는
+        메타데이터는 제외하고 정규화된 필드만 사용
+        """
+        def normalize_text(value: Optional[str]) -> Optional[str]:
+            if value is None:
+                return None
+            return value.replace('\r\n', '\n').strip() or None
+        
+        def normalize_datetime(value: Optional[datetime]) -> Optional[str]:
+            if value is None:
+                return None
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.astimezone(timezone.utc).isoformat()
+        
+        attendees = sorted(
+            (
+                (attendee.get('email') or '').lower(),
+                attendee.get('name') or '',
+                attendee.get('status') or ''
+            )
+            for attendee in self.attendees
+        )
+        content = [
+            normalize_text(self.title),
+            normalize_text(self.description),
+            normalize_datetime(self.start_utc),
+            normalize_datetime(self.end_utc),
+            self.all_day,
+            normalize_text(self.location),
+            normalize_text(self.recurrence_rule),
+            attendees,
+            self.deleted
+        ]
+        encoded = json.dumps(content, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
 @dataclass 
 class CalendarDTO:
     """외부 캘린더 메타데이터"""
@@ -70,13 +121,68 @@ class CalendarDTO:
     access_role: Optional[str] = None  # owner, reader, writer
     primary: bool = False
 
+@dataclass
+class CacheValidators:
+    """조건부 GET 검증자 (응답의 ETag / Last-Modified 값)"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+@dataclass
+class CalendarListResult:
+    """조건부 캘린더 목록 조회 결과"""
+    calendars: Optional[List[CalendarDTO]]  # None이면 304 Not Modified (캐시된 목록 그대로 유효)
+    validators: CacheValidators = field(default_factory=CacheValidators)
+    
+    @property
+    def not_modified(self) -> bool:
+        return self.calendars is None
+
 @dataclass
 class SyncResult:
-    """동기화 결과"""
+    """동기화 결과 (페이지 단위)"""
     events: List[CalendarEventDTO]
-    next_delta_token: Optional[str] = None
+    next_delta_token: Optional[str] = None  # 마지막 페이지에서만 설정
     max_updated_at: Optional[datetime] = None
-    has_more: bool = False
+    has_more: bool = False  # 다음 페이지 존재 여부
+    next_page_token: Optional[str] = None
+    error: Optional[str] = None
+    bytes_transferred: int = 0  # 응답 본문 수신 바이트 (압축 상태 그대로, 측정하는 제공자만)
+    network_seconds: float = 0.0  # 응답 수신 대기 시간 (측정하는 제공자만)
+    parse_seconds: float = 0.0  # 디코딩/DTO 변환 시간 (프로세스 풀이면 결과 대기 시간)
+
+@dataclass
+class OAuthTokens:
+    """refresh token으로 새로 받은 OAuth 토큰"""
+    access_token: str
+    expires_at: Optional[datetime] = None  # UTC, 제공자가 만료를 알려주지 않으면 None
+    refresh_token: Optional[str] = None  # 제공자가 refresh token을 교체한 경우만
+
+@dataclass
+class WatchChannelDTO:
+    """변경 알림 채널 (Google events.watch 등)"""
+    channel_id: str
+    resource_id: str
+    expires_at: datetime  # UTC
+    token: Optional[str] = None  # 알림 검증용 채널 토큰
+
+@dataclass
+class EventWriteOperation:
+    """일괄 쓰기 단위 작업 (upsert 또는 delete)"""
+    action: str  # upsert, delete
+    calendar_id: str
+    event: Optional[CalendarEventDTO] = None  # upsert 시 필수
+    external_event_id: Optional[str] = None  # delete 시 필수
+    previous: Optional[CalendarEventDTO] = None  # 마지막으로 알려진 상태 (있으면 변경분만 전송)
+
+@dataclass
+class EventWriteResult:
+    """일괄 쓰기 작업별 결과 (operations와 같은 순서)"""
+    success: bool
+    event: Optional[CalendarEventDTO] = None  # upsert 성공 시 제공자가 저장한 이벤트
+    status_code: Optional[int] = None
     error: Optional[str] = None
 
 class ProviderError(Exception):
@@ -97,6 +203,24 @@ class AuthenticationError(ProviderError):
     def __init__(self, provider: str, message: str = "Authentication failed"):
         super().__init__(message, provider, "AUTH_ERROR")
 
+class TransientProviderError(ProviderError):
+    """일시적 오류 (네트워크 오류, 5xx) - 재시도 정책이 다시 시도함"""
+    def __init__(self, provider: str, message: str, status_code: Optional[int] = None):
+        super().__init__(message, provider, "TRANSIENT")
+        self.status_code = status_code
+
+class CircuitOpenError(ProviderError):
+    """circuit breaker가 열려 호출하지 않음 (retry_after초 후 다시 시도)"""
+    def __init__(self, provider: str, endpoint: str, retry_after: int):
+        super().__init__(f"Circuit open for {provider}/{endpoint}", provider, "CIRCUIT_OPEN")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+class ConflictError(ProviderError):
+    """조건부 쓰기 충돌 (If-Match etag 불일치 등, 최신 상태를 다시 받아야 함)"""
+    def __init__(self, provider: str, message: str = "Event was modified remotely"):
+        super().__init__(message, provider, "CONFLICT")
+
 class CalendarProvider(Protocol):
     """캘린더 제공자 인터페이스"""
     
@@ -121,10 +245,11 @@ class CalendarProvider(Protocol):
         since: datetime,
         until: datetime,
         delta_token: Optional[str] = None,
-        updated_min: Optional[datetime] = None
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
     ) -> SyncResult:
         """
-        이벤트 조회 (증분 동기화 지원)
+        이벤트 한 페이지 조회 (증분 동기화 지원)
         
         Args:
             access_token: OAuth 토큰
@@ -133,9 +258,28 @@ class CalendarProvider(Protocol):
             until: 조회 종료 시간 (UTC)
             delta_token: 증분 동기화 토큰 (지원 시)
             updated_min: 최종 업데이트 시간 기준 (증분용)
+            page_token: 이전 페이지의 next_page_token
             
         Returns:
-            SyncResult with events and next sync tokens
+            SyncResult with events, has_more/next_page_token and next sync tokens
+        """
+        ...
+    
+    def iter_event_pages(
+        self,
+        access_token: str,
+        calendar_id: str,
+        since: datetime,
+        until: datetime,
+        delta_token: Optional[str] = None,
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
+    ) -> AsyncIterator[SyncResult]:
+        """
+        이벤트를 페이지 단위로 스트리밍 조회
+        
+        page_token부터 시작하여 마지막 페이지(has_more=False)까지 한 페이지씩 yield.
+        next_delta_token은 마지막 페이지에만 담김
         """
         ...
     
@@ -143,9 +287,15 @@ class CalendarProvider(Protocol):
         self,
         access_token: str,
         calendar_id: str,
-        event: CalendarEventDTO
+        event: CalendarEventDTO,
+        previous: Optional[CalendarEventDTO] = None
     ) -> CalendarEventDTO:
-        """이벤트 생성/수정"""
+        """
+        이벤트 생성/수정
+        
+        previous(마지막으로 알려진 상태)를 주면 지원하는 제공자는 변경된 필드만 조건부로 전송하고,
+        바뀐 내용이 없으면 호출 자체를 생략
+        """
         ...
     
     async def delete_event(
@@ -157,8 +307,100 @@ class CalendarProvider(Protocol):
         """이벤트 삭제"""
         ...
 
+class PushNotificationProvider(Protocol):
+    """변경 알림 채널을 지원하는 제공자 (capabilities.push=True)"""
+    
+    async def watch_events(
+        self,
+        access_token: str,
+        calendar_id: str,
+        channel_id: str,
+        webhook_url: str,
+        token: Optional[str] = None,
+        ttl_seconds: Optional[int] = None
+    ) -> WatchChannelDTO:
+        """캘린더 이벤트 변경 알림 채널 생성"""
+        ...
+    
+    async def stop_channel(
+        self,
+        access_token: str,
+        channel_id: str,
+        resource_id: str
+    ) -> None:
+        """알림 채널 중지"""
+        ...
+
+class ConditionalCalendarListProvider(Protocol):
+    """ETag/Last-Modified로 캘린더 목록을 재검증할 수 있는 제공자 (선택 구현)"""
+    
+    async def list_calendars_conditional(
+        self,
+        access_token: str,
+        validators: Optional[CacheValidators] = None
+    ) -> CalendarListResult:
+        """validators가 최신이면 calendars=None(304), 아니면 새 목록과 검증자 반환"""
+        ...
+
+class TokenRefreshProvider(Protocol):
+    """refresh token으로 access token을 다시 발급할 수 있는 제공자 (선택 구현)"""
+    
+    async def refresh_access_token(self, refresh_token: str) -> OAuthTokens:
+        """새 access token 발급, refresh token이 폐기/만료되었으면 AuthenticationError"""
+        ...
+
+class BatchWriteProvider(Protocol):
+    """여러 쓰기를 한 요청으로 묶는 제공자 (capabilities.batch=True)"""
+    
+    async def batch_write(
+        self,
+        access_token: str,
+        operations: List[EventWriteOperation]
+    ) -> List[EventWriteResult]:
+        """작업 목록을 일괄 실행, 작업별 결과를 같은 순서로 반환"""
+        ...
+
+async def paginate_events(
+    provider: CalendarProvider,
+    access_token: str,
+    calendar_id: str,
+    since: datetime,
+    until: datetime,
+    delta_token: Optional[str] = None,
+    updated_min: Optional[datetime] = None,
+    page_token: Optional[str] = None
+) -> AsyncIterator[SyncResult]:
+    """fetch_events를 next_page_token이 없을 때까지 반복 호출하는 기본 iter_event_pages 구현"""
+    while True:
+        page = await provider.fetch_events(
+            access_token, calendar_id, since, until,
+            delta_token=delta_token,
+            updated_min=updated_min,
+            page_token=page_token
+        )
+        yield page
+        
+        if not page.has_more or not page.next_page_token:
+            return
+        page_token = page.next_page_token
+
+def parse_oauth_tokens(data: Dict[str, Any], now: Optional[datetime] = None) -> OAuthTokens:
+    """OAuth 토큰 엔드포인트 응답(access_token, expires_in, refresh_token)을 OAuthTokens로 변환"""
+    now = now or datetime.now(timezone.utc)
+    expires_in = data.get('expires_in')
+    return OAuthTokens(
+        access_token=data['access_token'],
+        expires_at=now + timedelta(seconds=int(expires_in)) if expires_in else None,
+        refresh_token=data.get('refresh_token') or None
+    )
+
 # Acceptance Criteria:
 # - Protocol 기반으로 다양한 제공자 구현 가능
 # - DTO는 제공자 중립적이며 UTC 시간 사용
-# - 오류 클래스로 타입별 예외 처리 지원
-# - 증분 동기화와 윈도우 동기화 모두 지원
\ No newline at end of file
+# - content_fingerprint로 메타데이터만 바뀐 재전송을 변경 없음으로 판별
+# - 오류 클래스로 타입별 예외 처리 지원 (조건부 쓰기 충돌은 ConflictError, 재시도 대상은 TransientProviderError)
+# - 증분 동기화와 윈도우 동기화 모두 지원
+# - 페이지 단위 스트리밍 조회로 대용량 캘린더도 메모리 사용량 제한
+# - 변경 알림 채널은 push capability를 가진 제공자만 선택적으로 구현
+# - access token 갱신은 refresh token을 지원하는 제공자만 선택적으로 구현
+# - 일괄 쓰기는 batch capability 제공자만 구현, 나머지는 이벤트별 upsert_event/delete_event로 전송
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""Synthetic delta sync for full-snapshot feeds (ICS URL)
+
+설계 의도:
+- ICS 피드는 매번 전체 스냅샷만 주므로 UID → 내용 지문 색인과 비교하여 추가/변경/삭제만 전달
+- 색인은 zlib 압축한 compact 토큰으로 만들어 delta token 자리에 저장 (sync_states.delta_token, 동기화 결과와 같은 트랜잭션으로 커밋)
+- 구독자(sync_state)마다 자기 색인을 가지므로 같은 피드를 여러 사용자가 구독해도 서로 영향 없음
+- 윈도우가 밀려 밖으로 나간 이벤트는 삭제로 보지 않음 (색인의 시작 시각이 현재 윈도우 안인데 사라진 경우만 삭제)
+- 형식이 다르거나 깨진 토큰은 "Invalid sync token"으로 전체 동기화 폴백
+
+"""
+import base64
+import binascii
+import hashlib
+import json
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from .base import CalendarEventDTO
+
+TOKEN_PREFIX = 'ics1:'
+
+# 취소(STATUS:CANCELLED)된 이벤트의 지문 (다시 삭제 전달하지 않음)
+_DELETED_DIGEST = '-'
+
+# UID → (지문, 시작 시각 epoch 초)
+FeedIndex = Dict[str, Tuple[str, int]]
+
+def _event_digest(event: CalendarEventDTO) -> str:
+    """색인용 짧은 지문 (UID별 비교만 하므로 SHA-256 앞 16자로 충분)"""
+    return _DELETED_DIGEST if event.deleted else event.content_fingerprint()[:16]
+
+def build_feed_index(events: List[CalendarEventDTO]) -> FeedIndex:
+    """윈도우 안 이벤트의 UID → (지문, 시작 시각) 색인
+
+    반복 일정의 예외 인스턴스처럼 같은 UID가 여러 번 나오면 지문을 합쳐
+    어느 인스턴스가 바뀌어도 변경으로 감지
+    """
+    index: FeedIndex = {}
+    for event in events:
+        digest = _event_digest(event)
+        start = int(event.start_utc.timestamp())
+        previous = index.get(event.external_event_id)
+        if previous is not None:
+            digest = hashlib.sha256(f"{previous[0]}|{digest}".encode()).hexdigest()[:16]
+            start = min(start, previous[1])
+        index[event.external_event_id] = (digest, start)
+    return index
+
+def encode_feed_index(index: FeedIndex) -> str:
+    """색인을 delta token 문자열로 (정렬 후 압축하여 같은 색인은 같은 토큰)"""
+    entries = sorted([uid, digest, start] for uid, (digest, start) in index.items())
+    payload = json.dumps(entries, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return TOKEN_PREFIX + base64.urlsafe_b64encode(zlib.compress(payload, 9)).decode('ascii')
+
+def decode_feed_index(token: str) -> FeedIndex:
+    """delta token을 색인으로, 형식이 맞지 않으면 ValueError"""
+    if not token.startswith(TOKEN_PREFIX):
+        raise ValueError("Unknown feed index token format")
+    try:
+        payload = zlib.decompress(base64.urlsafe_b64decode(token[len(TOKEN_PREFIX):]))
+        return {uid: (digest, int(start)) for uid, digest, start in json.loads(payload)}
+    except (binascii.Error, zlib.error, TypeError, ValueError) as e:
+        raise ValueError(f"Corrupted feed index token: {e}")
+
+def diff_feed(
+    events: List[CalendarEventDTO],
+    previous: FeedIndex,
+    since: datetime,
+    until: datetime,
+    calendar_id: str
+) -> Tuple[List[CalendarEventDTO], FeedIndex]:
+    """
+    이전 색인 대비 바뀐 이벤트와 새 색인 반환
+
+    추가/내용 변경 이벤트는 그대로, 사라진 이벤트는 deleted=True DTO로 전달
+    """
+    index = build_feed_index(events)
+    changes = [
+        event for event in events
+        if previous.get(event.external_event_id, (None, 0))[0] != index[event.external_event_id][0]
+    ]
+
+    window_start, window_end = since.timestamp(), until.timestamp()
+    for uid, (digest, start) in previous.items():
+        if uid in index or digest == _DELETED_DIGEST or not (window_start <= start < window_end):
+            continue
+        start_utc = datetime.fromtimestamp(start, tz=timezone.utc)
+        changes.append(CalendarEventDTO(
+            external_event_id=uid,
+            calendar_id=calendar_id,
+            title='',
+            start_utc=start_utc,
+            external_updated_at=datetime.now(timezone.utc),
+            deleted=True
+        ))
+    return changes, index
+
+# Acceptance Criteria:
+# - 이전 색인 대비 추가/변경 이벤트만 반환, 피드에서 사라진 이벤트는 deleted=True로 반환
+# - 윈도우 밖으로 밀려난 이벤트는 삭제로 보지 않음
+# - 색인은 압축된 토큰으로 왕복 가능, 깨진 토큰은 ValueError
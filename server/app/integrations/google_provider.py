@@ -2,31 +2,166 @@
 
 설계 의도:
 - Google Calendar API v3 래핑하여 read/write/delta 모든 기능 지원
-- 지수 백오프로 rate limit 및 일시적 오류 처리
+- 요청 전 쿼터 토큰 버킷에서 토큰을 받아 429를 미리 방지
+- 429/일시적 오류 재시도는 ProviderResilience 한 층에서 deadline/budget 안에서만, 장애 시 circuit breaker로 즉시 실패
 - RFC 5545 RRULE과 Google 반복 이벤트 매핑
+- 대량 쓰기는 multipart/mixed batch 엔드포인트로 요청당 최대 50건 묶음
+- 조회는 fields= partial response로 DTO에 필요한 필드만 받고 gzip으로 압축 전송
+- 이벤트 파싱은 페이지당 수천 건이므로 타임스탬프 파싱을 캐시하고 이벤트당 할당을 최소화
+- events.list 응답은 바이트 스트림에서 items를 원소 단위로 디코딩하여 페이지 전체 JSON을 메모리에 두지 않음
+- 큰 페이지 파싱은 설정에 따라 ParseExecutor의 프로세스 풀에서 실행하여 이벤트 루프를 막지 않음
+- 옵션으로 멱등 GET은 지연 백분위를 넘기면 중복 요청(hedging)하여 꼬리 지연 완화
 
 """
 import httpx
 import asyncio
-from typing import List, Optional, Dict, Any
+import dataclasses
+import functools
+import json
+import time
+import uuid
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from datetime import datetime, timezone
-from urllib.parse import urlencode
+from urllib.parse import urlencode, quote
 import logging
 
 from .base import (
     CalendarProvider, ProviderCapabilities, CalendarEventDTO, CalendarDTO,
-    SyncResult, ProviderError, RateLimitError, AuthenticationError, SyncCapability
+    SyncResult, ProviderError, RateLimitError, AuthenticationError, ConflictError, SyncCapability,
+    TransientProviderError, CircuitOpenError,
+    WatchChannelDTO, EventWriteOperation, EventWriteResult, CacheValidators, CalendarListResult,
+    OAuthTokens, paginate_events, parse_oauth_tokens
 )
+from .http_cache import validator_headers, validators_from_response
+from .quota import QuotaLimiter
+from .resilience import ProviderResilience
+from .hedging import RequestHedger
+from .json_stream import JsonArrayStreamDecoder
+from .parse_executor import ParseExecutor
 
 logger = logging.getLogger(__name__)
 
+# batch 하위 요청 중 다시 보낼 상태 코드
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# PATCH 응답은 DTO 갱신에 필요한 메타데이터만 받음 (partial response)
+_PATCH_RESPONSE_FIELDS = 'id,etag,updated'
+
+# _parse_event가 읽는 필드만 요청 (events.list partial response)
+EVENT_LIST_FIELDS = (
+    'nextPageToken,nextSyncToken,'
+    'items(id,etag,status,updated,summary,description,location,start,end,recurrence,'
+    'organizer/email,attendees(email,displayName,responseStatus))'
+)
+
+# list_calendars가 읽는 필드만 요청 (calendarList.list partial response)
+CALENDAR_LIST_FIELDS = 'items(id,summary,timeZone,backgroundColor,accessRole,primary)'
+
+# Google은 User-Agent에 gzip이 있어야 압축 응답을 보냄
+GZIP_HEADERS = {'Accept-Encoding': 'gzip', 'User-Agent': 'Mokkoji/1.0 (gzip)'}
+
+@functools.lru_cache(maxsize=8192)
+def _parse_rfc3339(value: str) -> datetime:
+    """RFC 3339 타임스탬프를 UTC datetime으로 (반복 일정/같은 시각 이벤트가 많아 결과 캐시)"""
+    if value.endswith('Z'):
+        # 대부분의 updated 값: 오프셋 변환 없이 tzinfo만 지정
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_all_day_date(value: str) -> datetime:
+    """종일 이벤트 날짜(YYYY-MM-DD)를 UTC 자정으로 (strptime보다 빠름)"""
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), tzinfo=timezone.utc)
+
+def _build_batch_body(
+    boundary: str,
+    requests: List[Tuple[int, str, str, Optional[Dict[str, Any]], Dict[str, str]]]
+) -> bytes:
+    """(index, method, path, json_body, headers) 목록을 multipart/mixed 본문으로 직렬화"""
+    lines: List[str] = []
+    for index, method, path, body, headers in requests:
+        lines += [
+            f'--{boundary}',
+            'Content-Type: application/http',
+            f'Content-ID: <item-{index}>',
+            '',
+            f'{method} {path} HTTP/1.1'
+        ]
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        if body is not None:
+            lines += ['Content-Type: application/json', '', json.dumps(body, ensure_ascii=False)]
+        else:
+            lines += ['']
+        lines.append('')
+    lines.append(f'--{boundary}--')
+    return '\r\n'.join(lines).encode('utf-8')
+
+def _parse_batch_response(content_type: str, content: bytes) -> Dict[int, Tuple[int, Optional[Dict[str, Any]]]]:
+    """multipart/mixed 응답을 Content-ID의 index → (status, json_body)로 파싱"""
+    boundary = None
+    for param in content_type.split(';'):
+        key, _, value = param.strip().partition('=')
+        if key.lower() == 'boundary':
+            boundary = value.strip('"')
+    if not boundary:
+        raise ValueError(f"Missing boundary in batch response: {content_type}")
+    
+    results: Dict[int, Tuple[int, Optional[Dict[str, Any]]]] = {}
+    text = content.decode('utf-8').replace('\r\n', '\n')
+    for part in text.split(f'--{boundary}'):
+        part = part.strip('\n')
+        if not part or part == '--':
+            continue
+        
+        # 파트 헤더 / 내부 HTTP 응답 (상태줄 + 헤더 / 본문)
+        part_headers, _, http_response = part.partition('\n\n')
+        content_id = next(
+            (line.split(':', 1)[1].strip() for line in part_headers.split('\n')
+             if line.lower().startswith('content-id:')),
+            ''
+        )
+        index = int(content_id.strip('<>').rsplit('-', 1)[-1])
+        
+        response_head, _, response_body = http_response.partition('\n\n')
+        status = int(response_head.split('\n', 1)[0].split(' ')[1])
+        body = json.loads(response_body) if response_body.strip() else None
+        results[index] = (status, body)
+    return results
+
 class GoogleCalendarProvider:
     """Google Calendar API 제공자"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    BASE_URL = "https://www.googleapis.com/calendar/v3"
+    BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+    TOKEN_URL = "https://oauth2.googleapis.com/token"
+    BATCH_PATH_PREFIX = "/calendar/v3"
+    MAX_BATCH_SIZE = 50  # Google Calendar batch 요청당 하위 요청 상한
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        page_size: int = 1000,
+        http_client: Optional[httpx.AsyncClient] = None,
+        batch_url: Optional[str] = None,
+        partial_response: bool = True,
+        rate_limiter: Optional[QuotaLimiter] = None,
+        resilience: Optional[ProviderResilience] = None,
+        hedger: Optional[RequestHedger] = None,
+        parse_executor: Optional[ParseExecutor] = None
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self.page_size = min(page_size, 2500)  # Google events.list maxResults 상한
+        self.batch_url = batch_url or self.BATCH_URL
+        self.partial_response = partial_response  # False면 전체 리소스 조회 (전송량 비교용)
+        self.rate_limiter = rate_limiter  # None이면 쿼터 선제 제한 없음
+        self.resilience = resilience or ProviderResilience(self.name)
+        self.hedger = hedger  # None이면 GET hedging 안 함
+        self.parse_executor = parse_executor or ParseExecutor()  # 기본은 인라인 스트리밍 파싱
+        # 주입된 클라이언트(ProviderRegistry의 공유 풀)는 소유자가 닫음
+        self._http_client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
     
     @property
     def name(self) -> str:
@@ -34,14 +169,14 @@ class GoogleCalendarProvider:
     
     @property 
     def capabilities(self) -> ProviderCapabilities:
-        return ProviderCapabilities(read=True, write=True, delta=True)
+        return ProviderCapabilities(read=True, write=True, delta=True, push=True, batch=True)
     
     async def _get_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
             self._http_client = httpx.AsyncClient(
-                base_url="https://www.googleapis.com/calendar/v3",
+                base_url=self.BASE_URL,
                 timeout=30.0,
-                headers={"User-Agent": "Mokkoji/1.0"}
+                headers=GZIP_HEADERS
             )
         return self._http_client
     
@@ -50,58 +185,73 @@ class GoogleCalendarProvider:
         method: str, 
         url: str, 
         headers: Dict[str, str],
-        max_retries: int = 3,
+        endpoint: str = 'default',
+        quota_cost: int = 1,
+        retry: bool = True,
+        stream: bool = False,
         **kwargs
     ) -> httpx.Response:
-        """지수 백오프로 재시도하는 HTTP 요청"""
+        """
+        재시도 정책과 엔드포인트별 circuit breaker를 적용한 HTTP 요청
+        
+        재시도는 이 한 층에서만 수행 (시도마다 quota_cost만큼 쿼터 토큰 획득).
+        retry=False면 breaker만 적용하고 재시도는 호출자가 담당.
+        hedger가 있으면 GET 시도 하나 안에서 늦은 요청을 중복 전송 (중복 요청도 쿼터 차감).
+        stream=True면 본문을 읽지 않은 응답을 반환 (호출자가 읽고 aclose)
+        """
         client = await self._get_client()
         
-        for attempt in range(max_retries + 1):
-            try:
-                response = await client.request(method, url, headers=headers, **kwargs)
-                
-                if response.status_code == 429:  # Rate limit
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    if attempt < max_retries:
-                        # 지수 백오프 + jitter
-                        wait_time = min(2 ** attempt + retry_after, 300)
-                        await asyncio.sleep(wait_time)
-                        continue
-                    raise RateLimitError(self.name, retry_after)
-                
-                if response.status_code == 401:
-                    raise AuthenticationError(self.name, "Invalid or expired token")
-                
-                if response.status_code >= 500 and attempt < max_retries:
-                    # 서버 오류 시 재시도
-                    import random
-                    jitter = random.uniform(0.1, 0.5)
-                    wait_time = (2 ** attempt) + jitter
-                    await asyncio.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                return response
-                
-            except httpx.RequestError as e:
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
-                    continue
-                raise ProviderError(f"Network error: {e}", self.name)
+        async def send() -> httpx.Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(self.name, quota_cost)
+            if stream:
+                request = client.build_request(method, url, headers=headers, **kwargs)
+                return await client.send(request, stream=True)
+            return await client.request(method, url, headers=headers, **kwargs)
+        
+        attempt = send
+        if method == 'GET' and self.hedger is not None:
+            async def attempt() -> httpx.Response:
+                return await self.hedger.run(endpoint, send)
+        
+        response = await self.resilience.call(endpoint, attempt, retry=retry)
+        
+        if stream and response.is_error:
+            # 오류 응답은 본문을 쓰지 않으므로 연결 반환
+            await response.aclose()
+        
+        if response.status_code == 401:
+            raise AuthenticationError(self.name, "Invalid or expired token")
         
-        raise ProviderError("Max retries exceeded", self.name)
+        if response.status_code == 412:
+            # If-Match etag 불일치: 원격에서 먼저 수정됨
+            raise ConflictError(self.name)
+        
+        if response.status_code == 304:
+            # 조건부 GET: 캐시된 리소스가 최신
+            return response
+        
+        response.raise_for_status()
+        return response
+    
+    def _collect_events(self, items: List[Dict[str, Any]], events: List[CalendarEventDTO]):
+        """디코딩된 events.list 원소를 DTO로 변환하여 추가 (파싱 실패 이벤트는 건너뜀)"""
+        for event_data in items:
+            try:
+                events.append(self._parse_event(event_data))
+            except Exception as e:
+                logger.warning(f"Failed to parse Google event {event_data.get('id')}: {e}")
     
     def _parse_datetime(self, dt_obj: Dict[str, Any]) -> datetime:
         """Google 날짜 객체를 UTC datetime으로 변환"""
-        if 'dateTime' in dt_obj:
+        date_time = dt_obj.get('dateTime')
+        if date_time is not None:
             # RFC 3339 형식
-            dt_str = dt_obj['dateTime']
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00')).astimezone(timezone.utc)
-        elif 'date' in dt_obj:
+            return _parse_rfc3339(date_time)
+        date = dt_obj.get('date')
+        if date is not None:
             # 종일 이벤트
-            date_str = dt_obj['date'] 
-            return datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+            return _parse_all_day_date(date)
         else:
             raise ValueError("Invalid Google datetime object")
     
@@ -128,46 +278,61 @@ class GoogleCalendarProvider:
         return [rrule]
     
     def _parse_event(self, event_data: Dict[str, Any]) -> CalendarEventDTO:
-        """Google event를 CalendarEventDTO로 변환"""
-        start_dt = self._parse_datetime(event_data['start'])
-        end_dt = self._parse_datetime(event_data.get('end', event_data['start']))
-        
-        # 종일 이벤트 판별
-        all_day = 'date' in event_data['start']
+        """Google event를 CalendarEventDTO로 변환 (페이지 파싱 fast path)"""
+        start = event_data['start']
+        start_dt = self._parse_datetime(start)
+        end = event_data.get('end')
+        end_dt = self._parse_datetime(end) if end is not None else start_dt
         
-        # 참석자 파싱
-        attendees = []
-        for attendee in event_data.get('attendees', []):
-            attendees.append({
+        # 참석자가 없는 대부분의 이벤트는 빈 tuple 공유
+        raw_attendees = event_data.get('attendees')
+        attendees = [
+            {
                 'email': attendee.get('email'),
                 'name': attendee.get('displayName'),
                 'status': attendee.get('responseStatus', 'needsAction')
-            })
+            }
+            for attendee in raw_attendees
+        ] if raw_attendees else ()
+        
+        recurrence = event_data.get('recurrence')
+        organizer = event_data.get('organizer')
         
         return CalendarEventDTO(
             external_event_id=event_data['id'],
-            calendar_id=event_data.get('organizer', {}).get('email', ''),
+            calendar_id=organizer.get('email', '') if organizer else '',
             title=event_data.get('summary', 'No Title'),
             description=event_data.get('description'),
             start_utc=start_dt,
             end_utc=end_dt,
-            all_day=all_day,
+            all_day='date' in start,
             location=event_data.get('location'),
-            recurrence_rule=self._parse_recurrence(event_data.get('recurrence', [])),
+            recurrence_rule=self._parse_recurrence(recurrence) if recurrence else None,
             attendees=attendees,
-            external_updated_at=datetime.fromisoformat(
-                event_data['updated'].replace('Z', '+00:00')
-            ).astimezone(timezone.utc),
+            external_updated_at=_parse_rfc3339(event_data['updated']),
             external_version=event_data.get('etag'),
             deleted=event_data.get('status') == 'cancelled'
         )
     
     async def list_calendars(self, access_token: str) -> List[CalendarDTO]:
         """사용자 캘린더 목록 조회"""
-        headers = {'Authorization': f'Bearer {access_token}'}
+        return (await self.list_calendars_conditional(access_token)).calendars
+    
+    async def list_calendars_conditional(
+        self,
+        access_token: str,
+        validators: Optional[CacheValidators] = None
+    ) -> CalendarListResult:
+        """If-None-Match로 캘린더 목록 재검증 (바뀌지 않았으면 304, calendars=None)"""
+        headers = {'Authorization': f'Bearer {access_token}', **GZIP_HEADERS, **validator_headers(validators)}
+        params = {'fields': CALENDAR_LIST_FIELDS} if self.partial_response else {}
         
         try:
-            response = await self._request_with_retry('GET', '/users/me/calendarList', headers)
+            response = await self._request_with_retry(
+                'GET', '/users/me/calendarList', headers, endpoint='calendarList.list', params=params
+            )
+            if response.status_code == 304:
+                return CalendarListResult(calendars=None, validators=validators)
             data = response.json()
             
             calendars = []
@@ -181,8 +346,10 @@ class GoogleCalendarProvider:
                     primary=cal_item.get('primary', False)
                 ))
             
-            return calendars
+            return CalendarListResult(calendars=calendars, validators=validators_from_response(response))
             
+        except AuthenticationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to list Google calendars: {e}")
             raise ProviderError(f"Failed to list calendars: {e}", self.name)
@@ -194,17 +361,24 @@ class GoogleCalendarProvider:
         since: datetime,
         until: datetime,
         delta_token: Optional[str] = None,
-        updated_min: Optional[datetime] = None
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
     ) -> SyncResult:
-        """이벤트 조회 (증분 동기화 지원)"""
-        headers = {'Authorization': f'Bearer {access_token}'}
+        """이벤트 한 페이지 조회 (증분 동기화 지원)"""
+        headers = {'Authorization': f'Bearer {access_token}', **GZIP_HEADERS}
         
         # 쿼리 파라미터 구성
         params = {
-            'maxResults': 2500,
+            'maxResults': self.page_size,
             'singleEvents': 'true',
             'orderBy': 'updated'
         }
+        if self.partial_response:
+            params['fields'] = EVENT_LIST_FIELDS
+        
+        if page_token:
+            # 다음 페이지 (나머지 파라미터는 첫 요청과 동일해야 함)
+            params['pageToken'] = page_token
         
         if delta_token:
             # 증분 동기화
@@ -218,20 +392,26 @@ class GoogleCalendarProvider:
         
         try:
             url = f'/calendars/{calendar_id}/events?' + urlencode(params)
-            response = await self._request_with_retry('GET', url, headers)
-            data = response.json()
+            requested = time.perf_counter()
+            response = await self._request_with_retry(
+                'GET', url, headers, endpoint='events.list', stream=True
+            )
+            headers_seconds = time.perf_counter() - requested
             
-            events = []
-            for event_data in data.get('items', []):
-                try:
-                    event = self._parse_event(event_data)
-                    events.append(event)
-                except Exception as e:
-                    logger.warning(f"Failed to parse Google event {event_data.get('id')}: {e}")
-                    continue
+            # 응답 전체/디코딩 트리를 들지 않고 items 원소가 완성될 때마다 DTO로 변환
+            # (설정에 따라 큰 페이지는 원본 바이트를 프로세스 풀에서 파싱)
+            try:
+                outcome = await self.parse_executor.parse_stream(response.aiter_bytes(), EventsPageParser(self))
+            except httpx.RequestError as e:
+                # 본문 수신 중 끊김은 페이지를 다시 요청하면 되는 일시적 오류
+                raise TransientProviderError(self.name, f"Network error while reading events: {e}")
+            finally:
+                await response.aclose()
+            events, fields = outcome.value
             
-            # 다음 동기화 토큰
-            next_sync_token = data.get('nextSyncToken')
+            # 다음 동기화 토큰 (마지막 페이지에만 존재)
+            next_sync_token = fields.get('nextSyncToken')
+            next_page_token = fields.get('nextPageToken')
             
             # 최신 업데이트 시간
             max_updated = None
@@ -242,9 +422,16 @@ class GoogleCalendarProvider:
                 events=events,
                 next_delta_token=next_sync_token,
                 max_updated_at=max_updated,
-                has_more=False  # Google은 모든 이벤트를 한 번에 반환
+                has_more=next_page_token is not None,
+                next_page_token=next_page_token,
+                bytes_transferred=response.num_bytes_downloaded,
+                network_seconds=headers_seconds + outcome.network_seconds,
+                parse_seconds=outcome.parse_seconds
             )
             
+        except (RateLimitError, TransientProviderError, CircuitOpenError, AuthenticationError):
+            # 재시도 정책이 포기한 일시적 오류와 토큰 만료(401)는 타입을 유지하여 호출자가 처리
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch Google events: {e}")
             if "Invalid sync token" in str(e):
@@ -252,19 +439,157 @@ class GoogleCalendarProvider:
                 return await self.fetch_events(access_token, calendar_id, since, until)
             raise ProviderError(f"Failed to fetch events: {e}", self.name)
     
+    async def iter_event_pages(
+        self,
+        access_token: str,
+        calendar_id: str,
+        since: datetime,
+        until: datetime,
+        delta_token: Optional[str] = None,
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
+    ) -> AsyncIterator[SyncResult]:
+        """nextPageToken을 따라 페이지 단위로 이벤트 조회"""
+        async for page in paginate_events(
+            self, access_token, calendar_id, since, until,
+            delta_token=delta_token, updated_min=updated_min, page_token=page_token
+        ):
+            yield page
+    
     async def upsert_event(
         self, 
         access_token: str,
         calendar_id: str,
-        event: CalendarEventDTO
+        event: CalendarEventDTO,
+        previous: Optional[CalendarEventDTO] = None
     ) -> CalendarEventDTO:
-        """이벤트 생성/수정"""
+        """이벤트 생성/수정
+        
+        수정 시 previous가 있으면 바뀐 필드만 If-Match 조건부 PATCH로 보내고,
+        바뀐 필드가 없으면 요청하지 않음 (previous.attendees_known이 False면 참석자를 모르는
+        기준이므로 참석자는 비교하지 않고 항상 전송)
+        """
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
         }
         
-        # Google event 객체 구성
+        if event.external_event_id and previous is not None:
+            return await self._patch_event(access_token, calendar_id, event, previous)
+        
+        event_body = self._event_body(event)
+        
+        try:
+            if event.external_event_id:
+                # 기존 이벤트 수정
+                url = f'/calendars/{calendar_id}/events/{event.external_event_id}'
+                response = await self._request_with_retry('PUT', url, headers, endpoint='events.write', json=event_body)
+            else:
+                # 새 이벤트 생성
+                url = f'/calendars/{calendar_id}/events'
+                response = await self._request_with_retry('POST', url, headers, endpoint='events.write', json=event_body)
+            
+            created_event = response.json()
+            return self._parse_event(created_event)
+            
+        except Exception as e:
+            logger.error(f"Failed to upsert Google event: {e}")
+            raise ProviderError(f"Failed to upsert event: {e}", self.name)
+    
+    async def _patch_event(
+        self,
+        access_token: str,
+        calendar_id: str,
+        event: CalendarEventDTO,
+        previous: CalendarEventDTO
+    ) -> CalendarEventDTO:
+        """변경된 필드만 PATCH (etag가 있으면 If-Match로 원격 수정과의 충돌 감지)"""
+        patch_body = self._event_patch(event, previous)
+        if not patch_body:
+            return self._unchanged_event(event, previous)
+        
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json'
+        }
+        etag = previous.external_version or event.external_version
+        if etag:
+            headers['If-Match'] = etag
+        
+        try:
+            url = f'/calendars/{calendar_id}/events/{event.external_event_id}'
+            response = await self._request_with_retry(
+                'PATCH', url, headers, endpoint='events.write', json=patch_body, params={'fields': _PATCH_RESPONSE_FIELDS}
+            )
+            return self._merge_write_response(event, response.json())
+            
+        except ConflictError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to patch Google event {event.external_event_id}: {e}")
+            raise ProviderError(f"Failed to patch event: {e}", self.name)
+    
+    def _event_patch(self, event: CalendarEventDTO, previous: CalendarEventDTO) -> Dict[str, Any]:
+        """previous 대비 바뀐 필드만 담은 Google PATCH 본문 (변경 없으면 빈 dict)"""
+        def same_time(a: Optional[datetime], b: Optional[datetime]) -> bool:
+            if a is None or b is None:
+                return a is b
+            if a.tzinfo is None:
+                a = a.replace(tzinfo=timezone.utc)
+            if b.tzinfo is None:
+                b = b.replace(tzinfo=timezone.utc)
+            return a == b
+        
+        def attendee_set(attendees: List[Dict[str, Any]]):
+            return sorted(
+                ((att.get('email') or '').lower(), att.get('name') or '', att.get('status') or '')
+                for att in attendees if att.get('email')
+            )
+        
+        full_body = self._event_body(event)
+        patch: Dict[str, Any] = {}
+        
+        for field_name, key in (('title', 'summary'), ('description', 'description'), ('location', 'location')):
+            if (getattr(event, field_name) or None) != (getattr(previous, field_name) or None):
+                patch[key] = full_body[key]
+        
+        # 시작/종료/종일 여부는 함께 보내야 Google이 일관되게 검증
+        if (event.all_day != previous.all_day
+                or not same_time(event.start_utc, previous.start_utc)
+                or not same_time(event.end_utc or event.start_utc, previous.end_utc or previous.start_utc)):
+            patch['start'] = full_body['start']
+            patch['end'] = full_body['end']
+        
+        if (event.recurrence_rule or None) != (previous.recurrence_rule or None):
+            patch['recurrence'] = self._format_recurrence(event.recurrence_rule)
+        
+        # 기준의 참석자를 모르면 항상 보내고, 참석자가 없으면 []로 보내 원격 참석자 제거
+        if not previous.attendees_known or attendee_set(event.attendees) != attendee_set(previous.attendees):
+            patch['attendees'] = full_body.get('attendees', [])
+        
+        return patch
+    
+    def _unchanged_event(self, event: CalendarEventDTO, previous: CalendarEventDTO) -> CalendarEventDTO:
+        """요청을 생략한 수정의 결과 (원격 상태는 previous 그대로)"""
+        return dataclasses.replace(
+            event,
+            external_version=previous.external_version,
+            external_updated_at=previous.external_updated_at
+        )
+    
+    def _merge_write_response(self, event: CalendarEventDTO, data: Dict[str, Any]) -> CalendarEventDTO:
+        """partial response(id/etag/updated)를 보낸 DTO에 반영"""
+        return dataclasses.replace(
+            event,
+            external_event_id=data['id'],
+            external_version=data.get('etag'),
+            external_updated_at=datetime.fromisoformat(
+                data['updated'].replace('Z', '+00:00')
+            ).astimezone(timezone.utc)
+        )
+    
+    def _event_body(self, event: CalendarEventDTO) -> Dict[str, Any]:
+        """CalendarEventDTO를 Google event 객체로 변환"""
         event_body = {
             'summary': event.title,
             'description': event.description,
@@ -286,22 +611,7 @@ class GoogleCalendarProvider:
                 for att in event.attendees if att.get('email')
             ]
         
-        try:
-            if event.external_event_id:
-                # 기존 이벤트 수정
-                url = f'/calendars/{calendar_id}/events/{event.external_event_id}'
-                response = await self._request_with_retry('PUT', url, headers, json=event_body)
-            else:
-                # 새 이벤트 생성
-                url = f'/calendars/{calendar_id}/events'
-                response = await self._request_with_retry('POST', url, headers, json=event_body)
-            
-            created_event = response.json()
-            return self._parse_event(created_event)
-            
-        except Exception as e:
-            logger.error(f"Failed to upsert Google event: {e}")
-            raise ProviderError(f"Failed to upsert event: {e}", self.name)
+        return event_body
     
     async def delete_event(
         self,
@@ -314,20 +624,295 @@ class GoogleCalendarProvider:
         
         try:
             url = f'/calendars/{calendar_id}/events/{external_event_id}'
-            await self._request_with_retry('DELETE', url, headers)
+            await self._request_with_retry('DELETE', url, headers, endpoint='events.write')
             
         except Exception as e:
             logger.error(f"Failed to delete Google event {external_event_id}: {e}")
             raise ProviderError(f"Failed to delete event: {e}", self.name)
     
+    def _batch_request(
+        self,
+        operation: EventWriteOperation
+    ) -> Optional[Tuple[str, str, Optional[Dict[str, Any]], Dict[str, str]]]:
+        """작업을 batch 하위 요청 (method, path, body, headers)로 변환 (보낼 변경이 없으면 None)"""
+        calendar_path = f'{self.BATCH_PATH_PREFIX}/calendars/{quote(operation.calendar_id, safe="")}/events'
+        if operation.action == 'delete':
+            if not operation.external_event_id:
+                raise ValueError("external_event_id required for delete")
+            return 'DELETE', f'{calendar_path}/{quote(operation.external_event_id, safe="")}', None, {}
+        
+        event = operation.event
+        if event is None:
+            raise ValueError("event required for upsert")
+        if not event.external_event_id:
+            return 'POST', calendar_path, self._event_body(event), {}
+        
+        event_path = f'{calendar_path}/{quote(event.external_event_id, safe="")}'
+        if operation.previous is None:
+            return 'PUT', event_path, self._event_body(event), {}
+        
+        patch_body = self._event_patch(event, operation.previous)
+        if not patch_body:
+            return None
+        etag = operation.previous.external_version or event.external_version
+        headers = {'If-Match': etag} if etag else {}
+        return 'PATCH', f'{event_path}?fields={_PATCH_RESPONSE_FIELDS}', patch_body, headers
+    
+    async def batch_write(
+        self,
+        access_token: str,
+        operations: List[EventWriteOperation],
+        batch_concurrency: int = 4
+    ) -> List[EventWriteResult]:
+        """
+        upsert/delete 작업을 batch 엔드포인트로 일괄 실행
+        
+        요청당 최대 50건씩 묶어 batch_concurrency개까지 동시에 보내고,
+        429/5xx로 실패한 하위 요청만 재시도 정책(시도 횟수/deadline/budget) 안에서 다시 묶어 재시도.
+        한 호출 안의 작업은 서로 다른 이벤트여야 함 (batch 하위 요청은 실행 순서 보장 없음).
+        결과는 operations와 같은 순서
+        """
+        results: List[Optional[EventWriteResult]] = [None] * len(operations)
+        pending: List[int] = []
+        requests: Dict[int, Tuple[str, str, Optional[Dict[str, Any]], Dict[str, str]]] = {}
+        
+        for index, operation in enumerate(operations):
+            try:
+                request = self._batch_request(operation)
+            except ValueError as e:
+                results[index] = EventWriteResult(success=False, error=str(e))
+                continue
+            
+            if request is None:
+                # 바뀐 필드가 없는 수정은 보내지 않음
+                results[index] = EventWriteResult(
+                    success=True, event=self._unchanged_event(operation.event, operation.previous)
+                )
+                continue
+            requests[index] = request
+            pending.append(index)
+        
+        semaphore = asyncio.Semaphore(max(1, batch_concurrency))
+        
+        async def send_chunk(chunk: List[int]) -> List[int]:
+            """50건 묶음 하나 전송, 재시도할 인덱스 반환"""
+            async with semaphore:
+                try:
+                    responses = await self._send_batch(access_token, [(i, *requests[i]) for i in chunk])
+                except AuthenticationError:
+                    raise
+                except (TransientProviderError, RateLimitError):
+                    # batch 요청 자체의 일시적 실패/circuit open은 묶음 전체를 재시도 대상으로
+                    responses = {}
+                except ProviderError as e:
+                    for index in chunk:
+                        results[index] = EventWriteResult(success=False, error=str(e))
+                    return []
+            
+            retry = []
+            for index in chunk:
+                status, body = responses.get(index, (503, None))  # 응답 누락은 재시도 대상
+                results[index] = self._batch_item_result(operations[index], requests[index][0], status, body)
+                if status in _RETRYABLE_STATUS:
+                    retry.append(index)
+            return retry
+        
+        state = self.resilience.policy.start(self.resilience.budget)
+        while True:
+            state.record_attempt()
+            chunk_retries = await asyncio.gather(*[
+                send_chunk(pending[start:start + self.MAX_BATCH_SIZE])
+                for start in range(0, len(pending), self.MAX_BATCH_SIZE)
+            ])
+            retry = sorted(index for indexes in chunk_retries for index in indexes)
+            
+            # 실패한 하위 요청만 백오프 후 재전송 (횟수/deadline/budget을 넘으면 마지막 결과 유지)
+            if not retry or not await state.backoff():
+                break
+            pending = retry
+        
+        return results
+    
+    async def _send_batch(
+        self,
+        access_token: str,
+        requests: List[Tuple[int, str, str, Optional[Dict[str, Any]], Dict[str, str]]]
+    ) -> Dict[int, Tuple[int, Optional[Dict[str, Any]]]]:
+        """batch 요청 한 번 전송 후 하위 응답 파싱 (쿼터는 하위 요청 수만큼 차감)"""
+        boundary = f'batch_{uuid.uuid4().hex}'
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': f'multipart/mixed; boundary={boundary}'
+        }
+        
+        try:
+            response = await self._request_with_retry(
+                'POST', self.batch_url, headers, endpoint='batch', quota_cost=len(requests), retry=False,
+                content=_build_batch_body(boundary, requests)
+            )
+        except httpx.HTTPStatusError as e:
+            raise ProviderError(f"Batch request failed: {e}", self.name)
+        
+        try:
+            return _parse_batch_response(response.headers.get('Content-Type', ''), response.content)
+        except (ValueError, IndexError, KeyError) as e:
+            raise ProviderError(f"Invalid batch response: {e}", self.name)
+    
+    def _batch_item_result(
+        self,
+        operation: EventWriteOperation,
+        method: str,
+        status: int,
+        body: Optional[Dict[str, Any]]
+    ) -> EventWriteResult:
+        """하위 응답을 작업 결과로 변환"""
+        if operation.action == 'delete' and status in (200, 204, 404, 410):
+            # 이미 삭제된 이벤트(404/410)도 삭제 성공으로 간주
+            return EventWriteResult(success=True, status_code=status)
+        
+        if 200 <= status < 300:
+            try:
+                if method == 'PATCH':
+                    event = self._merge_write_response(operation.event, body)
+                else:
+                    event = self._parse_event(body)
+                return EventWriteResult(success=True, event=event, status_code=status)
+            except (KeyError, TypeError, ValueError) as e:
+                return EventWriteResult(success=False, status_code=status, error=f"Invalid event in response: {e}")
+        
+        message = (body or {}).get('error', {}).get('message', f"HTTP {status}")
+        return EventWriteResult(success=False, status_code=status, error=message)
+    
+    async def watch_events(
+        self,
+        access_token: str,
+        calendar_id: str,
+        channel_id: str,
+        webhook_url: str,
+        token: Optional[str] = None,
+        ttl_seconds: Optional[int] = None
+    ) -> WatchChannelDTO:
+        """events.watch로 변경 알림 채널 생성 (HTTPS 웹훅 주소 필요)"""
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json'
+        }
+        
+        channel_body = {
+            'id': channel_id,
+            'type': 'web_hook',
+            'address': webhook_url
+        }
+        if token:
+            channel_body['token'] = token
+        if ttl_seconds:
+            channel_body['params'] = {'ttl': str(ttl_seconds)}
+        
+        try:
+            url = f'/calendars/{calendar_id}/events/watch'
+            response = await self._request_with_retry('POST', url, headers, endpoint='channels', json=channel_body)
+            data = response.json()
+            
+            # expiration은 epoch milliseconds 문자열
+            return WatchChannelDTO(
+                channel_id=data['id'],
+                resource_id=data['resourceId'],
+                expires_at=datetime.fromtimestamp(int(data['expiration']) / 1000, tz=timezone.utc),
+                token=token
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to watch Google calendar {calendar_id}: {e}")
+            raise ProviderError(f"Failed to create watch channel: {e}", self.name)
+    
+    async def stop_channel(
+        self,
+        access_token: str,
+        channel_id: str,
+        resource_id: str
+    ) -> None:
+        """channels.stop으로 알림 채널 중지"""
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json'
+        }
+        
+        try:
+            await self._request_with_retry(
+                'POST', '/channels/stop', headers, endpoint='channels',
+                json={'id': channel_id, 'resourceId': resource_id}
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to stop Google channel {channel_id}: {e}")
+            raise ProviderError(f"Failed to stop watch channel: {e}", self.name)
+    
+    async def refresh_access_token(self, refresh_token: str) -> OAuthTokens:
+        """refresh token으로 새 access token 발급 (invalid_grant면 AuthenticationError)"""
+        client = await self._get_client()
+        data = {
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret
+        }
+        
+        async def send() -> httpx.Response:
+            return await client.post(self.TOKEN_URL, data=data)
+        
+        response = await self.resilience.call('oauth.token', send)
+        if response.status_code in (400, 401):
+            # invalid_grant: 사용자가 권한을 회수했거나 refresh token이 만료됨 (재연결 필요)
+            raise AuthenticationError(self.name, f"Token refresh rejected: {response.text[:200]}")
+        response.raise_for_status()
+        return parse_oauth_tokens(response.json())
+    
     async def close(self):
-        """리소스 정리"""
-        if self._http_client:
+        """리소스 정리 (직접 만든 클라이언트만 닫음)"""
+        if self._http_client and self._owns_client:
             await self._http_client.aclose()
 
+class EventsPageParser:
+    """events.list 응답 바이트 → (이벤트 DTO 목록, nextPageToken 등 최상위 필드) (ParseExecutor용 StreamParser)
+
+    프로세스 풀로 보낼 때는 제공자 참조를 빼고 작업자 프로세스의 기본 제공자로 _parse_event 실행
+    """
+    
+    def __init__(self, provider: Optional[GoogleCalendarProvider] = None):
+        self.provider = provider
+        self.decoder = JsonArrayStreamDecoder('items')
+        self.events: List[CalendarEventDTO] = []
+    
+    def __getstate__(self):
+        return {**self.__dict__, 'provider': None}
+    
+    def feed(self, chunk: bytes) -> None:
+        self._converter()._collect_events(self.decoder.feed(chunk), self.events)
+    
+    def close(self) -> Tuple[List[CalendarEventDTO], Dict[str, Any]]:
+        self._converter()._collect_events(self.decoder.close(), self.events)
+        return self.events, self.decoder.fields
+    
+    def _converter(self) -> GoogleCalendarProvider:
+        return self.provider or _worker_provider()
+
+@functools.lru_cache(maxsize=1)
+def _worker_provider() -> GoogleCalendarProvider:
+    """프로세스 풀 작업자의 이벤트 파싱용 제공자 (_parse_event는 자격 증명/연결을 쓰지 않음)"""
+    return GoogleCalendarProvider('', '')
+
 # Acceptance Criteria:
 # - Google Calendar API v3의 모든 CRUD 작업 지원
 # - 증분 동기화 (syncToken) 및 윈도우 동기화 지원  
-# - Rate limit 및 일시적 오류에 대한 지수 백오프 재시도
+# - nextPageToken 페이지네이션으로 대용량 캘린더도 누락 없이 조회
+# - events.watch/channels.stop으로 변경 알림 채널 생성 및 중지
+# - batch 엔드포인트로 최대 50건씩 일괄 쓰기, 실패한 하위 요청만 재시도
+# - 조회는 fields= partial response + gzip, 페이지별 전송 바이트 기록
+# - 캘린더 목록은 ETag로 조건부 재검증 (304면 본문 없이 캐시 유지)
+# - previous가 있는 수정은 바뀐 필드만 If-Match 조건부 PATCH, 변경 없으면 요청 생략
+# - 요청 전 제공자/사용자 쿼터 토큰 획득, Rate limit 및 일시적 오류는 deadline/budget 안에서만 재시도
+# - 엔드포인트별 circuit breaker가 열리면 HTTP 호출 없이 CircuitOpenError
+# - hedging 사용 시 GET만 중복 요청, 쓰기 요청은 한 번만 전송
+# - refresh token으로 access token 재발급 (폐기된 refresh token은 AuthenticationError)
 # - RRULE과 Google 반복 이벤트 간 양방향 변환
 # - UTC 시간 기준으로 모든 datetime 처리
\ No newline at end of file
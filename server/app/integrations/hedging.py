@@ -0,0 +1,143 @@
+"""Hedged requests for idempotent provider GETs
+
+설계 의도:
+- 가끔 수십 초씩 멈추는 GET이 동기화 p99를 좌우하므로, 응답이 늦으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+- 중복 요청 시점은 엔드포인트별 최근 지연 분포의 백분위로 적응적으로 결정 (표본이 적으면 hedging하지 않음)
+- 추가 요청은 최근 요청 수 대비 비율로 제한하여 장애 시 부하를 키우지 않음
+- hedging 발생/승리 횟수를 엔드포인트별로 집계하여 효과 확인
+
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from .resilience import RetryBudget
+from ..core.config import HedgeSettings
+
+logger = logging.getLogger(__name__)
+
+class LatencyTracker:
+    """엔드포인트 하나의 최근 응답 지연 표본"""
+
+    def __init__(self, max_samples: int = 256):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def record(self, latency: float):
+        self._samples.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> float:
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(percentile * (len(ordered) - 1)))]
+
+class RequestHedger:
+    """지연 백분위를 넘긴 GET에 중복 요청 하나를 보내고 먼저 끝난 응답 사용"""
+
+    def __init__(self, settings: HedgeSettings, budget: Optional[RetryBudget] = None):
+        self.settings = settings
+        # 중복 요청 상한 (최근 1분 요청 수 대비 비율)
+        self.budget = budget or RetryBudget(ratio=settings.max_extra_ratio, min_retries=0, window=60.0)
+        self._latency: Dict[str, LatencyTracker] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _tracker(self, endpoint: str) -> LatencyTracker:
+        if endpoint not in self._latency:
+            self._latency[endpoint] = LatencyTracker()
+            self._stats[endpoint] = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'budget_denied': 0}
+        return self._latency[endpoint]
+
+    def threshold(self, endpoint: str) -> Optional[float]:
+        """중복 요청을 보낼 대기 시간, 표본이 부족하면 None"""
+        tracker = self._tracker(endpoint)
+        if len(tracker) < self.settings.min_samples:
+            return None
+        delay = tracker.percentile(self.settings.percentile)
+        return min(self.settings.max_delay, max(self.settings.min_delay, delay))
+
+    async def run(self, endpoint: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        send 실행, threshold 안에 응답이 없고 budget이 남으면 같은 요청을 한 번 더 보냄
+
+        먼저 성공한 응답을 반환하고 나머지 요청은 취소. 둘 다 실패하면 먼저 난 예외 전달
+        """
+        tracker = self._tracker(endpoint)
+        stats = self._stats[endpoint]
+        stats['requests'] += 1
+        self.budget.record_request()
+        delay = self.threshold(endpoint)
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(send())
+        if delay is None:
+            response = await primary
+            tracker.record(time.monotonic() - started)
+            return response
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            response = primary.result()
+            tracker.record(time.monotonic() - started)
+            return response
+
+        if not self.budget.try_withdraw():
+            stats['budget_denied'] += 1
+            response = await primary
+            tracker.record(time.monotonic() - started)
+            return response
+
+        stats['hedged'] += 1
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(send())
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                for task in done:
+                    if task.exception() is not None:
+                        first_error = first_error or task.exception()
+                if not succeeded:
+                    continue
+                winner = succeeded[0]
+                for task in succeeded[1:]:
+                    # 동시에 끝난 나머지 응답은 (스트리밍이면 읽지 않은 채로) 닫음
+                    await task.result().aclose()
+                if winner is hedge:
+                    stats['hedge_wins'] += 1
+                    tracker.record(time.monotonic() - hedge_started)
+                else:
+                    tracker.record(time.monotonic() - started)
+                return winner.result()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                for result in await asyncio.gather(*pending, return_exceptions=True):
+                    # 취소 전에 이미 끝난 요청의 응답도 (스트리밍이면 읽지 않은 채로) 닫아 연결 반환
+                    if isinstance(result, httpx.Response):
+                        await result.aclose()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 hedging 횟수와 현재 임계값"""
+        snapshot = {}
+        for endpoint, stats in self._stats.items():
+            threshold = self.threshold(endpoint)
+            snapshot[endpoint] = {
+                **stats,
+                'threshold_ms': round(threshold * 1000) if threshold is not None else None
+            }
+        return snapshot
+
+# Acceptance Criteria:
+# - 최근 지연 백분위 안에 응답이 없으면 같은 GET을 한 번 더 보내고 먼저 끝난 응답 사용
+# - 진 요청은 취소, 두 요청이 모두 실패할 때만 오류 전달
+# - 중복 요청은 최근 요청 수 대비 max_extra_ratio 이하
+# - 엔드포인트별 요청/hedging/hedge 승리 횟수 조회 가능
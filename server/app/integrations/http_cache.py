@@ -0,0 +1,70 @@
+"""Conditional GET helpers for provider HTTP resources
+
+설계 의도:
+- 캘린더 목록, ICS 피드처럼 자주 바뀌지 않는 리소스는 ETag/Last-Modified로 재검증
+- 304 응답은 본문이 없으므로 변경 없는 리소스를 다시 내려받지 않음
+- 검증자와 가공된 값을 함께 보관하여 304일 때 파싱도 생략
+
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .base import CacheValidators
+
+logger = logging.getLogger(__name__)
+
+def validator_headers(validators: Optional[CacheValidators]) -> Dict[str, str]:
+    """저장된 검증자를 조건부 요청 헤더로 변환"""
+    headers: Dict[str, str] = {}
+    if validators is None:
+        return headers
+    if validators.etag:
+        headers['If-None-Match'] = validators.etag
+    if validators.last_modified:
+        headers['If-Modified-Since'] = validators.last_modified
+    return headers
+
+def validators_from_response(response: httpx.Response) -> CacheValidators:
+    """응답의 ETag/Last-Modified 헤더 추출"""
+    return CacheValidators(
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified')
+    )
+
+@dataclass
+class CachedResource:
+    """검증자와 가공된 값 (304일 때 그대로 재사용)"""
+    validators: CacheValidators
+    value: Any
+
+class ConditionalCache:
+    """프로세스 내 LRU 검증자 캐시 (리소스 키 → CachedResource)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CachedResource]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResource]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, validators: CacheValidators, value: Any):
+        """검증자가 있는 응답만 보관 (없으면 재검증할 수 없으므로 기존 항목 제거)"""
+        if not validators:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CachedResource(validators, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+# Acceptance Criteria:
+# - 저장된 ETag/Last-Modified로 If-None-Match/If-Modified-Since 조건부 요청
+# - 304는 오류가 아니라 변경 없음으로 처리하여 호출자가 캐시 값을 재사용
+# - 검증자가 없는 리소스는 캐시하지 않음
@@ -0,0 +1,212 @@
+"""Streaming RFC 5545 (iCalendar) parser for ICS feeds
+
+설계 의도:
+- 수십 MB짜리 다년치 공유 ICS 피드를 문자열 전체/줄 목록으로 들지 않고 한 줄씩 파싱
+- RFC 5545 줄 접기(공백/탭으로 시작하는 다음 줄) 해제, 따옴표 파라미터(TZID, VALUE=DATE, CN 등) 처리
+- ATTENDEE처럼 반복되는 속성은 모두 보관 (이전 파서는 마지막 값만 남김)
+- 동기화 윈도우 밖 DTSTART를 가진 VEVENT는 나머지 줄을 건너뛰어 이벤트를 만들지 않음
+- VEVENT 안의 하위 컴포넌트(VALARM 등) 속성은 이벤트 속성으로 섞지 않음
+
+"""
+import codecs
+import functools
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# name *(";" param) ":" value (파라미터 값은 따옴표 안에 ;/:가 올 수 있음)
+_CONTENT_LINE = re.compile(r'([A-Za-z0-9-]+)((?:;[A-Za-z0-9-]+=(?:"[^"]*"|[^";:])*)*):(.*)', re.DOTALL)
+_PARAM = re.compile(r';([A-Za-z0-9-]+)=((?:"[^"]*"|[^";:])*)')
+_TEXT_ESCAPE = re.compile(r'\\([\\;,nN])')
+
+@dataclass
+class IcsProperty:
+    """content line 하나 (이름/파라미터 이름은 대문자로 정규화)"""
+    name: str
+    params: Dict[str, str]
+    value: str
+
+@dataclass
+class IcsEvent:
+    """윈도우 안에 시작하는 VEVENT 하나의 속성 (이름별로 등장 순서대로 보관)"""
+    start: datetime
+    all_day: bool
+    properties: Dict[str, List[IcsProperty]] = field(default_factory=dict)
+
+    def first(self, name: str) -> Optional[IcsProperty]:
+        values = self.properties.get(name)
+        return values[0] if values else None
+
+    def value(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        prop = self.first(name)
+        return prop.value if prop is not None else default
+
+    def all(self, name: str) -> List[IcsProperty]:
+        return self.properties.get(name, [])
+
+def parse_content_line(line: str) -> Optional[IcsProperty]:
+    """접힘이 해제된 content line 파싱, 형식이 맞지 않으면 None"""
+    match = _CONTENT_LINE.match(line)
+    if match is None:
+        return None
+    name, raw_params, value = match.groups()
+    params = {}
+    for param_name, param_value in _PARAM.findall(raw_params):
+        if len(param_value) >= 2 and param_value[0] == param_value[-1] == '"':
+            param_value = param_value[1:-1]
+        params[param_name.upper()] = param_value
+    return IcsProperty(name.upper(), params, value)
+
+def unescape_text(text: Optional[str]) -> str:
+    """TEXT 값 언이스케이프 (\\n, \\;, \\,, \\\\)"""
+    if not text:
+        return ""
+    return _TEXT_ESCAPE.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), text)
+
+@functools.lru_cache(maxsize=128)
+def _zone(tzid: str):
+    """TZID를 시간대로 (IANA 이름이 아니면 UTC로 간주)"""
+    try:
+        return ZoneInfo(tzid.strip('/'))
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.debug(f"Unknown ICS TZID {tzid}, assuming UTC")
+        return timezone.utc
+
+def parse_ics_datetime(value: str, params: Optional[Dict[str, str]] = None) -> Tuple[datetime, bool]:
+    """DATE/DATE-TIME 값을 (UTC datetime, 종일 여부)로, TZID가 있으면 해당 시간대 기준"""
+    params = params or {}
+    if params.get('VALUE', '').upper() == 'DATE' or len(value) == 8:
+        return datetime.strptime(value[:8], '%Y%m%d').replace(tzinfo=timezone.utc), True
+    if value.endswith('Z'):
+        return datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc), False
+    local = datetime.strptime(value[:15], '%Y%m%dT%H%M%S')
+    tzid = params.get('TZID')
+    if tzid is None:
+        # floating time: 시간대 정보가 없으므로 UTC로 간주
+        return local.replace(tzinfo=timezone.utc), False
+    return local.replace(tzinfo=_zone(tzid)).astimezone(timezone.utc), False
+
+class IcsEventParser:
+    """
+    ICS 줄을 하나씩 받아 since <= DTSTART < until인 VEVENT를 반환하는 증분 파서
+
+    feed_line()은 줄 끝 문자를 제외한 물리적 줄을 받고, 완성된 이벤트가 있으면 반환.
+    feed()는 응답 바이트 청크를 받아 완성된 이벤트 목록 반환. 마지막 입력 뒤 close() 호출
+    """
+
+    def __init__(self, since: Optional[datetime] = None, until: Optional[datetime] = None):
+        self.since = since
+        self.until = until
+        self.skipped = 0  # 윈도우 밖이라 건너뛴 VEVENT 수
+        self._pending: Optional[str] = None
+        self._in_event = False
+        self._skip_event = False
+        self._depth = 0  # VEVENT 안 하위 컴포넌트 깊이
+        self._properties: Dict[str, List[IcsProperty]] = {}
+        self._start: Optional[Tuple[datetime, bool]] = None
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._partial_line = ''
+
+    def feed(self, chunk: bytes) -> List[IcsEvent]:
+        """바이트 청크의 완성된 줄을 처리 (마지막 미완성 줄은 다음 청크까지 보관)"""
+        lines = (self._partial_line + self._text.decode(chunk)).split('\n')
+        self._partial_line = lines.pop()
+        events = []
+        for line in lines:
+            event = self.feed_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def feed_line(self, line: str) -> Optional[IcsEvent]:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t'):
+            # 접힌 줄: 앞의 공백 한 글자를 빼고 이전 줄에 이어 붙임
+            if self._pending is not None and not self._skip_event:
+                self._pending += line[1:]
+            return None
+        previous, self._pending = self._pending, line
+        return self._process(previous) if previous is not None else None
+
+    def close(self) -> List[IcsEvent]:
+        """남은 줄 처리, 완성된 이벤트 목록 반환"""
+        # 줄 끝 문자 없이 끝난 마지막 줄과 접힘 해제를 기다리던 줄
+        tail, self._partial_line = self._partial_line + self._text.decode(b'', final=True), ''
+        events = [self.feed_line(tail)] if tail else []
+        previous, self._pending = self._pending, None
+        if previous is not None:
+            events.append(self._process(previous))
+        return [event for event in events if event is not None]
+
+    def _process(self, line: str) -> Optional[IcsEvent]:
+        upper = line.upper()
+        if upper == 'BEGIN:VEVENT' and not self._in_event:
+            self._in_event = True
+            self._skip_event = False
+            self._depth = 0
+            self._properties = {}
+            self._start = None
+            return None
+        if not self._in_event:
+            return None
+
+        if upper == 'END:VEVENT' and self._depth == 0:
+            self._in_event = False
+            return self._finish()
+        if self._skip_event:
+            return None
+        if upper.startswith('BEGIN:'):
+            self._depth += 1
+            return None
+        if upper.startswith('END:'):
+            self._depth = max(0, self._depth - 1)
+            return None
+        if self._depth:
+            return None
+
+        prop = parse_content_line(line)
+        if prop is None:
+            return None
+        if prop.name == 'DTSTART':
+            try:
+                self._start = parse_ics_datetime(prop.value, prop.params)
+            except ValueError as e:
+                logger.warning(f"Invalid ICS DTSTART {prop.value}: {e}")
+                self._skip_event = True
+                return None
+            if not self._in_window(self._start[0]):
+                # 윈도우 밖 이벤트는 나머지 속성을 모으지 않음
+                self._skip_event = True
+                self._properties = {}
+                return None
+        self._properties.setdefault(prop.name, []).append(prop)
+        return None
+
+    def _in_window(self, start: datetime) -> bool:
+        if self.since is not None and start < self.since:
+            return False
+        if self.until is not None and start >= self.until:
+            return False
+        return True
+
+    def _finish(self) -> Optional[IcsEvent]:
+        properties, self._properties = self._properties, {}
+        if self._skip_event:
+            self.skipped += 1
+            return None
+        if self._start is None:
+            logger.warning(f"Skipping ICS event without DTSTART: {properties.get('UID')}")
+            return None
+        start, all_day = self._start
+        return IcsEvent(start=start, all_day=all_day, properties=properties)
+
+# Acceptance Criteria:
+# - 피드 전체를 메모리에 올리지 않고 줄 단위로 파싱
+# - 접힌 줄 해제, 따옴표 파라미터와 TZID/VALUE=DATE 처리
+# - 반복 속성(ATTENDEE 등)은 모든 값 보관
+# - since <= DTSTART < until 밖의 VEVENT는 이벤트로 만들지 않음
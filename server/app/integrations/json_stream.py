@@ -0,0 +1,155 @@
+"""Incremental JSON decoding for large provider list responses
+
+설계 의도:
+- events.list 한 페이지(최대 2,500건)를 응답 전체/디코딩 트리 전체로 들고 있지 않도록 바이트 스트림에서 바로 디코딩
+- 최상위 객체의 배열 필드 하나(items)는 원소가 완성되는 즉시 하나씩 꺼내고, 나머지 필드(nextPageToken 등)는 작은 값이므로 그대로 보관
+- 원소 하나는 표준 json 디코더(raw_decode)로 읽으므로 별도 의존성 없이 원소 단위 메모리만 유지
+- 청크 경계에서 잘린 UTF-8 문자/값은 다음 청크가 올 때까지 버퍼에 남김
+
+"""
+import codecs
+import json
+import re
+from typing import Any, Dict, List
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# 디코더 상태
+_OBJECT_START = 'object_start'
+_KEY = 'key'
+_COLON = 'colon'
+_VALUE = 'value'
+_NEXT_KEY = 'next_key'
+_ARRAY_START = 'array_start'
+_ITEM = 'item'
+_NEXT_ITEM = 'next_item'
+_DONE = 'done'
+
+# 버퍼에 값이 아직 다 도착하지 않음
+_INCOMPLETE = object()
+
+# raw_decode는 상태가 없으므로 공유 (디코더 인스턴스를 pickle 가능하게 유지)
+_JSON_DECODER = json.JSONDecoder()
+
+class JsonArrayStreamDecoder:
+    """
+    최상위 JSON 객체에서 array_key 배열의 원소를 청크 단위로 꺼내는 증분 디코더
+
+    feed()는 이번 청크까지 완성된 원소를 반환하고, 배열 밖 필드는 fields에 모음.
+    close()는 남은 원소를 반환하며 응답이 중간에 끊겼으면 ValueError
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._key = None
+        self._final = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """바이트 청크 추가, 완성된 배열 원소 반환"""
+        # 소비한 앞부분은 버려 버퍼에는 미완성 값과 새 청크만 남김
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._drain()
+
+    def close(self) -> List[Any]:
+        """스트림 끝, 남은 원소 반환 (최상위 객체가 닫히지 않았으면 ValueError)"""
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b'', final=True)
+        self._pos = 0
+        self._final = True
+        items = self._drain()
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON response")
+        return items
+
+    def _drain(self) -> List[Any]:
+        items = []
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos >= len(self._buffer):
+                return items
+            char = self._buffer[self._pos]
+            state = self._state
+
+            if state == _OBJECT_START:
+                self._expect(char, '{')
+                self._state = _KEY
+            elif state == _KEY:
+                if char == '}':
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                key = self._value()
+                if key is _INCOMPLETE:
+                    return items
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected object key at position {self._pos}")
+                self._key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(char, ':')
+                self._state = _ARRAY_START if self._key == self.array_key else _VALUE
+            elif state == _VALUE:
+                value = self._value()
+                if value is _INCOMPLETE:
+                    return items
+                self.fields[self._key] = value
+                self._state = _NEXT_KEY
+            elif state == _NEXT_KEY:
+                if char == '}':
+                    self._pos += 1
+                    self._state = _DONE
+                else:
+                    self._expect(char, ',')
+                    self._state = _KEY
+            elif state == _ARRAY_START:
+                self._expect(char, '[')
+                self._state = _ITEM
+            elif state == _ITEM:
+                if char == ']':
+                    self._pos += 1
+                    self._state = _NEXT_KEY
+                    continue
+                item = self._value()
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self._state = _NEXT_ITEM
+            elif state == _NEXT_ITEM:
+                if char == ']':
+                    self._pos += 1
+                    self._state = _NEXT_KEY
+                else:
+                    self._expect(char, ',')
+                    self._state = _ITEM
+            else:
+                raise ValueError(f"Extra data at position {self._pos}")
+
+    def _expect(self, char: str, expected: str):
+        if char != expected:
+            raise ValueError(f"Expected '{expected}' at position {self._pos}, got '{char}'")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """현재 위치의 JSON 값 하나, 아직 다 도착하지 않았으면 _INCOMPLETE"""
+        try:
+            value, end = _JSON_DECODER.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return _INCOMPLETE
+        # 버퍼 끝에서 끝난 숫자/리터럴은 다음 청크에서 이어질 수 있음
+        if end >= len(self._buffer) and not self._final:
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+# Acceptance Criteria:
+# - 배열 원소는 완성되는 즉시 반환하고 응답 전체를 버퍼에 두지 않음
+# - 청크 경계에서 잘린 UTF-8 문자/문자열/숫자도 올바르게 이어서 디코딩
+# - 배열 앞뒤의 다른 최상위 필드는 fields로 조회 가능
+# - 중간에 끊긴 응답은 close()에서 ValueError
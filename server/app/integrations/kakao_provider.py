@@ -6,13 +6,13 @@
 - 적절한 오류 메시지로 사용자에게 대안 안내
 
 """
-from typing import List, Optional
+from typing import List, Optional, AsyncIterator
 from datetime import datetime
 import logging
 
 from .base import (
     CalendarProvider, ProviderCapabilities, CalendarEventDTO, CalendarDTO,
-    SyncResult, ProviderError
+    SyncResult, ProviderError, paginate_events
 )
 
 logger = logging.getLogger(__name__)
@@ -48,7 +48,8 @@ class KakaoCalendarProvider:
         since: datetime,
         until: datetime,
         delta_token: Optional[str] = None,
-        updated_min: Optional[datetime] = None
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
     ) -> SyncResult:
         """카카오 이벤트 조회 - 현재 미지원"""
         logger.warning("Attempted to fetch Kakao calendar events - not supported")
@@ -58,11 +59,29 @@ class KakaoCalendarProvider:
             self.name
         )
     
+    async def iter_event_pages(
+        self,
+        access_token: str,
+        calendar_id: str,
+        since: datetime,
+        until: datetime,
+        delta_token: Optional[str] = None,
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
+    ) -> AsyncIterator[SyncResult]:
+        """카카오 이벤트 페이지 조회 - 현재 미지원"""
+        async for page in paginate_events(
+            self, access_token, calendar_id, since, until,
+            delta_token=delta_token, updated_min=updated_min, page_token=page_token
+        ):
+            yield page
+    
     async def upsert_event(
         self,
         access_token: str,
         calendar_id: str,
-        event: CalendarEventDTO
+        event: CalendarEventDTO,
+        previous: Optional[CalendarEventDTO] = None
     ) -> CalendarEventDTO:
         """카카오 이벤트 생성/수정 - 현재 미지원"""
         logger.warning(f"Attempted to create Kakao event: {event.title}")
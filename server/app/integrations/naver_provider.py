@@ -4,30 +4,82 @@
 - 네이버는 createSchedule.json API로 ICS 문자열 전송 방식 지원
 - 읽기는 기본 미지원, 옵션으로 사용자 제공 ICS URL 파싱
 - 같은 UID 재전송으로 수정 처리, 삭제는 미지원
+- ICS URL은 ETag/Last-Modified로 조건부 GET, 변경 없는 피드는 다시 받거나 파싱하지 않음
+- ICS 피드는 스트리밍으로 한 줄씩 파싱하고 동기화 윈도우 밖 이벤트는 만들지 않음 (다년치 대용량 공유 피드)
+- ICS 피드는 이전 동기화의 UID → 지문 색인(delta token)과 비교하여 추가/변경/삭제만 전달
+- 큰 피드 파싱은 설정에 따라 ParseExecutor의 프로세스 풀에서 실행하여 이벤트 루프를 막지 않음
+- 일시적 오류 재시도와 circuit breaker는 Google과 같은 ProviderResilience 정책 사용
 
 """
 import httpx
 import asyncio
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+import functools
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, AsyncIterator
+from datetime import datetime, timezone, timedelta
 import logging
 import re
-from io import StringIO
+import time
 
 from .base import (
     CalendarProvider, ProviderCapabilities, CalendarEventDTO, CalendarDTO,
-    SyncResult, ProviderError, RateLimitError, AuthenticationError
+    SyncResult, ProviderError, AuthenticationError, RateLimitError, TransientProviderError, CircuitOpenError,
+    OAuthTokens, paginate_events, parse_oauth_tokens
 )
+from .http_cache import ConditionalCache, validator_headers, validators_from_response
+from .quota import QuotaLimiter
+from .resilience import ProviderResilience
+from .feed_delta import build_feed_index, decode_feed_index, diff_feed, encode_feed_index
+from .ics_stream import IcsEvent, IcsEventParser, parse_ics_datetime, unescape_text
+from .parse_executor import ParseExecutor
 
 logger = logging.getLogger(__name__)
 
+# ICS PARTSTAT → Google responseStatus 표기 (DTO 참석자 상태 통일)
+_PARTSTAT = {
+    'NEEDS-ACTION': 'needsAction',
+    'ACCEPTED': 'accepted',
+    'DECLINED': 'declined',
+    'TENTATIVE': 'tentative'
+}
+
+@dataclass
+class _ParsedFeed:
+    """ICS 피드에서 [since, until) 윈도우로 파싱한 이벤트 (304일 때 재사용)"""
+    since: datetime
+    until: datetime
+    events: List[CalendarEventDTO]
+
+    def covers(self, since: datetime, until: datetime) -> bool:
+        return self.since <= since and until <= self.until
+
 class NaverCalendarProvider:
     """네이버 캘린더 API 제공자"""
     
-    def __init__(self, client_id: str, client_secret: str):
+    TOKEN_URL = 'https://nid.naver.com/oauth2.0/token'
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+        feed_cache: Optional[ConditionalCache] = None,
+        rate_limiter: Optional[QuotaLimiter] = None,
+        resilience: Optional[ProviderResilience] = None,
+        feed_window_slack: timedelta = timedelta(days=1),
+        parse_executor: Optional[ParseExecutor] = None
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = rate_limiter  # None이면 쿼터 선제 제한 없음
+        self.resilience = resilience or ProviderResilience(self.name)
+        # ICS URL → (검증자, 파싱한 윈도우와 그 안의 이벤트)
+        self._feed_cache = feed_cache or ConditionalCache()
+        self.feed_window_slack = feed_window_slack
+        self.parse_executor = parse_executor or ParseExecutor()  # 기본은 인라인 스트리밍 파싱
+        # 주입된 클라이언트(ProviderRegistry의 공유 풀)는 소유자가 닫음
+        self._http_client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
     
     @property
     def name(self) -> str:
@@ -35,8 +87,8 @@ class NaverCalendarProvider:
     
     @property
     def capabilities(self) -> ProviderCapabilities:
-        # 기본적으로는 쓰기만 지원, 옵션으로 ICS URL 읽기 가능
-        return ProviderCapabilities(read=False, write=True, delta=False)
+        # 기본적으로는 쓰기만 지원, 옵션으로 ICS URL 읽기 가능 (ICS는 색인 비교로 증분 동기화)
+        return ProviderCapabilities(read=False, write=True, delta=True)
     
     async def _get_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
@@ -46,6 +98,11 @@ class NaverCalendarProvider:
             )
         return self._http_client
     
+    async def _acquire_quota(self):
+        """호출 전 쿼터 토큰 획득"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.name)
+    
     def _generate_ics_content(self, event: CalendarEventDTO) -> str:
         """CalendarEventDTO를 ICS 형식으로 변환"""
         ics_lines = [
@@ -110,94 +167,55 @@ class NaverCalendarProvider:
             return ""
         return text.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;').replace('\n', '\\n')
     
-    def _parse_ics_datetime(self, dt_str: str, all_day: bool = False) -> datetime:
-        """ICS datetime 문자열을 UTC datetime으로 파싱"""
-        if all_day:
-            return datetime.strptime(dt_str, '%Y%m%d').replace(tzinfo=timezone.utc)
-        
-        if dt_str.endswith('Z'):
-            return datetime.strptime(dt_str, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
-        else:
-            # Local time assumed
-            dt = datetime.strptime(dt_str, '%Y%m%dT%H%M%S')
-            return dt.replace(tzinfo=timezone.utc)  # Assume UTC for simplicity
+    def _parse_ics_content(self, ics_content: str, since: datetime, until: datetime) -> List[CalendarEventDTO]:
+        """ICS 문자열에서 since <= 시작 < until인 이벤트 목록 반환"""
+        parser = IcsFeedParser(since, until, self)
+        parser.feed(ics_content.encode('utf-8'))
+        return parser.close()
     
-    def _parse_ics_content(self, ics_content: str) -> List[CalendarEventDTO]:
-        """ICS 컨텐츠를 파싱하여 이벤트 목록 반환"""
-        events = []
-        lines = ics_content.replace('\r\n', '\n').split('\n')
-        
-        current_event = {}
-        in_event = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            if line == 'BEGIN:VEVENT':
-                in_event = True
-                current_event = {}
-                continue
-            elif line == 'END:VEVENT':
-                if in_event and current_event:
-                    try:
-                        event = self._parse_ics_event(current_event)
-                        events.append(event)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse ICS event: {e}")
-                in_event = False
-                continue
-            
-            if not in_event:
-                continue
-            
-            # 속성 파싱
-            if ':' in line:
-                key_part, value = line.split(':', 1)
-                key = key_part.split(';')[0]  # 파라미터 제거
-                current_event[key] = value
-        
-        return events
+    def _collect_ics_events(self, ics_events: List[IcsEvent], events: List[CalendarEventDTO]):
+        """파싱된 VEVENT를 DTO로 변환하여 추가 (변환 실패 이벤트는 건너뜀)"""
+        for ics_event in ics_events:
+            try:
+                events.append(self._parse_ics_event(ics_event))
+            except Exception as e:
+                logger.warning(f"Failed to parse ICS event {ics_event.value('UID')}: {e}")
     
-    def _parse_ics_event(self, event_data: Dict[str, str]) -> CalendarEventDTO:
-        """ICS 이벤트 데이터를 CalendarEventDTO로 변환"""
-        uid = event_data.get('UID', '')
-        title = self._unescape_ics_text(event_data.get('SUMMARY', 'No Title'))
-        description = self._unescape_ics_text(event_data.get('DESCRIPTION', ''))
-        location = self._unescape_ics_text(event_data.get('LOCATION', ''))
-        
-        # 시간 파싱
-        dtstart = event_data.get('DTSTART', '')
-        dtend = event_data.get('DTEND', '')
+    def _parse_ics_event(self, ics_event: IcsEvent) -> CalendarEventDTO:
+        """ICS VEVENT를 CalendarEventDTO로 변환"""
+        dtend = ics_event.first('DTEND')
+        end_utc = parse_ics_datetime(dtend.value, dtend.params)[0] if dtend is not None else ics_event.start
         
-        all_day = 'VALUE=DATE' in dtstart
-        start_utc = self._parse_ics_datetime(dtstart.split(':')[-1], all_day)
-        end_utc = self._parse_ics_datetime(dtend.split(':')[-1], all_day) if dtend else start_utc
+        # 업데이트 시간 (LAST-MODIFIED가 없으면 DTSTAMP)
+        modified = ics_event.first('LAST-MODIFIED') or ics_event.first('DTSTAMP')
+        updated_at = parse_ics_datetime(modified.value)[0] if modified is not None else datetime.utcnow()
         
-        # 업데이트 시간
-        dtstamp = event_data.get('DTSTAMP', '')
-        updated_at = self._parse_ics_datetime(dtstamp) if dtstamp else datetime.utcnow()
+        rrule = ics_event.value('RRULE')
+        attendees = [
+            {
+                'email': re.sub(r'^mailto:', '', attendee.value, flags=re.IGNORECASE),
+                'name': attendee.params.get('CN'),
+                'status': _PARTSTAT.get(attendee.params.get('PARTSTAT', 'NEEDS-ACTION').upper(), 'needsAction')
+            }
+            for attendee in ics_event.all('ATTENDEE')
+        ]
         
         return CalendarEventDTO(
-            external_event_id=uid,
+            external_event_id=ics_event.value('UID', ''),
             calendar_id='naver-default',
-            title=title,
-            description=description or None,
-            start_utc=start_utc,
+            title=unescape_text(ics_event.value('SUMMARY')) or 'No Title',
+            description=unescape_text(ics_event.value('DESCRIPTION')) or None,
+            start_utc=ics_event.start,
             end_utc=end_utc,
-            all_day=all_day,
-            location=location or None,
-            recurrence_rule=event_data.get('RRULE'),
-            attendees=[],  # ICS 파싱에서는 단순화
+            all_day=ics_event.all_day,
+            location=unescape_text(ics_event.value('LOCATION')) or None,
+            recurrence_rule=f"RRULE:{rrule}" if rrule else None,
+            attendees=attendees,
             external_updated_at=updated_at,
-            external_version=None
+            external_version=None,
+            deleted=(ics_event.value('STATUS', '').upper() == 'CANCELLED')
         )
     
-    def _unescape_ics_text(self, text: str) -> str:
-        """ICS 텍스트 언이스케이프"""
-        if not text:
-            return ""
-        return text.replace('\\n', '\n').replace('\\;', ';').replace('\\,', ',').replace('\\\\', '\\')
-    
     async def list_calendars(self, access_token: str) -> List[CalendarDTO]:
         """네이버 캘린더 목록 (기본 캘린더 하나만 반환)"""
         return [CalendarDTO(
@@ -214,24 +232,66 @@ class NaverCalendarProvider:
         since: datetime,
         until: datetime,
         delta_token: Optional[str] = None,
-        updated_min: Optional[datetime] = None
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
     ) -> SyncResult:
         """
         이벤트 조회 - 네이버는 기본적으로 읽기 미지원
         옵션: calendar_id가 ICS URL이면 해당 URL에서 이벤트 파싱
+        
+        delta_token은 이전 동기화의 UID → 지문 색인. 주어지면 추가/변경/삭제된 이벤트만 반환
         """
         if not calendar_id.startswith('http'):
             # 일반 네이버 캘린더는 읽기 미지원
             raise ProviderError("Naver calendar read not supported. Use ICS URL if available.", self.name)
         
-        # ICS URL에서 읽기 시도
+        previous_index = None
+        if delta_token:
+            try:
+                previous_index = decode_feed_index(delta_token)
+            except ValueError as e:
+                # 동기화 서비스가 전체 동기화로 폴백
+                raise ProviderError(f"Invalid sync token: {e}", self.name)
+        
+        # ICS URL에서 읽기 시도 (이전 응답의 검증자로 조건부 요청)
         try:
             client = await self._get_client()
-            response = await client.get(calendar_id)
-            response.raise_for_status()
+            cached = self._feed_cache.get(calendar_id)
+            if cached is not None and not cached.value.covers(since, until):
+                # 캐시된 파싱 결과가 요청 윈도우를 덮지 않으면 304를 받아도 쓸 수 없음
+                cached = None
+            headers = validator_headers(cached.validators if cached else None)
+            
+            async def send() -> httpx.Response:
+                await self._acquire_quota()
+                request = client.build_request('GET', calendar_id, headers=headers)
+                return await client.send(request, stream=True)
             
-            ics_content = response.text
-            events = self._parse_ics_content(ics_content)
+            requested = time.perf_counter()
+            response = await self.resilience.call('ics', send)
+            network_seconds, parse_seconds = time.perf_counter() - requested, 0.0
+            try:
+                if response.status_code != 304:
+                    response.raise_for_status()
+                
+                if response.status_code == 304 and cached is not None:
+                    # 피드가 바뀌지 않음: 본문 없이 이전 파싱 결과 재사용 (윈도우 필터만 다시 적용)
+                    events = cached.value.events
+                else:
+                    # 윈도우는 동기화마다 조금씩 밀리므로 끝을 feed_window_slack만큼 넓혀 파싱/캐시
+                    parse_until = until + self.feed_window_slack
+                    # 큰 피드는 설정에 따라 프로세스 풀에서 파싱 (작으면 받는 즉시 인라인 파싱)
+                    outcome = await self.parse_executor.parse_stream(
+                        response.aiter_bytes(), IcsFeedParser(since, parse_until, self)
+                    )
+                    events = outcome.value
+                    network_seconds += outcome.network_seconds
+                    parse_seconds = outcome.parse_seconds
+                    self._feed_cache.put(
+                        calendar_id, validators_from_response(response), _ParsedFeed(since, parse_until, events)
+                    )
+            finally:
+                await response.aclose()
             
             # 시간 범위 필터링
             filtered_events = [
@@ -239,23 +299,55 @@ class NaverCalendarProvider:
                 if since <= event.start_utc < until
             ]
             
+            # 이전 색인과 비교하여 바뀐 이벤트만 전달 (첫 동기화는 전체)
+            if previous_index is not None:
+                changed_events, index = diff_feed(filtered_events, previous_index, since, until, 'naver-default')
+            else:
+                changed_events, index = filtered_events, build_feed_index(filtered_events)
+            
             return SyncResult(
-                events=filtered_events,
-                next_delta_token=None,  # 증분 동기화 미지원
-                max_updated_at=max((e.external_updated_at for e in filtered_events), default=None)
+                events=changed_events,
+                next_delta_token=encode_feed_index(index),
+                max_updated_at=max(
+                    (e.external_updated_at for e in changed_events if not e.deleted), default=None
+                ),
+                bytes_transferred=response.num_bytes_downloaded,
+                network_seconds=network_seconds,
+                parse_seconds=parse_seconds
             )
             
+        except (RateLimitError, TransientProviderError, CircuitOpenError, AuthenticationError):
+            # 재시도 정책이 포기한 일시적 오류와 토큰 만료(401)는 타입을 유지하여 호출자가 처리
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch Naver ICS events: {e}")
             raise ProviderError(f"Failed to fetch ICS events: {e}", self.name)
     
+    async def iter_event_pages(
+        self,
+        access_token: str,
+        calendar_id: str,
+        since: datetime,
+        until: datetime,
+        delta_token: Optional[str] = None,
+        updated_min: Optional[datetime] = None,
+        page_token: Optional[str] = None
+    ) -> AsyncIterator[SyncResult]:
+        """ICS 피드는 단일 페이지로 조회"""
+        async for page in paginate_events(
+            self, access_token, calendar_id, since, until,
+            delta_token=delta_token, updated_min=updated_min, page_token=page_token
+        ):
+            yield page
+    
     async def upsert_event(
         self,
         access_token: str,
         calendar_id: str,
-        event: CalendarEventDTO
+        event: CalendarEventDTO,
+        previous: Optional[CalendarEventDTO] = None
     ) -> CalendarEventDTO:
-        """ICS 형식으로 이벤트 생성/수정"""
+        """ICS 형식으로 이벤트 생성/수정 (ICS는 전체 교체만 가능하므로 previous는 사용하지 않음)"""
         client = await self._get_client()
         
         # ICS 컨텐츠 생성
@@ -272,17 +364,20 @@ class NaverCalendarProvider:
             'scheduleIcalString': ics_content
         }
         
-        try:
-            response = await client.post(
+        async def send() -> httpx.Response:
+            await self._acquire_quota()
+            return await client.post(
                 'https://openapi.naver.com/calendar/createSchedule.json',
                 headers=headers,
                 data=data
             )
+        
+        try:
+            # 429/5xx는 재시도 정책 안에서 재시도, 넘으면 RateLimitError/TransientProviderError
+            response = await self.resilience.call('createSchedule', send)
             
             if response.status_code == 401:
                 raise AuthenticationError(self.name)
-            elif response.status_code == 429:
-                raise RateLimitError(self.name)
             
             response.raise_for_status()
             
@@ -306,6 +401,9 @@ class NaverCalendarProvider:
                 external_version=None
             )
             
+        except (RateLimitError, TransientProviderError, CircuitOpenError, AuthenticationError):
+            # 재시도 정책이 포기한 일시적 오류와 토큰 만료(401)는 타입을 유지하여 호출자가 처리
+            raise
         except Exception as e:
             logger.error(f"Failed to upsert Naver event: {e}")
             raise ProviderError(f"Failed to create Naver schedule: {e}", self.name)
@@ -322,14 +420,70 @@ class NaverCalendarProvider:
             self.name
         )
     
+    async def refresh_access_token(self, refresh_token: str) -> OAuthTokens:
+        """refresh token으로 새 access token 발급 (네이버는 refresh token을 교체하지 않음)"""
+        client = await self._get_client()
+        params = {
+            'grant_type': 'refresh_token',
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'refresh_token': refresh_token
+        }
+        
+        async def send() -> httpx.Response:
+            return await client.post(self.TOKEN_URL, params=params)
+        
+        response = await self.resilience.call('oauth.token', send)
+        response.raise_for_status()
+        data = response.json()
+        if 'error' in data or 'access_token' not in data:
+            # 네이버는 오류도 200 본문의 error/error_description으로 반환
+            raise AuthenticationError(self.name, f"Token refresh rejected: {data.get('error_description', data.get('error'))}")
+        return parse_oauth_tokens(data)
+    
     async def close(self):
-        """리소스 정리"""
-        if self._http_client:
+        """리소스 정리 (직접 만든 클라이언트만 닫음)"""
+        if self._http_client and self._owns_client:
             await self._http_client.aclose()
 
+class IcsFeedParser:
+    """ICS 응답 바이트 → 윈도우 안 이벤트 DTO 목록 (ParseExecutor용 StreamParser)
+
+    프로세스 풀로 보낼 때는 제공자 참조를 빼고 작업자 프로세스의 기본 제공자로 DTO 변환
+    """
+    
+    def __init__(self, since: datetime, until: datetime, provider: Optional[NaverCalendarProvider] = None):
+        self.provider = provider
+        self.parser = IcsEventParser(since, until)
+        self.events: List[CalendarEventDTO] = []
+    
+    def __getstate__(self):
+        return {**self.__dict__, 'provider': None}
+    
+    def feed(self, chunk: bytes) -> None:
+        self._converter()._collect_ics_events(self.parser.feed(chunk), self.events)
+    
+    def close(self) -> List[CalendarEventDTO]:
+        self._converter()._collect_ics_events(self.parser.close(), self.events)
+        logger.debug(f"Parsed {len(self.events)} ICS events in window, skipped {self.parser.skipped}")
+        return self.events
+    
+    def _converter(self) -> NaverCalendarProvider:
+        return self.provider or _worker_provider()
+
+@functools.lru_cache(maxsize=1)
+def _worker_provider() -> NaverCalendarProvider:
+    """프로세스 풀 작업자의 DTO 변환용 제공자 (_parse_ics_event는 자격 증명/연결을 쓰지 않음)"""
+    return NaverCalendarProvider('', '')
+
 # Acceptance Criteria:
 # - ICS 형식으로 네이버 캘린더에 이벤트 생성/수정 가능
 # - 같은 UID 재전송으로 이벤트 수정 처리
 # - 옵션으로 ICS URL 제공 시 읽기 전용 이벤트 파싱 지원
+# - ICS 피드는 줄 단위 스트리밍 파싱, 윈도우 밖 이벤트는 DTO로 만들지 않음
+# - ICS 피드는 색인 delta token으로 바뀐 이벤트만 반환, 피드에서 사라진 이벤트는 deleted=True
+# - ICS URL은 조건부 GET으로 변경 없는 피드의 다운로드/파싱 생략
+# - refresh token으로 access token 재발급
+# - 일시적 오류는 공통 재시도 정책(deadline/budget)으로만 재시도, 장애 시 circuit breaker로 즉시 실패
 # - 삭제 미지원 시 적절한 오류 메시지와 로컬 마킹 안내
 # - UTC 시간 기준으로 모든 datetime 처리
\ No newline at end of file
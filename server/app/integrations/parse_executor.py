@@ -0,0 +1,124 @@
+"""Parse stage for provider response payloads
+
+설계 의도:
+- JSON 디코딩/_parse_event, ICS 파싱은 CPU 작업이라 큰 페이지는 이벤트 루프를 수백 ms 막아 같은 워커의 다른 요청이 멈춤
+- 설정으로 켜면 응답 원본 바이트를 모아 크기가 임계값 이상이면 프로세스 풀에서 파싱하고 DTO 묶음만 돌려받음
+- 임계값 미만 페이지는 프로세스 간 복사 비용이 더 크므로 인라인 파싱, 끄면 기존처럼 받는 즉시 스트리밍 파싱
+- 제공자는 바이트 청크와 파서(StreamParser)만 넘기고, 네트워크 시간과 파싱 시간을 따로 돌려받아 보고
+
+"""
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Protocol
+
+from ..core.config import ParseSettings
+
+logger = logging.getLogger(__name__)
+
+class StreamParser(Protocol):
+    """응답 바이트를 받아 최종 결과를 만드는 파서 (프로세스 풀로 보낼 수 있도록 pickle 가능해야 함)"""
+
+    def feed(self, chunk: bytes) -> None:
+        ...
+
+    def close(self) -> Any:
+        ...
+
+@dataclass
+class ParseOutcome:
+    """파싱 결과와 시간 분해"""
+    value: Any
+    network_seconds: float  # 응답 본문 수신 대기 (인라인 파싱 시간 제외)
+    parse_seconds: float  # 디코딩/DTO 변환 (프로세스 풀이면 결과를 기다린 시간)
+    offloaded: bool = False
+
+def _parse_body(parser: StreamParser, body: bytes) -> Any:
+    """프로세스 풀 작업자에서 실행"""
+    parser.feed(body)
+    return parser.close()
+
+class ParseExecutor:
+    """응답 크기에 따라 인라인 또는 프로세스 풀에서 파서 실행"""
+
+    def __init__(self, settings: Optional[ParseSettings] = None):
+        self.settings = settings or ParseSettings()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._stats: Dict[str, float] = {
+            'inline': 0, 'offloaded': 0, 'bytes_parsed': 0,
+            'network_seconds': 0.0, 'parse_seconds': 0.0
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 이벤트 루프/커넥션 풀을 가진 프로세스를 fork하지 않도록 spawn
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.settings.max_workers or None,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    async def parse_stream(self, chunks: AsyncIterator[bytes], parser: StreamParser) -> ParseOutcome:
+        """
+        청크를 파서에 넘겨 결과 반환
+
+        꺼져 있으면 청크가 올 때마다 인라인으로 파싱 (원본 본문을 들고 있지 않음).
+        켜져 있으면 원본 바이트를 모은 뒤 threshold_bytes 이상이면 프로세스 풀, 미만이면 인라인
+        """
+        started = time.perf_counter()
+        parse_seconds = 0.0
+        streaming = not self.settings.enabled
+        pending = []
+        size = 0
+
+        async for chunk in chunks:
+            size += len(chunk)
+            if streaming:
+                parse_started = time.perf_counter()
+                parser.feed(chunk)
+                parse_seconds += time.perf_counter() - parse_started
+            else:
+                pending.append(chunk)
+        network_seconds = time.perf_counter() - started - parse_seconds
+
+        offloaded = not streaming and size >= self.settings.threshold_bytes
+        parse_started = time.perf_counter()
+        if offloaded:
+            body = b''.join(pending)
+            pending.clear()
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(self._get_pool(), _parse_body, parser, body)
+        else:
+            for chunk in pending:
+                parser.feed(chunk)
+            value = parser.close()
+        parse_seconds += time.perf_counter() - parse_started
+
+        self._stats['offloaded' if offloaded else 'inline'] += 1
+        self._stats['bytes_parsed'] += size
+        self._stats['network_seconds'] += network_seconds
+        self._stats['parse_seconds'] += parse_seconds
+        return ParseOutcome(value, network_seconds, parse_seconds, offloaded)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """인라인/프로세스 풀 파싱 횟수와 누적 네트워크/파싱 시간"""
+        return {
+            'enabled': self.settings.enabled,
+            'threshold_bytes': self.settings.threshold_bytes,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in self._stats.items()}
+        }
+
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# Acceptance Criteria:
+# - 켜면 threshold_bytes 이상 응답은 프로세스 풀에서 파싱하여 이벤트 루프를 막지 않음
+# - 임계값 미만은 인라인, 끄면 수신 즉시 스트리밍 파싱
+# - 제공자는 바이트와 파서만 넘기고 DTO 묶음을 돌려받음
+# - 네트워크 시간과 파싱 시간을 따로 보고
@@ -0,0 +1,164 @@
+"""Proactive provider quota limiter (token buckets)
+
+설계 의도:
+- 429를 받은 뒤 재시도하는 대신, 호출 전에 제공자 전체/사용자별 토큰 버킷에서 토큰을 받음
+- 버킷 상태는 QuotaStore로 분리: 기본은 프로세스 내, Postgres 저장소(services.quota_store)를 use_store로 주입하면 워커와 레플리카가 공유
+- DB 모델/세션에 의존하지 않으므로 파싱 프로세스 풀 작업자 등 integrations만 import하는 곳에 DB 계층을 끌어오지 않음
+- 토큰 차감은 저장소에서 원자적으로 처리하고, 부족하면 다음 토큰까지 남은 시간만 대기
+- 호출 사용자는 contextvar로 전달하여 제공자 메서드 시그니처를 바꾸지 않음
+
+"""
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
+
+from .base import RateLimitError
+from ..core.config import QuotaSettings, ProviderQuotaSettings
+
+logger = logging.getLogger(__name__)
+
+# 현재 호출이 어느 사용자 쿼터를 쓰는지 (동기화/푸시 진입점에서 설정)
+_quota_user: ContextVar[Optional[str]] = ContextVar('quota_user', default=None)
+
+@contextmanager
+def quota_user(user_id: Optional[str]) -> Iterator[None]:
+    """블록 안의 제공자 호출을 user_id의 사용자별 버킷에 집계"""
+    token = _quota_user.set(str(user_id) if user_id is not None else None)
+    try:
+        yield
+    finally:
+        _quota_user.reset(token)
+
+def current_quota_user() -> Optional[str]:
+    return _quota_user.get()
+
+@dataclass
+class BucketUsage:
+    """버킷 사용량 스냅샷"""
+    bucket_key: str
+    tokens: float  # 조회 시각 기준 리필을 반영한 남은 토큰
+    rate_per_second: float
+    burst: int
+    granted_total: int
+    throttled_total: int
+
+def bucket_owner(bucket_key: str) -> Optional[str]:
+    """사용자별 버킷이면 사용자 ID, 제공자 전체 버킷이면 None"""
+    _, marker, user_id = bucket_key.partition(':user:')
+    return user_id if marker else None
+
+def refill_tokens(tokens: float, refilled_at: float, rate: float, burst: int, now: float) -> float:
+    return min(float(burst), tokens + max(0.0, now - refilled_at) * rate)
+
+class QuotaStore(Protocol):
+    """토큰 버킷 저장소 인터페이스"""
+
+    async def take(self, key: str, cost: int, rate: float, burst: int, now: float) -> float:
+        """
+        토큰 차감 시도, 허용되면 0, 아니면 필요한 토큰이 찰 때까지 남은 초 반환
+
+        cost가 burst보다 크면 버킷이 가득 찼을 때 허용하고 부족분은 음수로 남겨 이후 호출이 대기
+        """
+        ...
+
+    async def snapshot(self, now: float) -> List[BucketUsage]:
+        """모든 버킷의 사용량"""
+        ...
+
+class InMemoryQuotaStore:
+    """프로세스 내 토큰 버킷 (단일 프로세스 또는 테스트용)"""
+
+    def __init__(self):
+        # key → [tokens, refilled_at, rate, burst, granted_total, throttled_total]
+        self._buckets: Dict[str, List[Any]] = {}
+
+    async def take(self, key: str, cost: int, rate: float, burst: int, now: float) -> float:
+        bucket = self._buckets.setdefault(key, [float(burst), now, rate, burst, 0, 0])
+        tokens = refill_tokens(bucket[0], bucket[1], rate, burst, now)
+        bucket[1], bucket[2], bucket[3] = now, rate, burst
+        need = min(cost, burst)
+        if tokens >= need:
+            bucket[0] = tokens - cost
+            bucket[4] += cost
+            return 0.0
+        bucket[0] = tokens
+        bucket[5] += 1
+        return (need - tokens) / rate
+
+    async def snapshot(self, now: float) -> List[BucketUsage]:
+        return [
+            BucketUsage(key, refill_tokens(b[0], b[1], b[2], b[3], now), b[2], b[3], b[4], b[5])
+            for key, b in self._buckets.items()
+        ]
+
+class QuotaLimiter:
+    """제공자 호출 전 토큰 획득 (사용자별 버킷 → 제공자 전체 버킷 순)"""
+
+    def __init__(self, settings: QuotaSettings, store: Optional[QuotaStore] = None):
+        self.settings = settings
+        self.store: QuotaStore = store or InMemoryQuotaStore()
+
+    def use_store(self, store: QuotaStore):
+        """저장소 교체 (워커/앱 시작 시 공유 저장소 연결)"""
+        self.store = store
+
+    def _buckets(self, provider: str) -> List[Tuple[str, float, int]]:
+        limits: Optional[ProviderQuotaSettings] = self.settings.providers.get(provider)
+        if limits is None:
+            return []
+        buckets = []
+        user_id = current_quota_user()
+        if user_id and limits.user_rate_per_second > 0:
+            buckets.append((
+                f"{provider}:user:{user_id}", limits.user_rate_per_second, max(1, limits.user_burst)
+            ))
+        if limits.rate_per_second > 0:
+            buckets.append((provider, limits.rate_per_second, max(1, limits.burst)))
+        return buckets
+
+    async def acquire(self, provider: str, cost: int = 1):
+        """
+        요청 cost만큼 토큰 획득 (부족하면 대기)
+
+        max_wait 안에 받지 못하면 RateLimitError로 호출자(작업 큐)가 나중에 다시 시도하게 함.
+        버킷마다 store.take를 한 번씩 부르고, 앞 버킷에서 받은 토큰은 뒤 버킷에서 포기해도 돌려주지 않음
+        """
+        deadline = time.monotonic() + self.settings.max_wait
+        for key, rate, burst in self._buckets(provider):
+            while True:
+                wait = await self.store.take(key, cost, rate, burst, time.time())
+                if wait <= 0:
+                    break
+                if time.monotonic() + wait > deadline:
+                    logger.warning(f"Quota bucket {key} exhausted, giving up after {self.settings.max_wait}s")
+                    raise RateLimitError(provider, retry_after=int(wait) + 1)
+                await asyncio.sleep(wait)
+
+    async def usage(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """버킷별 쿼터 사용량 (user_id를 주면 제공자 전체 버킷과 그 사용자의 버킷만)"""
+        usages = await self.store.snapshot(time.time())
+        if user_id is not None:
+            # 다른 사용자의 ID와 호출량은 노출하지 않음
+            usages = [usage for usage in usages if bucket_owner(usage.bucket_key) in (None, str(user_id))]
+        return [
+            {
+                'bucket': usage.bucket_key,
+                'tokens_available': round(usage.tokens, 2),
+                'rate_per_second': usage.rate_per_second,
+                'burst': usage.burst,
+                'granted_total': usage.granted_total,
+                'throttled_total': usage.throttled_total
+            }
+            for usage in usages
+        ]
+
+# Acceptance Criteria:
+# - 제공자 호출 전에 제공자 전체/사용자별 토큰을 받고, 부족하면 429 대신 대기
+# - 공유 저장소를 use_store로 주입하면 모든 워커와 레플리카가 같은 버킷을 공유
+# - integrations 모듈만 import하는 프로세스는 DB 모델/세션을 불러오지 않음
+# - max_wait를 넘기는 대기는 RateLimitError로 반환하여 워커 슬롯을 오래 점유하지 않음
+# - 버킷별 남은 토큰과 허용/대기 누계 조회 가능 (사용자에게는 자기 버킷과 제공자 전체 버킷만)
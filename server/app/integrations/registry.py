@@ -0,0 +1,235 @@
+"""Process-wide calendar provider registry
+
+설계 의도:
+- 요청마다 제공자와 httpx 클라이언트를 새로 만들지 않고 프로세스당 한 벌만 유지
+- 제공자별 공유 AsyncClient로 TLS 세션/keep-alive 커넥션 재사용 (가능하면 HTTP/2)
+- FastAPI lifespan에서 생성/종료하여 소켓 누수 방지, 풀 통계는 모니터링용으로 노출
+- 제공자 호출 쿼터 리미터도 레지스트리 단위로 공유 (설정 시 Postgres 버킷으로 프로세스 간 공유)
+- 재시도 정책/retry budget/circuit breaker는 제공자별로 하나씩 두어 모든 호출이 같은 상태를 봄
+- Google GET hedging은 설정으로 켜며 지연 분포와 hedging 통계도 레지스트리 단위로 공유
+- 큰 응답 파싱용 프로세스 풀(ParseExecutor)도 제공자들이 하나를 공유
+
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any
+
+import httpx
+
+from .base import CalendarProvider
+from .google_provider import GoogleCalendarProvider
+from .naver_provider import NaverCalendarProvider
+from .kakao_provider import KakaoCalendarProvider
+from .quota import QuotaLimiter, QuotaStore
+from .resilience import ProviderResilience, RetryPolicy, RetryBudget
+from .hedging import RequestHedger
+from .parse_executor import ParseExecutor
+from ..core.config import ProviderSettings, HttpPoolSettings, RetrySettings, load_provider_settings
+
+logger = logging.getLogger(__name__)
+
+def _http2_available() -> bool:
+    """HTTP/2에 필요한 h2 패키지 설치 여부 (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class ProviderRegistry:
+    """제공자와 공유 HTTP 클라이언트 보관소"""
+
+    def __init__(self, settings: Optional[ProviderSettings] = None):
+        self.settings = settings or load_provider_settings()
+        self.http2 = self.settings.http.http2 and _http2_available()
+        if self.settings.http.http2 and not self.http2:
+            logger.warning("h2 package not installed, provider HTTP clients fall back to HTTP/1.1")
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._request_counts: Dict[str, int] = {}
+        self.quota = QuotaLimiter(self.settings.quota)
+        self._shared_quota_store = False
+        self._resilience: Dict[str, ProviderResilience] = {}
+        self.google_hedger = RequestHedger(self.settings.google_hedge) if self.settings.google_hedge.enabled else None
+        self.parse_executor = ParseExecutor(self.settings.parse)
+
+        self.providers: Dict[str, CalendarProvider] = {
+            'google': GoogleCalendarProvider(
+                self.settings.google.client_id,
+                self.settings.google.client_secret,
+                page_size=self.settings.google_page_size,
+                partial_response=self.settings.google_partial_response,
+                http_client=self._build_client('google', GoogleCalendarProvider.BASE_URL),
+                rate_limiter=self.quota,
+                resilience=self._build_resilience('google'),
+                hedger=self.google_hedger,
+                parse_executor=self.parse_executor
+            ),
+            'naver': NaverCalendarProvider(
+                self.settings.naver.client_id,
+                self.settings.naver.client_secret,
+                http_client=self._build_client('naver'),
+                rate_limiter=self.quota,
+                resilience=self._build_resilience('naver'),
+                parse_executor=self.parse_executor
+            ),
+            'kakao': KakaoCalendarProvider(
+                self.settings.kakao.client_id,
+                self.settings.kakao.client_secret
+            )
+        }
+
+    def _build_client(self, name: str, base_url: str = '') -> httpx.AsyncClient:
+        """풀 설정을 적용한 제공자 전용 클라이언트 생성"""
+        http: HttpPoolSettings = self.settings.http
+        self._request_counts[name] = 0
+
+        async def count_request(request: httpx.Request):
+            self._request_counts[name] += 1
+
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=http.max_connections,
+                max_keepalive_connections=http.max_keepalive_connections,
+                keepalive_expiry=http.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(http.timeout, connect=http.connect_timeout),
+            headers={"User-Agent": "Mokkoji/1.0"},
+            event_hooks={'request': [count_request]}
+        )
+        self._clients[name] = client
+        return client
+
+    def _build_resilience(self, name: str) -> ProviderResilience:
+        """재시도 설정을 적용한 제공자 전용 재시도 정책/budget/breaker 생성"""
+        retry: RetrySettings = self.settings.retry
+        resilience = ProviderResilience(
+            name,
+            policy=RetryPolicy(
+                max_attempts=retry.max_attempts,
+                deadline=retry.deadline,
+                base_delay=retry.base_delay,
+                max_delay=retry.max_delay
+            ),
+            budget=RetryBudget(ratio=retry.budget_ratio, min_retries=retry.budget_min_retries),
+            failure_threshold=retry.breaker_failure_threshold,
+            reset_timeout=retry.breaker_reset_timeout
+        )
+        self._resilience[name] = resilience
+        return resilience
+
+    def get(self, platform: str) -> Optional[CalendarProvider]:
+        return self.providers.get(platform)
+
+    def use_shared_quota_store(self, store: QuotaStore):
+        """설정이 postgres면 쿼터 버킷을 공유 저장소로 (처음 한 번만 연결, 저장소는 서비스 계층에서 주입)"""
+        if self._shared_quota_store or self.settings.quota.store != 'postgres':
+            return
+        self.quota.use_store(store)
+        self._shared_quota_store = True
+
+    async def quota_usage(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """쿼터 버킷별 사용량 (user_id를 주면 그 사용자와 제공자 전체 버킷만)"""
+        return await self.quota.usage(user_id)
+
+    def circuit_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """제공자/엔드포인트별 circuit breaker 상태"""
+        return {name: resilience.snapshot() for name, resilience in self._resilience.items()}
+
+    def hedge_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """제공자/엔드포인트별 hedging 횟수 (사용하지 않으면 빈 dict)"""
+        if self.google_hedger is None:
+            return {}
+        return {'google': self.google_hedger.snapshot()}
+
+    def parse_stats(self) -> Dict[str, Any]:
+        """응답 파싱 인라인/프로세스 풀 횟수와 누적 네트워크/파싱 시간"""
+        return self.parse_executor.snapshot()
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 커넥션 풀 통계"""
+        http = self.settings.http
+        stats = {}
+        for name, client in self._clients.items():
+            # httpx는 풀 상태를 공개하지 않으므로 httpcore 풀에서 읽음 (실패 시 요청 수만 보고)
+            connections = []
+            try:
+                connections = list(client._transport._pool.connections)
+            except AttributeError:
+                pass
+
+            stats[name] = {
+                'http2': self.http2,
+                'max_connections': http.max_connections,
+                'max_keepalive_connections': http.max_keepalive_connections,
+                'keepalive_expiry': http.keepalive_expiry,
+                'connections': len(connections),
+                'idle_connections': sum(1 for conn in connections if conn.is_idle()),
+                'active_connections': sum(1 for conn in connections if not conn.is_idle() and not conn.is_closed()),
+                'requests_sent': self._request_counts.get(name, 0),
+                'closed': client.is_closed
+            }
+        return stats
+
+    async def aclose(self):
+        """공유 클라이언트와 파싱 프로세스 풀 종료"""
+        for provider in self.providers.values():
+            await provider.close()
+        for name, client in self._clients.items():
+            if not client.is_closed:
+                await client.aclose()
+        self.parse_executor.close()
+
+# 프로세스 전역 레지스트리 (lifespan 또는 첫 사용 시 생성)
+_registry: Optional[ProviderRegistry] = None
+
+def get_provider_registry() -> ProviderRegistry:
+    """프로세스 전역 레지스트리 반환 (없으면 생성)"""
+    global _registry
+    if _registry is None:
+        _registry = ProviderRegistry()
+    return _registry
+
+def set_provider_registry(registry: Optional[ProviderRegistry]):
+    """전역 레지스트리 교체 (테스트/워커용)"""
+    global _registry
+    _registry = registry
+
+async def close_provider_registry():
+    """전역 레지스트리 종료 및 해제"""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
+
+@asynccontextmanager
+async def provider_registry_lifespan(app, quota_store: Optional[QuotaStore] = None):
+    """FastAPI lifespan: 시작 시 레지스트리 생성과 공유 쿼터 저장소 연결, 종료 시 공유 클라이언트 정리
+
+    사용: FastAPI(lifespan=provider_registry_lifespan)
+    공유 쿼터 버킷: FastAPI(lifespan=functools.partial(
+        provider_registry_lifespan, quota_store=PostgresQuotaStore(session_factory)))
+    """
+    registry = get_provider_registry()
+    if quota_store is not None:
+        registry.use_shared_quota_store(quota_store)
+    elif registry.settings.quota.store == 'postgres':
+        logger.warning("PROVIDER_QUOTA_STORE=postgres but no shared quota store was given, using in-process buckets")
+    app.state.provider_registry = registry
+    try:
+        yield
+    finally:
+        await close_provider_registry()
+
+# Acceptance Criteria:
+# - 요청 간 제공자/HTTP 클라이언트 공유로 TLS·커넥션 재사용
+# - 커넥션 풀 크기, keep-alive, HTTP/2를 설정으로 제어 (h2 미설치 시 HTTP/1.1)
+# - 자격 증명은 config에서 로드
+# - lifespan 종료 시 모든 공유 클라이언트 종료
+# - 제공자별 풀 통계 조회 가능
+# - 제공자 호출은 공유 쿼터 리미터를 거치며 버킷별 사용량 조회 가능
+# - 제공자/엔드포인트별 circuit breaker 상태 조회 가능
+# - hedging 발생/승리 횟수 조회 가능
+# - 인라인/프로세스 풀 파싱 횟수와 네트워크/파싱 시간 조회 가능
@@ -0,0 +1,254 @@
+"""Provider retry policy, retry budget and circuit breakers
+
+설계 의도:
+- 재시도는 제공자 HTTP 호출 한 층에서만 수행 (서비스 계층은 재시도하지 않음)
+- 호출 하나의 재시도는 시도 횟수와 전체 deadline을 함께 넘지 않음 (긴 Retry-After는 기다리지 않고 실패)
+- 제공자별 retry budget으로 장애 시 재시도가 요청량을 부풀리지 않게 제한
+- 제공자/엔드포인트별 circuit breaker로 장애 중에는 모든 캘린더가 즉시 실패 (워커가 백오프 대기로 묶이지 않음)
+
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from .base import RateLimitError, TransientProviderError, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+class RetryBudget:
+    """
+    window 동안 재시도 수를 요청 수의 ratio 이하로 제한 (최소 min_retries는 허용)
+
+    정상 시에는 간헐적 오류를 모두 재시도하고, 장애로 대부분 실패하면 재시도가 멈춤
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._window_start = time.monotonic()
+        self._requests = 0
+        self._retries = 0
+
+    def _roll(self):
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._requests = 0
+            self._retries = 0
+
+    def record_request(self):
+        self._roll()
+        self._requests += 1
+
+    def try_withdraw(self) -> bool:
+        """재시도 하나를 쓸 수 있으면 True"""
+        self._roll()
+        if self._retries < max(self.min_retries, self.ratio * self._requests):
+            self._retries += 1
+            return True
+        return False
+
+@dataclass
+class RetryPolicy:
+    """시도 횟수 + 전체 deadline 기반 재시도 정책 (지수 백오프, full jitter)"""
+    max_attempts: int = 4
+    deadline: float = 30.0  # 첫 시도부터 마지막 재시도 시작까지 (초)
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def start(self, budget: Optional[RetryBudget] = None) -> 'RetryState':
+        return RetryState(self, budget)
+
+    async def run(self, attempt: Callable[[], Awaitable[T]], budget: Optional[RetryBudget] = None) -> T:
+        """TransientProviderError/RateLimitError만 재시도, 그 외 예외는 그대로 전달"""
+        state = self.start(budget)
+        while True:
+            state.record_attempt()
+            try:
+                return await attempt()
+            except (TransientProviderError, RateLimitError) as e:
+                retry_after = e.retry_after if isinstance(e, RateLimitError) else None
+                if not await state.backoff(retry_after):
+                    raise
+
+class RetryState:
+    """호출 하나의 재시도 진행 상태"""
+
+    def __init__(self, policy: RetryPolicy, budget: Optional[RetryBudget]):
+        self.policy = policy
+        self.budget = budget
+        self.attempts = 0
+        self.deadline = time.monotonic() + policy.deadline
+
+    def record_attempt(self):
+        self.attempts += 1
+        if self.budget is not None:
+            self.budget.record_request()
+
+    async def backoff(self, retry_after: Optional[float] = None) -> bool:
+        """다음 시도 전 대기, 횟수/deadline/budget을 넘으면 대기하지 않고 False"""
+        if self.attempts >= self.policy.max_attempts:
+            return False
+
+        if retry_after:
+            delay = float(retry_after)
+        else:
+            delay = random.uniform(0, min(self.policy.max_delay, self.policy.base_delay * (2 ** self.attempts)))
+        if time.monotonic() + delay > self.deadline:
+            # 서버가 요구한 대기가 deadline을 넘으면 기다리지 않고 호출자(작업 큐)에 맡김
+            return False
+
+        if self.budget is not None and not self.budget.try_withdraw():
+            logger.warning("Retry budget exhausted, not retrying")
+            return False
+
+        await asyncio.sleep(delay)
+        return True
+
+class CircuitBreaker:
+    """연속 실패 수 기반 circuit breaker (closed → open → half-open 시험 호출 → closed)"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, provider: str, endpoint: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.provider = provider
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self):
+        """열려 있으면 CircuitOpenError, reset_timeout이 지났으면 시험 호출 하나만 통과"""
+        if self.state == self.CLOSED:
+            return
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        retry_after = max(1, int(self.reset_timeout - (now - self.opened_at)) + 1)
+        raise CircuitOpenError(self.provider, self.endpoint, retry_after)
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for {self.provider}/{self.endpoint} closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit for {self.provider}/{self.endpoint} opened after {self.failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """결과 없이 끝난 시험 호출의 슬롯 반환"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'state': self.state, 'consecutive_failures': self.failures}
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[int]:
+    try:
+        return int(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+class ProviderResilience:
+    """제공자 하나의 재시도 정책, retry budget, 엔드포인트별 circuit breaker"""
+
+    def __init__(
+        self,
+        provider: str,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.provider = provider
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker(
+                self.provider, endpoint, self.failure_threshold, self.reset_timeout
+            )
+        return self._breakers[endpoint]
+
+    async def call(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        retry: bool = True
+    ) -> httpx.Response:
+        """
+        send를 circuit breaker와 재시도 정책으로 실행
+
+        네트워크 오류/5xx는 TransientProviderError, 429는 RateLimitError로 바꿔 재시도하고,
+        그 외 응답(2xx/3xx/4xx)은 그대로 반환. retry=False면 breaker만 적용 (호출자가 재시도 담당)
+        """
+        breaker = self.breaker(endpoint)
+
+        async def attempt() -> httpx.Response:
+            breaker.before_call()
+            try:
+                response = await send()
+            except httpx.RequestError as e:
+                breaker.record_failure()
+                raise TransientProviderError(self.provider, f"Network error: {e}")
+            except BaseException:
+                # 쿼터 대기 초과/취소 등은 장애가 아니므로 시험 호출 슬롯만 반환
+                breaker.release_probe()
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure()
+                # 스트리밍 응답이면 재시도 전에 연결 반환
+                await response.aclose()
+                raise TransientProviderError(
+                    self.provider, f"Server error {response.status_code}", status_code=response.status_code
+                )
+            breaker.record_success()
+            if response.status_code == 429:
+                await response.aclose()
+                raise RateLimitError(self.provider, _retry_after_seconds(response))
+            return response
+
+        if not retry:
+            self.budget.record_request()
+            return await attempt()
+        return await self.policy.run(attempt, self.budget)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 breaker 상태"""
+        return {endpoint: breaker.snapshot() for endpoint, breaker in self._breakers.items()}
+
+# Acceptance Criteria:
+# - 재시도는 제공자 HTTP 호출 한 층에서 시도 횟수와 전체 deadline 안에서만 수행
+# - Retry-After가 deadline을 넘으면 대기하지 않고 즉시 실패
+# - retry budget을 넘는 재시도는 하지 않음
+# - 엔드포인트별 연속 실패가 임계값을 넘으면 circuit open, 이후 호출은 즉시 CircuitOpenError
+# - reset_timeout 후 시험 호출 하나로 회복 여부 확인
@@ -0,0 +1,33 @@
+"""Calendar list cache models
+
+설계 의도:
+- calendar_list_cache: 연결별 외부 캘린더 목록과 ETag/Last-Modified 검증자 보관
+- TTL이 지나면 조건부 요청으로 재검증하고, 304면 validated_at만 갱신
+- /api/sync/pull이 캘린더 목록 API를 매번 호출하지 않도록 프로세스 재시작 후에도 유지
+
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.types import JSON
+
+from ..core.database import Base
+
+# Postgres에서는 UUID, 그 외(테스트용 sqlite)에서는 문자열
+_UUID = String(36).with_variant(UUID(as_uuid=False), 'postgresql')
+
+class CalendarListCache(Base):
+    """연결별 캘린더 목록 캐시"""
+    __tablename__ = 'calendar_list_cache'
+
+    connection_id = Column(_UUID, primary_key=True)
+    calendars = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False, default=list)
+    etag = Column(Text, nullable=True)
+    last_modified = Column(Text, nullable=True)
+    fetched_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)  # 마지막 전체 응답
+    validated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)  # 마지막 200/304
+
+# Acceptance Criteria:
+# - 연결당 캘린더 목록 캐시 한 행
+# - 재검증용 ETag/Last-Modified와 마지막 검증 시각 보관
@@ -0,0 +1,31 @@
+"""Provider quota ledger models
+
+설계 의도:
+- provider_quota_buckets: 제공자/사용자별 토큰 버킷 상태를 워커와 레플리카가 공유
+- 토큰 차감은 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 원자적으로 처리
+- 누적 허용/대기 횟수를 남겨 쿼터 사용량을 모니터링
+
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, Text, Float, Integer, BigInteger, Boolean, DateTime
+
+from ..core.database import Base
+
+class ProviderQuotaBucket(Base):
+    """제공자 쿼터 토큰 버킷"""
+    __tablename__ = 'provider_quota_buckets'
+
+    bucket_key = Column(Text, primary_key=True)  # 'google' 또는 'google:user:<user_id>'
+    tokens = Column(Float, nullable=False)  # 마지막 갱신 시점의 남은 토큰 (큰 batch는 음수 가능)
+    refilled_at = Column(Float, nullable=False)  # 마지막 갱신 시각 (epoch 초)
+    rate_per_second = Column(Float, nullable=False)
+    burst = Column(Integer, nullable=False)
+    granted_total = Column(BigInteger, nullable=False, default=0)  # 허용된 요청 비용 누계
+    throttled_total = Column(BigInteger, nullable=False, default=0)  # 토큰 부족으로 대기한 횟수
+    last_granted = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# Acceptance Criteria:
+# - 버킷 키별 한 행, 토큰 상태와 사용량 누계 보관
+# - 갱신 시각은 epoch 초로 저장하여 dialect와 무관하게 리필 계산
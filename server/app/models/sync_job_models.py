@@ -0,0 +1,63 @@
+"""Sync job queue models
+
+설계 의도:
+- sync_jobs: API가 적재하고 워커가 SKIP LOCKED로 가져가는 영속 동기화 작업 큐
+- 같은 캘린더에 대기 중인 작업은 하나만 유지 (partial unique index)
+- 작업별 상태/시도 횟수/결과를 기록하여 재시작 후에도 작업 유실 없음
+
+"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.types import JSON
+
+from ..core.database import Base
+
+class SyncJobStatus:
+    """sync_jobs.status 값"""
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+# Postgres에서는 UUID, 그 외(테스트용 sqlite)에서는 문자열
+_UUID = String(36).with_variant(UUID(as_uuid=False), 'postgresql')
+
+class SyncJob(Base):
+    """캘린더 동기화 작업"""
+    __tablename__ = 'sync_jobs'
+
+    id = Column(_UUID, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(_UUID, nullable=False)
+    connection_id = Column(_UUID, nullable=False)
+    external_calendar_id = Column(Text, nullable=False)
+    options = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False, default=dict)
+    status = Column(Text, nullable=False, default=SyncJobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    locked_by = Column(Text, nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_sync_jobs_claim', 'status', 'run_after'),
+        Index(
+            'uq_sync_jobs_queued_calendar', 'connection_id', 'external_calendar_id',
+            unique=True,
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'")
+        ),
+    )
+
+# Acceptance Criteria:
+# - 작업은 DB에 영속되어 API/워커 재시작 후에도 유지
+# - 상태 전이: queued → running → succeeded / failed (재시도 시 다시 queued)
+# - 캘린더당 대기 중인 작업은 최대 하나
@@ -0,0 +1,117 @@
+"""Cached calendar list service
+
+설계 의도:
+- 연결별 캘린더 목록을 calendar_list_cache에 저장하고 TTL 동안은 외부 호출 없이 사용
+- TTL이 지나면 저장된 ETag/Last-Modified로 조건부 재검증 (304면 본문 없이 validated_at만 갱신)
+- 조건부 조회를 지원하지 않는 제공자는 전체 목록으로 갱신, 조회 실패 시 이전 목록으로 계속 동작
+
+"""
+import dataclasses
+import logging
+import os
+from typing import Dict, List, Optional
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..integrations.base import (
+    CalendarProvider, CalendarDTO, CacheValidators, CalendarListResult, ProviderError
+)
+from ..integrations.quota import quota_user
+from ..models.calendar_cache_models import CalendarListCache
+from ..models.sync_models import ExternalConnection
+from ..core.security import decrypt_token
+
+logger = logging.getLogger(__name__)
+
+# 캐시된 캘린더 목록을 재검증 없이 사용하는 시간
+CALENDAR_LIST_TTL = timedelta(seconds=int(os.getenv('CALENDAR_LIST_TTL_SECONDS', '3600')))
+
+def _as_utc(dt: datetime) -> datetime:
+    """naive datetime은 UTC로 간주"""
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+class CalendarListService:
+    """연결별 캘린더 목록 캐시 조회/재검증"""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        providers: Dict[str, CalendarProvider],
+        ttl: timedelta = CALENDAR_LIST_TTL
+    ):
+        self.db = db_session
+        self.providers = providers
+        self.ttl = ttl
+
+    async def get_calendars(
+        self,
+        connection: ExternalConnection,
+        force_refresh: bool = False,
+        now: Optional[datetime] = None
+    ) -> List[CalendarDTO]:
+        """캐시가 TTL 안이면 그대로, 아니면 조건부 재검증 후 캘린더 목록 반환"""
+        now = now or datetime.now(timezone.utc)
+        cache = await self.db.get(CalendarListCache, connection.id)
+
+        if cache is not None and not force_refresh and _as_utc(cache.validated_at) + self.ttl > now:
+            return self._decode(cache.calendars)
+
+        provider = self.providers[connection.platform_type]
+        validators = CacheValidators(cache.etag, cache.last_modified) if cache is not None else None
+
+        try:
+            access_token = await decrypt_token(connection.access_token_encrypted, connection.id)
+            list_conditional = getattr(provider, 'list_calendars_conditional', None)
+            with quota_user(connection.user_id):
+                if list_conditional is not None:
+                    result = await list_conditional(access_token, validators)
+                else:
+                    result = CalendarListResult(calendars=await provider.list_calendars(access_token))
+        except ProviderError as e:
+            if cache is None:
+                raise
+            # 일시적 오류는 이전 목록으로 계속 동작 (다음 요청에서 다시 재검증)
+            logger.warning(f"Calendar list revalidation failed for connection {connection.id}, using cached list: {e}")
+            return self._decode(cache.calendars)
+
+        if result.not_modified and cache is not None:
+            cache.validated_at = now
+            await self.db.commit()
+            return self._decode(cache.calendars)
+
+        calendars = result.calendars or []
+        await self._store(connection.id, calendars, result.validators, now)
+        await self.db.commit()
+        return calendars
+
+    async def _store(
+        self,
+        connection_id: str,
+        calendars: List[CalendarDTO],
+        validators: CacheValidators,
+        now: datetime
+    ):
+        """캐시 행 upsert (동시 요청이 같은 연결을 채워도 충돌하지 않음, 커밋은 호출자)"""
+        values = {
+            'calendars': [dataclasses.asdict(calendar) for calendar in calendars],
+            'etag': validators.etag,
+            'last_modified': validators.last_modified,
+            'fetched_at': now,
+            'validated_at': now
+        }
+        insert_fn = insert if self.db.bind.dialect.name == 'postgresql' else sqlite_insert
+        stmt = insert_fn(CalendarListCache).values(connection_id=connection_id, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=[CalendarListCache.connection_id], set_=values)
+        await self.db.execute(stmt)
+
+    def _decode(self, calendars: List[Dict]) -> List[CalendarDTO]:
+        return [CalendarDTO(**calendar) for calendar in calendars]
+
+# Acceptance Criteria:
+# - TTL 안의 캘린더 목록 요청은 외부 API를 호출하지 않음
+# - TTL이 지나면 If-None-Match/If-Modified-Since로 재검증, 304면 목록을 다시 받지 않음
+# - 조건부 조회 미지원 제공자도 같은 캐시를 사용
+# - 재검증 실패 시 캐시된 목록 반환
@@ -0,0 +1,93 @@
+"""Adaptive polling policy for calendar syncs
+
+설계 의도:
+- 캘린더별 변경 빈도(시간당 변경 수)를 EWMA로 추적
+- 자주 바뀌는 캘린더는 짧게, 변경 없는 캘린더는 지수적으로 간격을 늘려 폴링
+- 다음 폴링 시각에 지터를 섞어 같은 시각에 몰리는 thundering herd 방지
+
+"""
+import random
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+
+@dataclass
+class PollingPolicy:
+    """폴링 간격 정책"""
+    min_interval_seconds: int = 5 * 60
+    max_interval_seconds: int = 24 * 60 * 60
+    initial_interval_seconds: int = 15 * 60
+    target_changes_per_poll: float = 1.0  # 폴링 한 번에 기대하는 변경 수
+    ewma_alpha: float = 0.3  # 최근 관측치 가중치
+    backoff_factor: float = 2.0  # 변경이 없을 때 간격 증가 배수
+    jitter_ratio: float = 0.1  # 간격의 ±10% 지터
+
+def update_change_rate(
+    previous_rate: Optional[float],
+    changes: int,
+    elapsed_seconds: float,
+    alpha: float
+) -> float:
+    """관측된 변경 수로 시간당 변경률 EWMA 갱신"""
+    elapsed_hours = max(elapsed_seconds, 1.0) / 3600
+    observed = changes / elapsed_hours
+    if previous_rate is None:
+        return observed
+    return alpha * observed + (1 - alpha) * previous_rate
+
+def next_poll_interval(
+    policy: PollingPolicy,
+    change_rate: float,
+    previous_interval: Optional[int],
+    changes: int
+) -> int:
+    """다음 폴링까지 간격(초) 계산 (지터 제외)
+    
+    변경이 있으면 변경률로부터 목표 변경 수에 맞는 간격을 계산하고,
+    변경이 없으면 이전 간격을 backoff_factor배로 늘림
+    """
+    if changes > 0 and change_rate > 0:
+        interval = policy.target_changes_per_poll / change_rate * 3600
+    else:
+        interval = (previous_interval or policy.initial_interval_seconds) * policy.backoff_factor
+    return int(min(max(interval, policy.min_interval_seconds), policy.max_interval_seconds))
+
+def jittered_due_at(now: datetime, interval_seconds: int, jitter_ratio: float) -> datetime:
+    """지터를 섞은 다음 폴링 시각"""
+    jitter = random.uniform(1 - jitter_ratio, 1 + jitter_ratio)
+    return now + timedelta(seconds=interval_seconds * jitter)
+
+def _has_active_watch(sync_state, now: datetime) -> bool:
+    """유효한 변경 알림 채널 존재 여부"""
+    expires_at = getattr(sync_state, 'watch_expires_at', None)
+    if not getattr(sync_state, 'watch_channel_id', None) or expires_at is None:
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at > now
+
+def record_poll(sync_state, changes: int, now: datetime, policy: PollingPolicy):
+    """동기화 완료 후 sync_state의 변경률과 다음 폴링 시각 갱신 (커밋은 호출자, now는 UTC aware)"""
+    last_polled_at = sync_state.last_polled_at
+    if last_polled_at is not None and last_polled_at.tzinfo is None:
+        last_polled_at = last_polled_at.replace(tzinfo=timezone.utc)
+    elapsed = (
+        (now - last_polled_at).total_seconds()
+        if last_polled_at else policy.initial_interval_seconds
+    )
+    rate = update_change_rate(sync_state.change_rate, changes, elapsed, policy.ewma_alpha)
+    interval = next_poll_interval(policy, rate, sync_state.poll_interval_seconds, changes)
+    if _has_active_watch(sync_state, now):
+        # 변경 알림 채널이 살아 있으면 폴링은 누락 대비용으로만 최대 간격 사용
+        interval = policy.max_interval_seconds
+    
+    sync_state.change_rate = rate
+    sync_state.poll_interval_seconds = interval
+    sync_state.last_polled_at = now
+    sync_state.next_sync_due_at = jittered_due_at(now, interval, policy.jitter_ratio)
+
+# Acceptance Criteria:
+# - 변경이 잦은 캘린더일수록 짧은 폴링 간격 (min_interval 하한)
+# - 변경이 없는 캘린더는 지수 백오프로 max_interval까지 간격 증가
+# - 다음 폴링 시각은 지터로 분산
+# - 변경 알림 채널이 있는 캘린더는 최대 간격으로만 폴링
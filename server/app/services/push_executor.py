@@ -0,0 +1,104 @@
+"""Order-preserving concurrent push executor
+
+설계 의도:
+- 서로 다른 이벤트의 push는 동시에 실행하되 동시 실행 수는 제한 (외부 API 부하 제어)
+- 같은 이벤트(local_id 또는 external_event_id가 겹치는 작업)는 요청 순서대로 실행 (create → update → delete)
+- batch 제공자는 같은 이벤트가 한 batch에 두 번 들어가지 않도록 순번별 wave로 나눠 전송
+- 결과는 항상 요청 순서로 반환
+
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+def group_ordered_chains(items: List[T], keys: Callable[[T], Iterable[Optional[str]]]) -> List[List[int]]:
+    """키를 하나라도 공유하는 작업끼리 묶은 체인 목록 (체인 안은 요청 순서의 인덱스)"""
+    parent = list(range(len(items)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    owner: Dict[str, int] = {}
+    for index, item in enumerate(items):
+        for key in keys(item):
+            if key is None:
+                continue
+            if key in owner:
+                parent[find(index)] = find(owner[key])
+            else:
+                owner[key] = index
+
+    chains: Dict[int, List[int]] = {}
+    for index in range(len(items)):
+        chains.setdefault(find(index), []).append(index)
+    return list(chains.values())
+
+class PushExecutor:
+    """같은 이벤트 순서를 지키는 제한 동시성 실행기"""
+
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def run(
+        self,
+        items: List[T],
+        keys: Callable[[T], Iterable[Optional[str]]],
+        handler: Callable[[T], Awaitable[R]],
+        on_error: Callable[[T, Exception], R]
+    ) -> List[R]:
+        """작업마다 handler 실행, 예외는 on_error 결과로 변환 (요청 순서로 반환)"""
+        results: List[Optional[R]] = [None] * len(items)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_chain(chain: List[int]):
+            for index in chain:
+                # 작업 단위로 슬롯을 잡아 긴 체인이 슬롯을 독점하지 않게 함
+                async with semaphore:
+                    try:
+                        results[index] = await handler(items[index])
+                    except Exception as e:
+                        results[index] = on_error(items[index], e)
+
+        await asyncio.gather(*[run_chain(chain) for chain in group_ordered_chains(items, keys)])
+        return results
+
+    async def run_batched(
+        self,
+        items: List[T],
+        keys: Callable[[T], Iterable[Optional[str]]],
+        batch_handler: Callable[[List[T]], Awaitable[List[R]]]
+    ) -> List[R]:
+        """
+        체인 안 순번별 wave로 나눠 batch_handler 실행
+
+        n번째 wave에는 각 체인의 n번째 작업만 들어가므로 한 batch 안에 같은 이벤트가 없고,
+        wave는 순서대로 실행되어 같은 이벤트의 작업 순서가 유지됨
+        """
+        results: List[Optional[R]] = [None] * len(items)
+        waves: List[List[int]] = []
+        for chain in group_ordered_chains(items, keys):
+            for position, index in enumerate(chain):
+                if position == len(waves):
+                    waves.append([])
+                waves[position].append(index)
+
+        for wave in waves:
+            wave.sort()
+            wave_results = await batch_handler([items[index] for index in wave])
+            for index, result in zip(wave, wave_results):
+                results[index] = result
+        return results
+
+# Acceptance Criteria:
+# - 독립적인 이벤트 push는 max_concurrency까지 동시 실행
+# - local_id/external_event_id를 공유하는 작업은 요청 순서대로 실행
+# - batch 실행 시 한 batch에 같은 이벤트가 중복되지 않음
+# - 결과는 요청 순서와 동일
@@ -0,0 +1,81 @@
+"""Shared provider quota store (provider_quota_buckets)
+
+설계 의도:
+- integrations.quota의 QuotaStore 구현 중 DB가 필요한 공유 저장소는 서비스 계층에 둠
+- QuotaLimiter.use_store로 주입하며, integrations만 import하는 프로세스(파싱 작업자 등)는 DB 계층을 불러오지 않음
+- 리필과 차감은 INSERT ... ON CONFLICT DO UPDATE 한 문장에서 원자적으로 처리
+- 비용: take 한 번이 세션 하나와 커밋 하나. QuotaLimiter는 버킷마다 take를 부르므로
+  사용자별 한도를 켜면 제공자 호출 하나에 DB 트랜잭션이 두 번 (사용자 버킷 → 제공자 전체 버킷)
+- 두 버킷은 원자적으로 함께 차감되지 않음: 사용자 버킷에서 받은 토큰은 제공자 전체 버킷을
+  max_wait 안에 받지 못해도 돌려주지 않음 (그 사용자 자신의 버킷만 줄고 다른 사용자에는 영향 없음)
+
+"""
+from typing import List
+
+from sqlalchemy import select, case
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..integrations.quota import BucketUsage, refill_tokens
+from ..models.quota_models import ProviderQuotaBucket
+
+class PostgresQuotaStore:
+    """provider_quota_buckets 테이블 기반 공유 토큰 버킷 (워커/레플리카 간 공유)"""
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    async def take(self, key: str, cost: int, rate: float, burst: int, now: float) -> float:
+        bucket = ProviderQuotaBucket.__table__.c
+        need = min(cost, burst)
+
+        # ON CONFLICT SET 식은 모두 기존 행 기준으로 계산됨 (리필 → 차감을 한 문장에서 원자적으로)
+        elapsed = case((bucket.refilled_at < now, now - bucket.refilled_at), else_=0.0)
+        refilled = case(
+            (bucket.tokens + elapsed * rate > burst, float(burst)),
+            else_=bucket.tokens + elapsed * rate
+        )
+        granted = refilled >= need
+
+        async with self.session_factory() as session:
+            insert_fn = insert if session.bind.dialect.name == 'postgresql' else sqlite_insert
+            stmt = insert_fn(ProviderQuotaBucket).values(
+                bucket_key=key, tokens=float(burst - cost), refilled_at=now,
+                rate_per_second=rate, burst=burst,
+                granted_total=cost, throttled_total=0, last_granted=True
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProviderQuotaBucket.bucket_key],
+                set_={
+                    'tokens': case((granted, refilled - cost), else_=refilled),
+                    'refilled_at': now,
+                    'rate_per_second': rate,
+                    'burst': burst,
+                    'granted_total': bucket.granted_total + case((granted, cost), else_=0),
+                    'throttled_total': bucket.throttled_total + case((granted, 0), else_=1),
+                    'last_granted': granted
+                }
+            ).returning(ProviderQuotaBucket.tokens, ProviderQuotaBucket.last_granted)
+            tokens, was_granted = (await session.execute(stmt)).one()
+            await session.commit()
+
+        if was_granted:
+            return 0.0
+        return (need - tokens) / rate
+
+    async def snapshot(self, now: float) -> List[BucketUsage]:
+        async with self.session_factory() as session:
+            rows = (await session.execute(select(ProviderQuotaBucket))).scalars().all()
+        return [
+            BucketUsage(
+                row.bucket_key, refill_tokens(row.tokens, row.refilled_at, row.rate_per_second, row.burst, now),
+                row.rate_per_second, row.burst, row.granted_total, row.throttled_total
+            )
+            for row in rows
+        ]
+
+# Acceptance Criteria:
+# - 모든 워커와 레플리카가 같은 버킷을 공유 (리필/차감은 한 문장으로 원자적)
+# - 토큰이 부족하면 다음 토큰까지 남은 시간 반환
+# - 버킷별 남은 토큰과 허용/대기 누계 조회 가능
@@ -0,0 +1,327 @@
+"""Durable sync job queue
+
+설계 의도:
+- SyncJobQueue Protocol로 큐 구현 교체 가능, 기본은 Postgres sync_jobs 테이블
+- API는 적재(enqueue)만 하고, 워커가 SKIP LOCKED로 가져가(claim) 실행 후 결과 기록
+- 실패한 작업은 max_attempts까지 지수 백오프로 다시 queued 상태로 전환
+- 다른 노드가 같은 캘린더를 동기화 중이라 실행하지 못한 작업은 시도 횟수를 쓰지 않고 미뤄서 재적재
+- 적재는 multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번, 대기 중 작업에 온 전체 동기화 요청은 옵션에 반영
+
+"""
+import logging
+import random
+from typing import Protocol, List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, asdict, fields
+
+from sqlalchemy import select, update, and_, exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker, aliased
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..models.sync_job_models import SyncJob, SyncJobStatus
+from .sync_service import SyncOptions
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SyncJobRequest:
+    """적재할 동기화 작업"""
+    user_id: str
+    connection_id: str
+    external_calendar_id: str
+    options: SyncOptions = field(default_factory=SyncOptions)
+
+@dataclass
+class ClaimedSyncJob:
+    """워커가 가져간 동기화 작업"""
+    job_id: str
+    user_id: str
+    connection_id: str
+    external_calendar_id: str
+    options: SyncOptions
+    attempts: int
+
+def serialize_options(options: SyncOptions) -> Dict[str, Any]:
+    """SyncOptions를 JSON 저장용 dict로 변환"""
+    return asdict(options)
+
+def deserialize_options(data: Optional[Dict[str, Any]]) -> SyncOptions:
+    """저장된 dict를 SyncOptions로 복원 (알 수 없는 키는 무시)"""
+    known = {f.name for f in fields(SyncOptions)}
+    return SyncOptions(**{k: v for k, v in (data or {}).items() if k in known})
+
+class SyncJobQueue(Protocol):
+    """동기화 작업 큐 인터페이스"""
+    
+    async def enqueue(self, jobs: List[SyncJobRequest]) -> List[Optional[str]]:
+        """작업 적재, 작업별 job ID 반환 (이미 대기 중인 캘린더는 None)"""
+        ...
+    
+    async def claim(self, worker_id: str, limit: int) -> List[ClaimedSyncJob]:
+        """실행 가능한 작업을 최대 limit개 가져가 running으로 전환"""
+        ...
+    
+    async def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """작업 성공 기록"""
+        ...
+    
+    async def fail(self, job_id: str, error: str) -> None:
+        """작업 실패 기록 (재시도 가능하면 다시 적재)"""
+        ...
+    
+    async def defer(self, job_id: str, reason: str) -> None:
+        """실행하지 못한 작업을 시도 횟수 차감 없이 잠시 뒤로 미뤄 다시 적재"""
+        ...
+    
+    async def requeue_stale(self, older_than: timedelta) -> int:
+        """죽은 워커가 잡고 있던 running 작업을 다시 적재"""
+        ...
+    
+    async def get_job(self, job_id: str) -> Optional[SyncJob]:
+        """작업 상태 조회"""
+        ...
+
+class PostgresSyncJobQueue:
+    """sync_jobs 테이블 기반 큐 (기본 구현)"""
+    
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 30.0
+    ):
+        self.session_factory = session_factory
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+    
+    async def enqueue(self, jobs: List[SyncJobRequest]) -> List[Optional[str]]:
+        """작업 적재 (캘린더당 queued 작업은 하나만 유지)
+        
+        이미 대기 중인 캘린더에 force_full 요청이 오면 대기 중 작업의 옵션을 새 요청 옵션으로 교체
+        """
+        if not jobs:
+            return []
+        
+        # 같은 요청 안에서 겹치는 캘린더는 처음 작업만 적재 (뒤 작업의 force_full은 합침)
+        first_index: Dict[Tuple[str, str], int] = {}
+        values: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        now = datetime.utcnow()
+        for index, job in enumerate(jobs):
+            key = (job.connection_id, job.external_calendar_id)
+            options = serialize_options(job.options)
+            if key in values:
+                if options['force_full'] and not values[key]['options']['force_full']:
+                    values[key]['options'] = options
+                continue
+            first_index[key] = index
+            values[key] = {
+                'user_id': job.user_id,
+                'connection_id': job.connection_id,
+                'external_calendar_id': job.external_calendar_id,
+                'options': options,
+                'status': SyncJobStatus.QUEUED,
+                'max_attempts': self.max_attempts,
+                'run_after': now
+            }
+        
+        async with self.session_factory() as session:
+            insert_fn = insert if session.bind.dialect.name == 'postgresql' else sqlite_insert
+            stmt = insert_fn(SyncJob).values(list(values.values())).on_conflict_do_nothing(
+                index_elements=['connection_id', 'external_calendar_id'],
+                index_where=SyncJob.status == SyncJobStatus.QUEUED
+            ).returning(SyncJob.id, SyncJob.connection_id, SyncJob.external_calendar_id)
+            inserted = {
+                (row.connection_id, row.external_calendar_id): row.id
+                for row in (await session.execute(stmt)).all()
+            }
+            
+            # 이미 대기 중인 캘린더의 전체 동기화 요청은 대기 중 작업이 전체 동기화하도록 올림
+            for key, value in values.items():
+                if key in inserted or not value['options']['force_full']:
+                    continue
+                await session.execute(
+                    update(SyncJob).where(
+                        and_(
+                            SyncJob.connection_id == value['connection_id'],
+                            SyncJob.external_calendar_id == value['external_calendar_id'],
+                            SyncJob.status == SyncJobStatus.QUEUED
+                        )
+                    ).values(options=value['options']).execution_options(synchronize_session=False)
+                )
+            
+            await session.commit()
+        
+        return [
+            inserted.get(key) if first_index[key] == index else None
+            for index, key in enumerate((job.connection_id, job.external_calendar_id) for job in jobs)
+        ]
+    
+    async def claim(self, worker_id: str, limit: int) -> List[ClaimedSyncJob]:
+        """FOR UPDATE SKIP LOCKED로 다른 워커와 겹치지 않게 작업 획득"""
+        now = datetime.utcnow()
+        
+        async with self.session_factory() as session:
+            claimable = select(SyncJob.id).where(
+                and_(
+                    SyncJob.status == SyncJobStatus.QUEUED,
+                    SyncJob.run_after <= now
+                )
+            ).order_by(SyncJob.run_after).limit(limit).with_for_update(skip_locked=True)
+            
+            stmt = update(SyncJob).where(
+                SyncJob.id.in_(claimable.scalar_subquery())
+            ).values(
+                status=SyncJobStatus.RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+                started_at=now,
+                attempts=SyncJob.attempts + 1
+            ).returning(
+                SyncJob.id, SyncJob.user_id, SyncJob.connection_id,
+                SyncJob.external_calendar_id, SyncJob.options, SyncJob.attempts
+            ).execution_options(synchronize_session=False)
+            
+            rows = (await session.execute(stmt)).all()
+            await session.commit()
+        
+        return [
+            ClaimedSyncJob(
+                job_id=row.id,
+                user_id=row.user_id,
+                connection_id=row.connection_id,
+                external_calendar_id=row.external_calendar_id,
+                options=deserialize_options(row.options),
+                attempts=row.attempts
+            )
+            for row in rows
+        ]
+    
+    async def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """작업 성공 기록"""
+        async with self.session_factory() as session:
+            await session.execute(
+                update(SyncJob).where(SyncJob.id == job_id).values(
+                    status=SyncJobStatus.SUCCEEDED,
+                    finished_at=datetime.utcnow(),
+                    locked_by=None,
+                    last_error=None,
+                    result=result
+                ).execution_options(synchronize_session=False)
+            )
+            await session.commit()
+    
+    async def fail(self, job_id: str, error: str) -> None:
+        """작업 실패 기록, 시도 횟수가 남았으면 백오프 후 재적재"""
+        async with self.session_factory() as session:
+            job = (await session.execute(
+                select(SyncJob).where(SyncJob.id == job_id).with_for_update()
+            )).scalar_one_or_none()
+            if job is None:
+                return
+            
+            job.last_error = error
+            job.locked_by = None
+            job.finished_at = datetime.utcnow()
+            
+            if job.attempts < job.max_attempts:
+                delay = self.retry_base_seconds * (2 ** (job.attempts - 1))
+                job.status = SyncJobStatus.QUEUED
+                job.run_after = datetime.utcnow() + timedelta(seconds=delay + random.uniform(0, delay / 2))
+            else:
+                job.status = SyncJobStatus.FAILED
+            
+            try:
+                await session.commit()
+            except IntegrityError:
+                # 그 사이 같은 캘린더 작업이 새로 적재됨 → 이 작업은 실패로 종료
+                await session.rollback()
+                await session.execute(
+                    update(SyncJob).where(SyncJob.id == job_id).values(
+                        status=SyncJobStatus.FAILED,
+                        locked_by=None,
+                        finished_at=datetime.utcnow(),
+                        last_error=error
+                    ).execution_options(synchronize_session=False)
+                )
+                await session.commit()
+    
+    async def defer(self, job_id: str, reason: str) -> None:
+        """다른 노드가 같은 캘린더를 동기화 중이라 실행하지 못한 작업을 시도 횟수 차감 없이 재적재"""
+        delay = random.uniform(self.retry_base_seconds / 2, self.retry_base_seconds)
+        async with self.session_factory() as session:
+            stmt = update(SyncJob).where(
+                and_(
+                    SyncJob.id == job_id,
+                    SyncJob.status == SyncJobStatus.RUNNING
+                )
+            ).values(
+                status=SyncJobStatus.QUEUED,
+                attempts=SyncJob.attempts - 1,  # claim에서 올린 시도 횟수 되돌림
+                run_after=datetime.utcnow() + timedelta(seconds=delay),
+                locked_by=None,
+                last_error=reason
+            ).execution_options(synchronize_session=False)
+            try:
+                await session.execute(stmt)
+                await session.commit()
+            except IntegrityError:
+                # 그 사이 같은 캘린더 작업이 새로 적재됨 → 그 작업이 대신 처리
+                await session.rollback()
+                await session.execute(
+                    update(SyncJob).where(SyncJob.id == job_id).values(
+                        status=SyncJobStatus.FAILED,
+                        locked_by=None,
+                        finished_at=datetime.utcnow(),
+                        last_error=reason
+                    ).execution_options(synchronize_session=False)
+                )
+                await session.commit()
+    
+    async def requeue_stale(self, older_than: timedelta) -> int:
+        """locked_at이 오래된 running 작업을 다시 queued로 전환"""
+        cutoff = datetime.utcnow() - older_than
+        queued = aliased(SyncJob)
+        
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(SyncJob).where(
+                    and_(
+                        SyncJob.status == SyncJobStatus.RUNNING,
+                        SyncJob.locked_at < cutoff,
+                        # 같은 캘린더가 이미 대기 중이면 그 작업이 대신 처리
+                        ~exists().where(
+                            and_(
+                                queued.status == SyncJobStatus.QUEUED,
+                                queued.connection_id == SyncJob.connection_id,
+                                queued.external_calendar_id == SyncJob.external_calendar_id
+                            )
+                        )
+                    )
+                ).values(
+                    status=SyncJobStatus.QUEUED,
+                    locked_by=None,
+                    run_after=datetime.utcnow()
+                ).execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            
+        if result.rowcount:
+            logger.warning(f"Requeued {result.rowcount} stale sync jobs")
+        return result.rowcount
+    
+    async def get_job(self, job_id: str) -> Optional[SyncJob]:
+        """작업 상태 조회"""
+        async with self.session_factory() as session:
+            return (await session.execute(
+                select(SyncJob).where(SyncJob.id == job_id)
+            )).scalar_one_or_none()
+
+# Acceptance Criteria:
+# - API는 작업 적재만 하므로 응답 지연과 동기화 처리량이 독립적으로 확장
+# - SKIP LOCKED로 여러 워커/레플리카가 같은 작업을 중복 실행하지 않음
+# - 재시작에도 작업이 유실되지 않고, 죽은 워커의 작업은 재적재
+# - lease 경합으로 실행하지 못한 작업은 시도 횟수를 쓰지 않고 잠시 뒤 재시도
+# - 대기 중 작업에 온 force_full 요청은 버려지지 않고 대기 중 작업에 반영
+# - Protocol로 다른 큐 백엔드로 교체 가능
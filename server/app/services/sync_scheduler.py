@@ -0,0 +1,114 @@
+"""Adaptive sync scheduler
+
+설계 의도:
+- 클라이언트 /pull 요청 없이도 next_sync_due_at이 도래한 캘린더를 주기적으로 작업 큐에 적재
+- 여러 스케줄러 인스턴스가 떠 있어도 SKIP LOCKED로 같은 캘린더를 중복 적재하지 않음
+- 적재한 캘린더는 claim_timeout 뒤로 미뤄두고, 동기화가 끝나면 polling_policy가 실제 다음 시각을 기록
+
+"""
+import asyncio
+import logging
+from typing import Optional
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.orm import sessionmaker
+
+from ..models.sync_models import SyncState, ExternalConnection
+from .polling_policy import PollingPolicy
+from .sync_queue import SyncJobQueue, SyncJobRequest, PostgresSyncJobQueue
+from .sync_service import SyncOptions
+
+logger = logging.getLogger(__name__)
+
+class SyncScheduler:
+    """next_sync_due_at 기반 캘린더 폴링 스케줄러"""
+    
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        queue: Optional[SyncJobQueue] = None,
+        policy: Optional[PollingPolicy] = None,
+        tick_seconds: float = 30.0,
+        batch_size: int = 200,
+        claim_timeout: timedelta = timedelta(minutes=30)
+    ):
+        self.session_factory = session_factory
+        self.queue = queue or PostgresSyncJobQueue(session_factory)
+        self.policy = policy or PollingPolicy()
+        self.tick_seconds = tick_seconds
+        self.batch_size = batch_size
+        self.claim_timeout = claim_timeout
+    
+    async def run(self, stop_event: Optional[asyncio.Event] = None):
+        """stop_event가 설정될 때까지 tick_seconds마다 도래한 캘린더 적재"""
+        stop_event = stop_event or asyncio.Event()
+        logger.info("Sync scheduler started")
+        
+        while not stop_event.is_set():
+            try:
+                # 한 번에 batch_size를 다 채우면 밀린 캘린더가 있으므로 바로 이어서 처리
+                while await self.schedule_due() >= self.batch_size:
+                    pass
+            except Exception as e:
+                logger.error(f"Sync scheduler tick failed: {e}")
+            
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.tick_seconds)
+            except asyncio.TimeoutError:
+                pass
+        
+        logger.info("Sync scheduler stopped")
+    
+    async def schedule_due(self, now: Optional[datetime] = None) -> int:
+        """도래한 캘린더를 작업 큐에 적재, 적재 대상 수 반환"""
+        now = now or datetime.utcnow()
+        
+        async with self.session_factory() as session:
+            due_query = select(
+                SyncState.id, SyncState.user_id, SyncState.connection_id, SyncState.external_calendar_id
+            ).join(
+                ExternalConnection, ExternalConnection.id == SyncState.connection_id
+            ).where(
+                and_(
+                    ExternalConnection.sync_enabled == True,
+                    or_(
+                        SyncState.next_sync_due_at.is_(None),
+                        SyncState.next_sync_due_at <= now
+                    )
+                )
+            ).order_by(
+                SyncState.next_sync_due_at.asc().nulls_first()
+            ).limit(self.batch_size).with_for_update(skip_locked=True, of=SyncState)
+            
+            due = (await session.execute(due_query)).all()
+            if not due:
+                return 0
+            
+            # 작업이 끝나기 전에 다시 적재되지 않도록 미뤄둠 (완료 시 polling_policy가 덮어씀)
+            await session.execute(
+                update(SyncState).where(
+                    SyncState.id.in_([row.id for row in due])
+                ).values(
+                    next_sync_due_at=now + self.claim_timeout
+                ).execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        
+        await self.queue.enqueue([
+            SyncJobRequest(
+                user_id=row.user_id,
+                connection_id=row.connection_id,
+                external_calendar_id=row.external_calendar_id,
+                options=SyncOptions()
+            )
+            for row in due
+        ])
+        
+        logger.info(f"Scheduled {len(due)} due calendar syncs")
+        return len(due)
+
+# Acceptance Criteria:
+# - next_sync_due_at이 지난(또는 아직 없는) 활성 캘린더만 적재
+# - 다중 인스턴스에서도 SKIP LOCKED와 due 시각 선점으로 중복 적재 방지
+# - 실제 폴링 간격은 동기화 완료 시 변경률 기반으로 결정 (polling_policy)
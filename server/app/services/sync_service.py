@@ -3,37 +3,69 @@
 설계 의도:
 - 증분 동기화 (delta token) 우선, fallback으로 윈도우 동기화
 - 충돌 해결은 external_version/updated_at 비교로 Last-Write-Wins
-- 재시도 정책으로 일시적 오류 처리, 백오프+지터
+- 일시적 오류 재시도는 제공자 HTTP 계층의 재시도 정책에 맡기고, 서비스는 토큰 만료만 복구
+- 만료가 다가온 access token은 시작 전에 갱신, 동기화 중 401은 한 번 갱신 후 같은 페이지부터 계속
 
 """
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+import os
+import socket
+import uuid
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator, Awaitable, Callable
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass
-import random
+from dataclasses import dataclass, field
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_, or_
+from sqlalchemy.orm import sessionmaker, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import select, update, and_, or_, case, literal, literal_column, true, union_all
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from ..integrations.base import CalendarProvider, CalendarEventDTO, ProviderError, RateLimitError
-from ..integrations.google_provider import GoogleCalendarProvider
-from ..integrations.naver_provider import NaverCalendarProvider  
-from ..integrations.kakao_provider import KakaoCalendarProvider
+from ..integrations.base import (
+    CalendarProvider, CalendarEventDTO, ProviderError, RateLimitError, AuthenticationError,
+    TransientProviderError, CircuitOpenError,
+    SyncResult as ProviderSyncResult
+)
+from ..integrations.registry import get_provider_registry
+from ..integrations.quota import quota_user
 from ..models.sync_models import SyncState, ExternalConnection, Event
 from ..core.security import decrypt_token
+from ..core.single_flight import SingleFlight
+from .polling_policy import PollingPolicy, record_poll
+from .token_refresh_service import TokenRefreshService
 
 logger = logging.getLogger(__name__)
 
+# 이 프로세스의 lease 소유자 식별자 (레플리카/워커 간 캘린더 동기화 배타 제어)
+NODE_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+# 프로세스 내 같은 캘린더 동시 동기화 합류 (connection_id, external_calendar_id) 키
+_calendar_sync_flights = SingleFlight()
+
+# events upsert 충돌 키 (idx_events_sync_lookup, 002 마이그레이션에서 unique로 변경)
+_SYNC_LOOKUP_KEY = ('user_id', 'source_platform', 'external_calendar_id', 'external_event_id')
+
+# 내용이 같아도 항상 앞당기는 원격 버전 컬럼 (다음 조건부 요청/LWW 비교 기준)
+_VERSION_COLUMNS = ('external_updated_at', 'external_version')
+
+def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """naive datetime은 UTC로 간주하여 aware로 정규화"""
+    if dt is None or dt.tzinfo is not None:
+        return dt
+    return dt.replace(tzinfo=timezone.utc)
+
 @dataclass
 class SyncOptions:
     """동기화 옵션"""
     force_full: bool = False
     window_days_past: int = 90
     window_days_future: int = 180
-    max_retries: int = 3
     batch_size: int = 100
+    max_pages: Optional[int] = None  # 한 번 실행에서 처리할 최대 페이지 수 (나머지는 체크포인트로 이어서)
+    max_concurrency: int = 4  # 연결 단위 동기화 시 동시에 동기화할 캘린더 수
+    lease_seconds: int = 300  # 캘린더 lease 유지 시간 (페이지마다 갱신)
 
 @dataclass 
 class SyncResult:
@@ -46,115 +78,397 @@ class SyncResult:
     error_message: Optional[str] = None
     next_delta_token: Optional[str] = None
     last_updated_at: Optional[datetime] = None
+    has_more: bool = False  # 체크포인트에서 이어서 동기화할 페이지가 남음
+    resumed: bool = False  # 이전 체크포인트에서 재개됨
+    events_unchanged: int = 0  # 내용이 같거나 더 오래된 버전이라 쓰지 않은 이벤트
+    events_fetched: int = 0  # 이번 실행에서 받은 이벤트 (체크포인트 재개 시 이전 실행분 제외)
+    bytes_transferred: int = 0  # 이번 실행에서 받은 이벤트 응답 바이트 (압축 상태)
+    network_seconds: float = 0.0  # 제공자 응답 수신 대기 시간 합
+    parse_seconds: float = 0.0  # 응답 디코딩/DTO 변환 시간 합
+    busy: bool = False  # 다른 노드가 같은 캘린더를 동기화 중이라 실행하지 않음
+    
+    @property
+    def bytes_per_event(self) -> Optional[float]:
+        """이번 실행의 이벤트당 평균 수신 바이트 (받은 이벤트가 없으면 None)"""
+        if not self.events_fetched:
+            return None
+        return self.bytes_transferred / self.events_fetched
+
+@dataclass
+class ConnectionSyncResult:
+    """연결 단위 동기화 결과 (캘린더별 결과 집계)"""
+    connection_id: str
+    success: bool
+    calendars: Dict[str, SyncResult] = field(default_factory=dict)
+    error_message: Optional[str] = None
+    
+    @property
+    def events_processed(self) -> int:
+        return sum(r.events_processed for r in self.calendars.values())
+    
+    @property
+    def events_created(self) -> int:
+        return sum(r.events_created for r in self.calendars.values())
+    
+    @property
+    def events_updated(self) -> int:
+        return sum(r.events_updated for r in self.calendars.values())
+    
+    @property
+    def events_deleted(self) -> int:
+        return sum(r.events_deleted for r in self.calendars.values())
+    
+    @property
+    def events_unchanged(self) -> int:
+        return sum(r.events_unchanged for r in self.calendars.values())
+    
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(r.bytes_transferred for r in self.calendars.values())
+
+def build_default_providers() -> Dict[str, CalendarProvider]:
+    """기본 캘린더 제공자 (프로세스 전역 ProviderRegistry의 공유 인스턴스)"""
+    return get_provider_registry().providers
 
 class CalendarSyncService:
     """캘린더 동기화 서비스"""
     
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        providers: Optional[Dict[str, CalendarProvider]] = None,
+        session_factory: Optional[sessionmaker] = None
+    ):
         self.db = db_session
+        # 동시 동기화 태스크마다 별도 세션을 열기 위한 팩토리
+        self.session_factory = session_factory or sessionmaker(
+            db_session.bind, class_=AsyncSession, expire_on_commit=False
+        )
+        self.polling_policy = PollingPolicy()
         self.providers: Dict[str, CalendarProvider] = {}
-        self._setup_providers()
+        if providers is not None:
+            self.providers = providers
+        else:
+            self._setup_providers()
+        self.tokens = TokenRefreshService(self.session_factory, self.providers)
     
     def _setup_providers(self):
-        """캘린더 제공자 초기화"""
-        # TODO: 설정에서 client credentials 로드
-        self.providers = {
-            'google': GoogleCalendarProvider('client_id', 'client_secret'),
-            'naver': NaverCalendarProvider('client_id', 'client_secret'),
-            'kakao': KakaoCalendarProvider('client_id', 'client_secret')
-        }
+        """캘린더 제공자 초기화 (요청마다 새로 만들지 않고 공유 레지스트리 사용)"""
+        self.providers = build_default_providers()
     
     async def sync_calendar(
         self,
         user_id: str,
         connection_id: str,
         external_calendar_id: str,
-        options: Optional[SyncOptions] = None
+        options: Optional[SyncOptions] = None,
+        access_token: Optional[str] = None
     ) -> SyncResult:
-        """단일 캘린더 동기화 실행"""
+        """단일 캘린더 동기화 실행
+        
+        같은 캘린더의 동기화가 이 프로세스에서 이미 진행 중이면 새로 시작하지 않고
+        그 실행에 합류하여 같은 SyncResult를 받음 (single-flight).
+        access_token을 넘기면 복호화를 건너뜀 (연결 단위 동기화에서 한 번만 복호화)
+        제공자 호출은 user_id의 사용자별 쿼터 버킷에 집계됨
+        """
+        with quota_user(user_id):
+            return await _calendar_sync_flights.run(
+                (connection_id, external_calendar_id),
+                lambda: self._sync_calendar(
+                    user_id, connection_id, external_calendar_id, options, access_token
+                )
+            )
+    
+    async def _sync_calendar(
+        self,
+        user_id: str,
+        connection_id: str,
+        external_calendar_id: str,
+        options: Optional[SyncOptions],
+        access_token: Optional[str]
+    ) -> SyncResult:
+        """단일 캘린더 동기화 본체"""
         if options is None:
             options = SyncOptions()
         
+        lease_state_id = None
         try:
-            # 연결 정보 조회
-            connection = await self._get_connection(connection_id, user_id)
+            # 연결 조회 + 동기화 상태 조회/생성 + lease 획득 (postgres는 한 문장)
+            connection, sync_state = await self._begin_calendar_sync(
+                user_id, connection_id, external_calendar_id, options.lease_seconds
+            )
             if not connection or not connection.sync_enabled:
+                await self.db.rollback()
                 return SyncResult(success=False, events_processed=0, events_created=0, 
                                 events_updated=0, events_deleted=0, 
                                 error_message="Connection disabled or not found")
             
+            # 다른 노드가 같은 캘린더를 동기화 중이면 건너뜀
+            if sync_state is None:
+                await self.db.rollback()
+                return SyncResult(success=False, events_processed=0, events_created=0,
+                                events_updated=0, events_deleted=0,
+                                error_message="Calendar sync already in progress on another node",
+                                busy=True)
+            lease_state_id = sync_state.id
+            
             # 제공자 가져오기
             provider = self.providers.get(connection.platform_type)
             if not provider:
+                await self.db.rollback()
                 return SyncResult(success=False, events_processed=0, events_created=0,
                                 events_updated=0, events_deleted=0,
                                 error_message=f"Provider {connection.platform_type} not found")
             
-            # 액세스 토큰 복호화
-            access_token = await decrypt_token(connection.access_token_encrypted, connection_id)
-            
-            # 동기화 상태 조회/생성
-            sync_state = await self._get_or_create_sync_state(
-                user_id, connection_id, external_calendar_id
-            )
+            # 액세스 토큰 복호화 (만료가 다가왔으면 먼저 갱신)
+            if access_token is None:
+                access_token = await self._access_token(connection)
             
             # 동기화 창 결정
             since, until = self._calculate_sync_window(options)
             
             # 증분 vs 윈도우 동기화 결정
-            use_delta = (
+            use_delta = bool(
                 not options.force_full and 
                 provider.capabilities.delta and
                 sync_state.delta_token
             )
             
-            # 재시도 로직으로 이벤트 가져오기
-            fetch_result = await self._fetch_events_with_retry(
-                provider, access_token, external_calendar_id,
-                since, until, sync_state, use_delta, options.max_retries
-            )
+            counts = {'processed': 0, 'created': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+            next_delta_token = None
+            max_updated_at = None
+            page_token = None
             
-            if not fetch_result.success:
-                await self._update_connection_error(connection_id, fetch_result.error_message)
-                return fetch_result
-            
-            # fetch_result에서 실제 이벤트 데이터 추출
-            events_to_process = getattr(fetch_result, 'events', [])
-            
-            # 로컬 DB에 이벤트 적용
-            upsert_result = await self._upsert_events(
-                user_id, connection.platform_type, external_calendar_id,
-                events_to_process, options.batch_size
-            )
+            # 같은 모드로 중단된 동기화가 있으면 체크포인트부터 재개
+            resumed = bool(sync_state.checkpoint_page_token) and sync_state.checkpoint_delta == use_delta
+            if resumed:
+                since = sync_state.checkpoint_window_start
+                until = sync_state.checkpoint_window_end
+                page_token = sync_state.checkpoint_page_token
+                max_updated_at = sync_state.checkpoint_max_updated_at
+                counts = {
+                    'processed': sync_state.checkpoint_events_processed,
+                    'created': sync_state.checkpoint_events_created,
+                    'updated': sync_state.checkpoint_events_updated,
+                    'deleted': sync_state.checkpoint_events_deleted,
+                    'unchanged': sync_state.checkpoint_events_unchanged
+                }
+                logger.info(f"Resuming sync for {external_calendar_id} from checkpoint")
             
-            # 동기화 상태 업데이트  
-            await self._update_sync_state(
-                sync_state, fetch_result.next_delta_token,
-                fetch_result.last_updated_at, since, until
-            )
+            # 페이지 단위로 가져오면서 적용 (다음 페이지는 적용 중에 미리 다운로드)
+            pages_done = 0
+            events_fetched = 0
+            bytes_transferred = 0
+            network_seconds = parse_seconds = 0.0
+            has_more = False
+            pipeline = self._prefetch_pages(self._iter_pages_with_recovery(
+                provider, access_token, external_calendar_id,
+                since, until, sync_state, use_delta,
+                page_token=page_token,
+                refresh_token=lambda rejected: self.tokens.refresh_connection(connection_id, rejected)
+            ))
+            try:
+                async for page in pipeline:
+                    upsert_result = await self._upsert_events(
+                        user_id, connection.platform_type, external_calendar_id,
+                        page.events, options.batch_size, commit=False
+                    )
+                    
+                    counts['processed'] += len(page.events)
+                    counts['created'] += upsert_result['created']
+                    counts['updated'] += upsert_result['updated']
+                    counts['deleted'] += upsert_result['deleted']
+                    counts['unchanged'] += upsert_result['unchanged']
+                    events_fetched += len(page.events)
+                    bytes_transferred += page.bytes_transferred
+                    network_seconds += page.network_seconds
+                    parse_seconds += page.parse_seconds
+                    
+                    if page.max_updated_at and (max_updated_at is None or page.max_updated_at > max_updated_at):
+                        max_updated_at = page.max_updated_at
+                    
+                    if not page.has_more:
+                        next_delta_token = page.next_delta_token
+                        break
+                    
+                    # 페이지 적용과 체크포인트를 같은 트랜잭션으로 커밋
+                    self._save_checkpoint(
+                        sync_state, page.next_page_token, since, until,
+                        use_delta and sync_state.delta_token is not None,
+                        counts, max_updated_at
+                    )
+                    await self._renew_lease(sync_state.id, options.lease_seconds)
+                    await self.db.commit()
+                    
+                    pages_done += 1
+                    if options.max_pages and pages_done >= options.max_pages:
+                        has_more = True
+                        break
+            finally:
+                await pipeline.aclose()
             
-            # 연결 상태 업데이트
+            # lease 해제, 동기화 상태, 연결 상태를 한 번에 커밋
+            # (페이지가 하나뿐인 작은 동기화는 preamble부터 여기까지 트랜잭션 하나)
+            sync_state.lease_owner = None
+            sync_state.lease_expires_at = None
+            if not has_more:
+                # 남은 페이지가 있으면 체크포인트를 유지하여 다음 실행에서 이어서 처리
+                self._update_sync_state(
+                    sync_state, next_delta_token,
+                    max_updated_at, since, until,
+                    changes=counts['created'] + counts['updated'] + counts['deleted']
+                )
             await self._update_connection_success(connection_id)
+            await self.db.commit()
+            lease_state_id = None
             
-            return SyncResult(
+            result = SyncResult(
                 success=True,
-                events_processed=len(events_to_process),
-                events_created=upsert_result['created'],
-                events_updated=upsert_result['updated'],  
-                events_deleted=upsert_result['deleted'],
-                next_delta_token=fetch_result.next_delta_token,
-                last_updated_at=fetch_result.last_updated_at
+                events_processed=counts['processed'],
+                events_created=counts['created'],
+                events_updated=counts['updated'],  
+                events_deleted=counts['deleted'],
+                events_unchanged=counts['unchanged'],
+                next_delta_token=next_delta_token,
+                last_updated_at=max_updated_at,
+                has_more=has_more,
+                resumed=resumed,
+                events_fetched=events_fetched,
+                bytes_transferred=bytes_transferred,
+                network_seconds=network_seconds,
+                parse_seconds=parse_seconds
             )
+            if result.bytes_per_event is not None:
+                logger.info(
+                    f"Fetched {events_fetched} events for {external_calendar_id}: "
+                    f"{bytes_transferred} bytes ({result.bytes_per_event:.0f} bytes/event), "
+                    f"network {network_seconds * 1000:.0f} ms, parse {parse_seconds * 1000:.0f} ms"
+                )
+            return result
             
         except Exception as e:
             logger.error(f"Sync failed for calendar {external_calendar_id}: {e}")
+            # 마지막 체크포인트까지 커밋된 진행 상황은 유지됨
+            await self.db.rollback()
+            if lease_state_id is not None:
+                await self._release_lease(lease_state_id)
             await self._update_connection_error(connection_id, str(e))
             return SyncResult(
                 success=False, events_processed=0, events_created=0,
                 events_updated=0, events_deleted=0, error_message=str(e)
             )
     
-    async def _fetch_events_with_retry(
+    async def sync_connection(
+        self,
+        user_id: str,
+        connection_id: str,
+        calendar_ids: Optional[List[str]] = None,
+        options: Optional[SyncOptions] = None
+    ) -> ConnectionSyncResult:
+        """연결의 모든 캘린더를 동시에 동기화
+        
+        Args:
+            calendar_ids: 동기화할 캘린더 ID 목록 (None이면 제공자에서 조회)
+            options: 동기화 옵션 (max_concurrency로 동시 실행 수 제한)
+        """
+        if options is None:
+            options = SyncOptions()
+        semaphore = asyncio.Semaphore(options.max_concurrency)
+        return await self._sync_connection(user_id, connection_id, calendar_ids, options, semaphore)
+    
+    async def sync_connections(
+        self,
+        user_id: str,
+        connection_calendars: Dict[str, Optional[List[str]]],
+        options: Optional[SyncOptions] = None
+    ) -> List[ConnectionSyncResult]:
+        """여러 연결을 동시에 동기화
+        
+        Args:
+            connection_calendars: 연결 ID → 캘린더 ID 목록 (None이면 제공자에서 조회)
+            options: 동기화 옵션 (max_concurrency는 전체 연결에 걸친 동시 실행 수)
+        """
+        if options is None:
+            options = SyncOptions()
+        semaphore = asyncio.Semaphore(options.max_concurrency)
+        return list(await asyncio.gather(*[
+            self._sync_connection(user_id, connection_id, calendar_ids, options, semaphore)
+            for connection_id, calendar_ids in connection_calendars.items()
+        ]))
+    
+    async def _sync_connection(
+        self,
+        user_id: str,
+        connection_id: str,
+        calendar_ids: Optional[List[str]],
+        options: SyncOptions,
+        semaphore: asyncio.Semaphore
+    ) -> ConnectionSyncResult:
+        """연결 하나의 캘린더들을 semaphore 한도 안에서 동시 동기화"""
+        try:
+            async with self.session_factory() as session:
+                scoped = CalendarSyncService(session, self.providers, self.session_factory)
+                connection = await scoped._get_connection(connection_id, user_id)
+            
+            if not connection or not connection.sync_enabled:
+                return ConnectionSyncResult(
+                    connection_id=connection_id, success=False,
+                    error_message="Connection disabled or not found"
+                )
+            
+            provider = self.providers.get(connection.platform_type)
+            if not provider:
+                return ConnectionSyncResult(
+                    connection_id=connection_id, success=False,
+                    error_message=f"Provider {connection.platform_type} not found"
+                )
+            
+            # 토큰은 연결당 한 번만 복호화 (만료가 다가왔으면 먼저 갱신)
+            access_token = await self._access_token(connection)
+            
+            if calendar_ids is None:
+                with quota_user(user_id):
+                    try:
+                        calendars = await provider.list_calendars(access_token)
+                    except AuthenticationError:
+                        access_token = await self.tokens.refresh_connection(connection_id, access_token)
+                        calendars = await provider.list_calendars(access_token)
+                calendar_ids = [calendar.external_calendar_id for calendar in calendars]
+            
+        except Exception as e:
+            logger.error(f"Connection sync failed for {connection_id}: {e}")
+            return ConnectionSyncResult(connection_id=connection_id, success=False, error_message=str(e))
+        
+        async def sync_one(calendar_id: str) -> SyncResult:
+            async with semaphore:
+                # 태스크마다 별도 세션 사용 (AsyncSession은 동시 사용 불가)
+                async with self.session_factory() as session:
+                    service = CalendarSyncService(session, self.providers, self.session_factory)
+                    return await service.sync_calendar(
+                        user_id, connection_id, calendar_id, options, access_token=access_token
+                    )
+        
+        results = await asyncio.gather(*[sync_one(calendar_id) for calendar_id in calendar_ids])
+        calendars = dict(zip(calendar_ids, results))
+        
+        return ConnectionSyncResult(
+            connection_id=connection_id,
+            success=all(result.success for result in results),
+            calendars=calendars,
+            error_message=next((r.error_message for r in results if not r.success), None)
+        )
+    
+    async def _access_token(self, connection: ExternalConnection) -> str:
+        """연결의 access token (만료가 refresh_before 안이면 갱신한 토큰)"""
+        if self.tokens.needs_refresh(connection):
+            try:
+                return await self.tokens.refresh_connection(connection.id)
+            except Exception as e:
+                # 선제 갱신 실패는 기존 토큰으로 진행 (아직 만료 전이거나, 401 시 다시 갱신 시도)
+                logger.warning(f"Refresh-ahead failed for connection {connection.id}: {e}")
+        return await decrypt_token(connection.access_token_encrypted, connection.id)
+    
+    async def _iter_pages_with_recovery(
         self,
         provider: CalendarProvider,
         access_token: str,
@@ -163,47 +477,44 @@ class CalendarSyncService:
         until: datetime,
         sync_state: SyncState,
         use_delta: bool,
-        max_retries: int
-    ) -> SyncResult:
-        """재시도 로직으로 이벤트 가져오기"""
-        last_error = None
+        page_token: Optional[str] = None,
+        refresh_token: Optional[Callable[[str], Awaitable[str]]] = None
+    ) -> AsyncIterator[ProviderSyncResult]:
+        """이벤트 페이지 가져오기 (만료된 delta/페이지/access 토큰만 복구)
         
-        for attempt in range(max_retries + 1):
+        일시적 오류 재시도는 제공자 HTTP 호출 한 층에서만 하므로 여기서는 재시도하지 않음.
+        401은 refresh_token으로 한 번만 갱신하고 마지막으로 받은 페이지 토큰부터 이어서 조회.
+        남은 실패는 체크포인트를 남긴 채 호출자(작업 큐)에 전달되어 다음 실행에서 이어서 조회
+        """
+        resuming = page_token is not None
+        token_refreshed = False
+        
+        while True:
+            pages = provider.iter_event_pages(
+                access_token, calendar_id, since, until,
+                delta_token=sync_state.delta_token if use_delta else None,
+                updated_min=sync_state.updated_min,
+                page_token=page_token
+            )
             try:
-                if use_delta:
-                    # 증분 동기화
-                    provider_result = await provider.fetch_events(
-                        access_token, calendar_id, since, until,
-                        delta_token=sync_state.delta_token,
-                        updated_min=sync_state.updated_min
-                    )
-                else:
-                    # 윈도우 동기화
-                    provider_result = await provider.fetch_events(
-                        access_token, calendar_id, since, until,
-                        updated_min=sync_state.updated_min
-                    )
+                async for page in pages:
+                    resuming = False
+                    page_token = page.next_page_token
+                    yield page
+                return
                 
-                return SyncResult(
-                    success=True,
-                    events_processed=len(provider_result.events),
-                    events_created=0, events_updated=0, events_deleted=0,
-                    next_delta_token=provider_result.next_delta_token,
-                    last_updated_at=provider_result.max_updated_at
-                )
-                
-            except RateLimitError as e:
-                if attempt < max_retries:
-                    wait_time = e.retry_after or (2 ** attempt)
-                    jitter = random.uniform(0.1, 0.5)
-                    await asyncio.sleep(wait_time + jitter)
-                    last_error = e
-                    continue
-                else:
-                    return SyncResult(
-                        success=False, events_processed=0, events_created=0,
-                        events_updated=0, events_deleted=0, error_message=str(e)
-                    )
+            except (RateLimitError, TransientProviderError, CircuitOpenError):
+                # 제공자 재시도 정책이 포기한 오류는 그대로 전달 (체크포인트에서 다음 실행이 이어감)
+                raise
+            
+            except AuthenticationError:
+                if refresh_token is None or token_refreshed:
+                    raise
+                # 동기화 중 만료된 access token: 갱신 후 같은 페이지부터 계속 (처음부터 다시 하지 않음)
+                logger.info(f"Access token rejected while syncing {calendar_id}, refreshing")
+                access_token = await refresh_token(access_token)
+                token_refreshed = True
+                continue
             
             except ProviderError as e:
                 if "Invalid sync token" in str(e) and use_delta:
@@ -211,29 +522,44 @@ class CalendarSyncService:
                     logger.info(f"Delta token expired for {calendar_id}, falling back to full sync")
                     use_delta = False
                     sync_state.delta_token = None
+                    page_token = None
                     continue
-                else:
-                    return SyncResult(
-                        success=False, events_processed=0, events_created=0,
-                        events_updated=0, events_deleted=0, error_message=str(e)
-                    )
-                    
-            except Exception as e:
-                if attempt < max_retries:
-                    wait_time = (2 ** attempt) + random.uniform(0.1, 1.0)
-                    await asyncio.sleep(wait_time)
-                    last_error = e
+                if resuming:
+                    # 체크포인트의 페이지 토큰이 만료된 경우 같은 창의 처음부터 다시 조회
+                    logger.info(f"Checkpoint page token rejected for {calendar_id}, restarting window: {e}")
+                    resuming = False
+                    page_token = None
                     continue
-                else:
-                    return SyncResult(
-                        success=False, events_processed=0, events_created=0,
-                        events_updated=0, events_deleted=0, error_message=str(e)
-                    )
+                raise
+            
+            finally:
+                await pages.aclose()
+    
+    async def _prefetch_pages(
+        self, pages: AsyncIterator[ProviderSyncResult]
+    ) -> AsyncIterator[ProviderSyncResult]:
+        """한 페이지 앞서 다운로드하는 lookahead
         
-        return SyncResult(
-            success=False, events_processed=0, events_created=0,
-            events_updated=0, events_deleted=0, error_message=str(last_error)
-        )
+        소비자가 현재 페이지를 DB에 적용하는 동안 다음 페이지 요청이 진행되므로
+        네트워크와 DB 시간이 겹치고, 메모리에는 최대 두 페이지만 유지됨
+        """
+        next_page = asyncio.ensure_future(pages.__anext__())
+        try:
+            while True:
+                try:
+                    page = await next_page
+                except StopAsyncIteration:
+                    return
+                next_page = asyncio.ensure_future(pages.__anext__())
+                yield page
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+            try:
+                await next_page
+            except (asyncio.CancelledError, StopAsyncIteration, Exception):
+                pass
+            await pages.aclose()
     
     async def _upsert_events(
         self,
@@ -241,79 +567,214 @@ class CalendarSyncService:
         platform: str, 
         calendar_id: str,
         events: List[CalendarEventDTO],
-        batch_size: int
+        batch_size: int,
+        commit: bool = True
     ) -> Dict[str, int]:
-        """이벤트를 배치로 DB에 upsert"""
-        result = {'created': 0, 'updated': 0, 'deleted': 0}
+        """이벤트를 배치로 DB에 upsert (배치당 set-based 문장 하나)
+        
+        내용 지문이 같은 재전송은 쓰지 않고 unchanged로 집계.
+        commit=False면 호출자가 체크포인트와 함께 커밋
+        """
+        result = {'created': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
         
         for i in range(0, len(events), batch_size):
-            batch = events[i:i + batch_size]
+            batch = self._dedupe_batch(events[i:i + batch_size])
+            now = datetime.utcnow()
             
-            for event in batch:
-                try:
-                    # 기존 이벤트 조회
-                    existing_query = select(Event).where(
-                        and_(
-                            Event.user_id == user_id,
-                            Event.source_platform == platform,
-                            Event.external_calendar_id == calendar_id,
-                            Event.external_event_id == event.external_event_id
+            deleted_ids = [event.external_event_id for event in batch if event.deleted]
+            rows = [
+                self._event_row(user_id, platform, calendar_id, event, now)
+                for event in batch if not event.deleted
+            ]
+            
+            try:
+                # 배치 단위 savepoint: 한 배치 실패가 나머지 배치를 막지 않음
+                async with self.db.begin_nested():
+                    if deleted_ids:
+                        result['deleted'] += await self._mark_events_deleted(
+                            user_id, platform, calendar_id, deleted_ids, now
                         )
-                    )
-                    existing = (await self.db.execute(existing_query)).scalar_one_or_none()
-                    
-                    if event.deleted:
-                        # 삭제 처리
-                        if existing:
-                            existing.deleted = True
-                            existing.updated_at = datetime.utcnow()
-                            result['deleted'] += 1
-                        continue
-                    
-                    # 충돌 해결: external_updated_at 비교
-                    if existing and existing.external_updated_at:
-                        if event.external_updated_at <= existing.external_updated_at:
-                            # 서버 데이터가 더 오래됨, 스킵
-                            continue
-                    
-                    # 이벤트 데이터 준비
-                    event_data = {
-                        'user_id': user_id,
-                        'external_event_id': event.external_event_id,
-                        'external_calendar_id': calendar_id,
-                        'title': event.title,
-                        'description': event.description,
-                        'start_datetime': event.start_utc,
-                        'end_datetime': event.end_utc,
-                        'all_day': event.all_day,
-                        'location': event.location,
-                        'source_platform': platform,
-                        'recurrence_rule': event.recurrence_rule,
-                        'external_updated_at': event.external_updated_at,
-                        'external_version': event.external_version,
-                        'updated_at': datetime.utcnow(),
-                        'deleted': False
-                    }
-                    
-                    if existing:
-                        # 업데이트
-                        for key, value in event_data.items():
-                            if key != 'user_id':  # PK는 업데이트하지 않음
-                                setattr(existing, key, value)
-                        result['updated'] += 1
-                    else:
-                        # 생성
-                        new_event = Event(**event_data)
-                        self.db.add(new_event)
-                        result['created'] += 1
+                    if rows:
+                        created, updated = await self._upsert_event_rows(
+                            user_id, platform, calendar_id, rows
+                        )
+                        result['created'] += created
+                        result['updated'] += updated
+                        result['unchanged'] += len(rows) - created - updated
                         
-                except Exception as e:
-                    logger.error(f"Failed to upsert event {event.external_event_id}: {e}")
-                    continue
+            except Exception as e:
+                logger.error(f"Failed to upsert event batch {i // batch_size} for {calendar_id}: {e}")
+                continue
         
-        await self.db.commit()
+        if commit:
+            await self.db.commit()
         return result
     
+    def _dedupe_batch(self, batch: List[CalendarEventDTO]) -> List[CalendarEventDTO]:
+        """같은 배치 안의 중복 external_event_id는 가장 최신 것만 남김
+        
+        ON CONFLICT DO UPDATE는 한 문장에서 같은 행을 두 번 갱신할 수 없음
+        """
+        latest: Dict[str, CalendarEventDTO] = {}
+        for event in batch:
+            current = latest.get(event.external_event_id)
+            if current is None or _as_utc(event.external_updated_at) >= _as_utc(current.external_updated_at):
+                latest[event.external_event_id] = event
+        return list(latest.values())
+    
+    def _event_row(
+        self,
+        user_id: str,
+        platform: str,
+        calendar_id: str,
+        event: CalendarEventDTO,
+        now: datetime
+    ) -> Dict[str, Any]:
+        """CalendarEventDTO를 events 테이블 행으로 변환"""
+        return {
+            'user_id': user_id,
+            'external_event_id': event.external_event_id,
+            'external_calendar_id': calendar_id,
+            'title': event.title,
+            'description': event.description,
+            'start_datetime': event.start_utc,
+            'end_datetime': event.end_utc,
+            'all_day': event.all_day,
+            'location': event.location,
+            'source_platform': platform,
+            'recurrence_rule': event.recurrence_rule,
+            'external_updated_at': event.external_updated_at,
+            'external_version': event.external_version,
+            'content_hash': event.content_fingerprint(),
+            'updated_at': now,
+            'deleted': False
+        }
+    
+    async def _mark_events_deleted(
+        self,
+        user_id: str,
+        platform: str,
+        calendar_id: str,
+        external_ids: List[str],
+        now: datetime
+    ) -> int:
+        """삭제된 이벤트를 한 번의 UPDATE로 마킹, 마킹된 행 수 반환 (이미 삭제된 행은 건너뜀)"""
+        stmt = update(Event).where(
+            and_(
+                Event.user_id == user_id,
+                Event.source_platform == platform,
+                Event.external_calendar_id == calendar_id,
+                Event.external_event_id.in_(external_ids),
+                Event.deleted == False
+            )
+        ).values(
+            deleted=True,
+            content_hash=None,  # 같은 내용으로 복원돼도 다시 쓰이도록
+            updated_at=now
+        )
+        return (await self.db.execute(stmt)).rowcount
+    
+    async def _upsert_event_rows(
+        self,
+        user_id: str,
+        platform: str,
+        calendar_id: str,
+        rows: List[Dict[str, Any]]
+    ) -> Tuple[int, int]:
+        """INSERT ... ON CONFLICT로 배치 upsert, 실제로 쓴 (created, updated) 반환
+        
+        충돌 해결(Last-Write-Wins)은 DO UPDATE의 WHERE 절, 변경 감지는 SET의 CASE에서 처리하므로
+        더 오래된 외부 버전은 DB가 건너뛰고, 내용 지문이 같은 행은 버전 컬럼만 앞당김 (수정 건수 제외)
+        """
+        if self.db.bind.dialect.name == 'postgresql':
+            # xmax = 0 이면 이번 문장에서 새로 삽입된 행, 내용을 다시 쓴 행만 updated_at이 이번 값
+            # (비교는 DB에서: timestamptz로 읽은 aware 값과 naive 바인딩 값을 파이썬에서 비교하면 항상 다름)
+            written_at = literal(rows[0]['updated_at'], Event.updated_at.type)
+            stmt = self._build_upsert(insert, rows).returning(
+                literal_column('(xmax = 0)').label('inserted'),
+                (Event.updated_at == written_at).label('rewritten')
+            )
+            written = (await self.db.execute(stmt)).all()
+            created = sum(1 for row in written if row.inserted)
+            updated = sum(1 for row in written if not row.inserted and row.rewritten)
+            return created, updated
+        
+        # sqlite 등: 기존 키를 한 번에 조회해 생성/수정 건수를 계산
+        existing = {
+            event.external_event_id: (_as_utc(event.external_updated_at), event.content_hash)
+            for event in await self._get_events_by_external_ids(
+                user_id, platform, calendar_id, [row['external_event_id'] for row in rows]
+            )
+        }
+        await self.db.execute(self._build_upsert(sqlite_insert, rows))
+        
+        # postgresql 분기와 같은 기준: 더 새 버전이면서 내용 지문이 다른 행만 수정으로 집계
+        # (지문이 같은 행은 버전 컬럼만 앞당겨지고 수정 건수에는 들어가지 않음)
+        created = updated = 0
+        for row in rows:
+            if row['external_event_id'] not in existing:
+                created += 1
+                continue
+            updated_at, content_hash = existing[row['external_event_id']]
+            newer = updated_at is None or updated_at < _as_utc(row['external_updated_at'])
+            if newer and content_hash != row['content_hash']:
+                updated += 1
+        return created, updated
+    
+    def _build_upsert(self, insert_fn, rows: List[Dict[str, Any]]):
+        """dialect별 insert로 idx_events_sync_lookup 기준 upsert 문장 구성
+        
+        더 새 외부 버전만 반영하고, 내용 지문이 같으면(DTSTAMP 재생성 등 메타데이터만 바뀐 재전송)
+        etag/external_updated_at만 앞당기고 내용 컬럼과 updated_at은 그대로 둠
+        """
+        stmt = insert_fn(Event).values(rows)
+        content_changed = Event.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        set_ = {}
+        for column in rows[0].keys():
+            if column in _SYNC_LOOKUP_KEY:
+                continue
+            if column in _VERSION_COLUMNS:
+                set_[column] = stmt.excluded[column]
+            else:
+                set_[column] = case((content_changed, stmt.excluded[column]), else_=getattr(Event, column))
+        return stmt.on_conflict_do_update(
+            index_elements=list(_SYNC_LOOKUP_KEY),
+            set_=set_,
+            where=or_(
+                Event.external_updated_at.is_(None),
+                Event.external_updated_at < stmt.excluded.external_updated_at
+            )
+        )
+    
+    async def _get_events_by_external_ids(
+        self,
+        user_id: str,
+        platform: str,
+        calendar_id: str,
+        external_ids: List[str]
+    ) -> List[Event]:
+        """외부 이벤트 ID 목록으로 이벤트 일괄 조회"""
+        query = select(Event).where(
+            and_(
+                Event.user_id == user_id,
+                Event.source_platform == platform,
+                Event.external_calendar_id == calendar_id,
+                Event.external_event_id.in_(external_ids)
+            )
+        ).execution_options(populate_existing=True)
+        return list((await self.db.execute(query)).scalars().all())
+    
+    async def _get_event_by_external_id(
+        self,
+        user_id: str,
+        platform: str,
+        calendar_id: str,
+        external_id: str
+    ) -> Optional[Event]:
+        """외부 이벤트 ID로 단일 이벤트 조회"""
+        events = await self._get_events_by_external_ids(user_id, platform, calendar_id, [external_id])
+        return events[0] if events else None
+    
     def _calculate_sync_window(self, options: SyncOptions) -> Tuple[datetime, datetime]:
         """동기화 시간 창 계산"""
         now = datetime.now(timezone.utc)
@@ -331,10 +792,98 @@ class CalendarSyncService:
         )
         return (await self.db.execute(query)).scalar_one_or_none()
     
+    async def _begin_calendar_sync(
+        self,
+        user_id: str,
+        connection_id: str,
+        calendar_id: str,
+        lease_seconds: int
+    ) -> Tuple[Optional[ExternalConnection], Optional[SyncState]]:
+        """연결 조회, 동기화 상태 조회/생성, lease 획득 (커밋은 호출자)
+        
+        sync_state가 None이면 연결이 비활성이거나 다른 노드가 lease를 가진 상태.
+        postgres는 _build_sync_preamble 한 문장(왕복 1회)으로 처리
+        """
+        if self.db.bind.dialect.name == 'postgresql':
+            stmt = self._build_sync_preamble(user_id, connection_id, calendar_id, lease_seconds)
+            row = (await self.db.execute(stmt)).first()
+            if row is None:
+                return None, None
+            return row[0], row[1]
+        
+        connection = await self._get_connection(connection_id, user_id)
+        if not connection or not connection.sync_enabled:
+            return connection, None
+        
+        sync_state = await self._get_or_create_sync_state(user_id, connection_id, calendar_id)
+        if not await self._acquire_lease(sync_state, lease_seconds):
+            return connection, None
+        return connection, sync_state
+    
+    def _build_sync_preamble(
+        self,
+        user_id: str,
+        connection_id: str,
+        calendar_id: str,
+        lease_seconds: int
+    ):
+        """연결과 lease를 획득한 sync_state를 함께 반환하는 postgres 문장 구성
+        
+        - acquired: 기존 행 중 잠기지 않고 lease가 비었거나 만료된 행을 lease 획득하며 반환
+        - created: 활성 연결이 있고 행이 없을 때 lease를 가진 채로 INSERT ... ON CONFLICT DO NOTHING
+        - 두 CTE의 결과를 external_connections에 LEFT JOIN (결과 행이 없으면 연결 없음)
+        """
+        now = datetime.utcnow()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        state_columns = list(SyncState.__table__.c)
+        
+        locked = select(SyncState.id).where(
+            and_(
+                SyncState.user_id == user_id,
+                SyncState.connection_id == connection_id,
+                SyncState.external_calendar_id == calendar_id
+            )
+        ).with_for_update(skip_locked=True)
+        acquired = update(SyncState).where(
+            and_(
+                SyncState.id.in_(locked),
+                or_(
+                    SyncState.lease_owner.is_(None),
+                    SyncState.lease_owner == NODE_ID,
+                    SyncState.lease_expires_at < now
+                )
+            )
+        ).values(
+            lease_owner=NODE_ID,
+            lease_expires_at=lease_expires_at
+        ).returning(*state_columns).cte('acquired')
+        
+        enabled_connection = and_(
+            ExternalConnection.id == connection_id,
+            ExternalConnection.user_id == user_id
+        )
+        created = insert(SyncState).from_select(
+            ['user_id', 'connection_id', 'external_calendar_id', 'lease_owner', 'lease_expires_at'],
+            select(
+                ExternalConnection.user_id,
+                ExternalConnection.id,
+                literal(calendar_id, SyncState.external_calendar_id.type),
+                literal(NODE_ID, SyncState.lease_owner.type),
+                literal(lease_expires_at, SyncState.lease_expires_at.type)
+            ).where(and_(enabled_connection, ExternalConnection.sync_enabled == True))
+        ).on_conflict_do_nothing(
+            index_elements=['user_id', 'connection_id', 'external_calendar_id']
+        ).returning(*state_columns).cte('created')
+        
+        state = aliased(SyncState, union_all(select(acquired), select(created)).subquery('states'))
+        return select(ExternalConnection, state).outerjoin(
+            state, true()
+        ).where(enabled_connection).execution_options(populate_existing=True)
+    
     async def _get_or_create_sync_state(
         self, user_id: str, connection_id: str, calendar_id: str
     ) -> SyncState:
-        """동기화 상태 조회/생성"""
+        """동기화 상태 조회/생성 (새 행은 flush만, 커밋은 호출자)"""
         query = select(SyncState).where(
             and_(
                 SyncState.user_id == user_id,
@@ -351,30 +900,112 @@ class CalendarSyncService:
                 external_calendar_id=calendar_id
             )
             self.db.add(sync_state)
-            await self.db.commit()
-            await self.db.refresh(sync_state)
+            await self.db.flush()
         
         return sync_state
     
-    async def _update_sync_state(
+    def _update_sync_state(
         self,
         sync_state: SyncState,
         delta_token: Optional[str],
         max_updated: Optional[datetime],
         window_start: datetime,
-        window_end: datetime
+        window_end: datetime,
+        changes: int = 0
     ):
-        """동기화 상태 업데이트"""
+        """동기화 상태 업데이트, 변경 수로 다음 폴링 시각도 갱신 (커밋은 호출자)"""
         sync_state.delta_token = delta_token
         if max_updated:
             sync_state.updated_min = max_updated
         sync_state.last_window_start = window_start
         sync_state.last_window_end = window_end
         sync_state.updated_at = datetime.utcnow()
-        await self.db.commit()
+        self._clear_checkpoint(sync_state)
+        record_poll(sync_state, changes, datetime.now(timezone.utc), self.polling_policy)
+    
+    def _save_checkpoint(
+        self,
+        sync_state: SyncState,
+        page_token: str,
+        window_start: datetime,
+        window_end: datetime,
+        delta: bool,
+        counts: Dict[str, int],
+        max_updated: Optional[datetime]
+    ):
+        """다음 페이지부터 재개할 수 있도록 진행 상황 기록 (커밋은 호출자)"""
+        sync_state.checkpoint_page_token = page_token
+        sync_state.checkpoint_window_start = window_start
+        sync_state.checkpoint_window_end = window_end
+        sync_state.checkpoint_delta = delta
+        sync_state.checkpoint_events_processed = counts['processed']
+        sync_state.checkpoint_events_created = counts['created']
+        sync_state.checkpoint_events_updated = counts['updated']
+        sync_state.checkpoint_events_deleted = counts['deleted']
+        sync_state.checkpoint_events_unchanged = counts['unchanged']
+        sync_state.checkpoint_max_updated_at = max_updated
+        sync_state.checkpointed_at = datetime.utcnow()
+    
+    def _clear_checkpoint(self, sync_state: SyncState):
+        """완료된 동기화의 체크포인트 제거"""
+        sync_state.checkpoint_page_token = None
+        sync_state.checkpoint_window_start = None
+        sync_state.checkpoint_window_end = None
+        sync_state.checkpoint_delta = False
+        sync_state.checkpoint_events_processed = 0
+        sync_state.checkpoint_events_created = 0
+        sync_state.checkpoint_events_updated = 0
+        sync_state.checkpoint_events_deleted = 0
+        sync_state.checkpoint_events_unchanged = 0
+        sync_state.checkpoint_max_updated_at = None
+        sync_state.checkpointed_at = None
+    
+    async def _acquire_lease(self, sync_state: SyncState, lease_seconds: int) -> bool:
+        """sync_state lease 획득 (비어 있거나 만료됐거나 이미 이 노드 소유일 때만, 커밋은 호출자)"""
+        now = datetime.utcnow()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        stmt = update(SyncState).where(
+            and_(
+                SyncState.id == sync_state.id,
+                or_(
+                    SyncState.lease_owner.is_(None),
+                    SyncState.lease_owner == NODE_ID,
+                    SyncState.lease_expires_at < now
+                )
+            )
+        ).values(
+            lease_owner=NODE_ID,
+            lease_expires_at=lease_expires_at
+        ).execution_options(synchronize_session=False)
+        if (await self.db.execute(stmt)).rowcount != 1:
+            return False
+        
+        # DB에 반영된 값을 객체의 로드된 값으로 맞춰 해제가 ORM 변경으로 감지되도록 함
+        set_committed_value(sync_state, 'lease_owner', NODE_ID)
+        set_committed_value(sync_state, 'lease_expires_at', lease_expires_at)
+        return True
+    
+    async def _renew_lease(self, sync_state_id: str, lease_seconds: int):
+        """lease 만료 시각 연장 (커밋은 호출자)"""
+        stmt = update(SyncState).where(
+            and_(SyncState.id == sync_state_id, SyncState.lease_owner == NODE_ID)
+        ).values(
+            lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds)
+        ).execution_options(synchronize_session=False)
+        await self.db.execute(stmt)
+    
+    async def _release_lease(self, sync_state_id: str):
+        """이 노드가 가진 lease 해제 (커밋은 호출자)"""
+        stmt = update(SyncState).where(
+            and_(SyncState.id == sync_state_id, SyncState.lease_owner == NODE_ID)
+        ).values(
+            lease_owner=None,
+            lease_expires_at=None
+        ).execution_options(synchronize_session=False)
+        await self.db.execute(stmt)
     
     async def _update_connection_success(self, connection_id: str):
-        """연결 성공 상태 업데이트"""
+        """연결 성공 상태 업데이트 (커밋은 호출자)"""
         stmt = update(ExternalConnection).where(
             ExternalConnection.id == connection_id
         ).values(
@@ -383,7 +1014,6 @@ class CalendarSyncService:
             last_error=None
         )
         await self.db.execute(stmt)
-        await self.db.commit()
     
     async def _update_connection_error(self, connection_id: str, error_message: str):
         """연결 오류 상태 업데이트"""
@@ -399,6 +1029,16 @@ class CalendarSyncService:
 # Acceptance Criteria:
 # - 증분 동기화 (delta token) 우선, 실패 시 윈도우 동기화로 fallback
 # - 충돌 해결: external_updated_at 기준 Last-Write-Wins 적용
-# - Rate limit과 일시적 오류에 지수 백오프 + 지터로 재시도
+# - 내용 지문이 같은 재전송은 쓰기를 건너뛰고 unchanged로 집계
+# - 서비스 계층은 재시도하지 않음 (재시도는 제공자 HTTP 호출 한 층, 남은 실패는 작업 큐로)
+# - 토큰 만료로 동기화가 실패하거나 처음부터 다시 시작하지 않음 (선제 갱신 + 401 시 1회 갱신 후 이어서)
 # - 배치 처리로 대량 이벤트도 효율적으로 처리  
+# - 페이지 단위 fetch/apply 파이프라인으로 메모리는 페이지 크기에 비례
+# - 페이지 커밋마다 체크포인트를 남겨 중단된 긴 동기화를 이어서 재개
+# - 연결 단위로 캘린더들을 동시 동기화 (태스크별 세션, 토큰 1회 복호화)
+# - 같은 캘린더 동기화는 프로세스 내 single-flight, 노드 간 sync_state lease로 중복 방지
+# - 동기화 결과의 변경 수로 캘린더별 다음 폴링 시각을 적응적으로 갱신
+# - 작은 동기화는 preamble 한 문장 + 커밋 한 번 (상태 전이는 모두 같은 트랜잭션)
+# - 제공자와 HTTP 커넥션 풀은 프로세스 전역 레지스트리에서 공유
+# - 실행별 수신 바이트와 이벤트당 바이트를 결과와 로그로 기록
 # - 동기화 상태와 연결 상태를 별도 추적하여 디버깅 지원
\ No newline at end of file
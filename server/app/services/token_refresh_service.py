@@ -0,0 +1,212 @@
+"""OAuth access token refresh-ahead service
+
+설계 의도:
+- 연결별 token_expires_at을 보고 만료 refresh_before 전에 백그라운드에서 묶음으로 미리 갱신
+- 묶음은 SKIP LOCKED로 선점(token_refresh_retry_at 기록)만 하고 커밋한 뒤 제공자를 호출하므로 행 잠금을 오래 잡지 않음
+- 일시적으로 실패한 연결은 retry_after 뒤에 다시 시도 (실패가 반복되어도 루프가 쉬지 않고 돌지 않음)
+- 새 토큰은 connection_id를 AAD로 다시 암호화하여 저장 (제공자가 refresh token을 교체하면 함께 저장)
+- 동기화 중 401은 연결당 한 번만 갱신 후 같은 페이지부터 이어서 조회 (프로세스 내 single-flight, 노드 간 행 잠금)
+- refresh token이 폐기된 연결은 재연결이 필요하다는 오류로 표시하고 이후 선제 갱신 대상에서 제외
+
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import select, and_, or_
+from sqlalchemy.orm import sessionmaker
+
+from ..core.single_flight import SingleFlight
+from ..core.security import decrypt_token, encrypt_token, decrypt_refresh_token, encrypt_refresh_token
+from ..integrations.base import CalendarProvider, AuthenticationError
+from ..integrations.registry import get_provider_registry
+from ..models.sync_models import ExternalConnection
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 같은 연결의 동시 갱신 합류 (connection_id 키)
+_token_refresh_flights = SingleFlight()
+
+def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """naive datetime은 UTC로 간주"""
+    if dt is None or dt.tzinfo is not None:
+        return dt
+    return dt.replace(tzinfo=timezone.utc)
+
+class TokenRefreshService:
+    """연결별 access token 선제 갱신 및 401 시 갱신"""
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        providers: Optional[Dict[str, CalendarProvider]] = None,
+        refresh_before: timedelta = timedelta(minutes=10),
+        tick_seconds: float = 60.0,
+        batch_size: int = 100,
+        concurrency: int = 8,
+        retry_after: timedelta = timedelta(minutes=1)
+    ):
+        self.session_factory = session_factory
+        self.providers = providers if providers is not None else get_provider_registry().providers
+        self.refresh_before = refresh_before
+        self.tick_seconds = tick_seconds
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retry_after = retry_after
+
+    def _refreshable_platforms(self):
+        return [
+            name for name, provider in self.providers.items()
+            if getattr(provider, 'refresh_access_token', None) is not None
+        ]
+
+    def needs_refresh(self, connection: ExternalConnection, now: Optional[datetime] = None) -> bool:
+        """만료가 refresh_before 안으로 다가왔는지 (만료 시각을 모르면 False, 401 시 갱신)"""
+        expires_at = _as_utc(getattr(connection, 'token_expires_at', None))
+        if expires_at is None or not connection.refresh_token_encrypted:
+            return False
+        return expires_at <= (now or datetime.now(timezone.utc)) + self.refresh_before
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None):
+        """stop_event가 설정될 때까지 tick_seconds마다 만료가 다가온 토큰 갱신"""
+        stop_event = stop_event or asyncio.Event()
+        logger.info("Token refresher started")
+
+        while not stop_event.is_set():
+            try:
+                # 한 묶음을 모두 갱신했으면 밀린 연결이 있을 수 있으므로 바로 이어서 처리
+                while not stop_event.is_set() and await self.refresh_expiring() >= self.batch_size:
+                    pass
+            except Exception as e:
+                logger.error(f"Token refresh tick failed: {e}")
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.tick_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Token refresher stopped")
+
+    async def refresh_expiring(self, now: Optional[datetime] = None) -> int:
+        """만료가 refresh_before 안인 연결을 묶음으로 갱신, 갱신에 성공한 연결 수 반환"""
+        now = now or datetime.now(timezone.utc)
+        connection_ids = await self._claim_expiring(now)
+        if not connection_ids:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def refresh_one(connection_id: str) -> bool:
+            async with semaphore:
+                try:
+                    await self.refresh_connection(connection_id)
+                    return True
+                except AuthenticationError:
+                    # 재연결 필요 표시는 _refresh_connection에서 기록
+                    return False
+                except Exception as e:
+                    # 일시적 실패는 선점 시 기록한 token_refresh_retry_at 이후에 다시 시도
+                    logger.warning(f"Token refresh failed for connection {connection_id}: {e}")
+                    return False
+
+        # 연결마다 자기 행만 잠그고 갱신 (401 갱신과는 single-flight/행 잠금으로 합류)
+        results = await asyncio.gather(*[refresh_one(connection_id) for connection_id in connection_ids])
+        refreshed = sum(1 for result in results if result)
+        logger.info(f"Refreshed access tokens for {refreshed}/{len(connection_ids)} connections")
+        return refreshed
+
+    async def _claim_expiring(self, now: datetime) -> List[str]:
+        """갱신할 연결을 선점하고 ID 반환 (retry_after 동안 다른 노드/다음 묶음에서 제외, 잠금은 바로 해제)"""
+        platforms = self._refreshable_platforms()
+        if not platforms:
+            return []
+
+        async with self.session_factory() as session:
+            query = select(ExternalConnection).where(
+                and_(
+                    ExternalConnection.sync_enabled == True,
+                    ExternalConnection.platform_type.in_(platforms),
+                    ExternalConnection.refresh_token_encrypted.isnot(None),
+                    ExternalConnection.token_expires_at <= now + self.refresh_before,
+                    or_(
+                        ExternalConnection.token_refresh_retry_at.is_(None),
+                        ExternalConnection.token_refresh_retry_at <= now
+                    )
+                )
+            ).order_by(
+                ExternalConnection.token_expires_at.asc()
+            ).limit(self.batch_size).with_for_update(skip_locked=True)
+
+            connections = (await session.execute(query)).scalars().all()
+            for connection in connections:
+                connection.token_refresh_retry_at = now + self.retry_after
+            await session.commit()
+            return [connection.id for connection in connections]
+
+    async def refresh_connection(self, connection_id: str, rejected_token: Optional[str] = None) -> str:
+        """
+        연결 하나의 access token을 갱신하고 새 토큰 반환
+
+        rejected_token은 401을 받은 토큰. 그 사이 다른 태스크/노드가 이미 갱신했으면
+        다시 갱신하지 않고 저장된 새 토큰을 반환
+        """
+        return await _token_refresh_flights.run(
+            connection_id, lambda: self._refresh_connection(connection_id, rejected_token)
+        )
+
+    async def _refresh_connection(self, connection_id: str, rejected_token: Optional[str]) -> str:
+        async with self.session_factory() as session:
+            # 노드 간 동시 갱신은 행 잠금으로 직렬화
+            query = select(ExternalConnection).where(ExternalConnection.id == connection_id).with_for_update()
+            connection = (await session.execute(query)).scalar_one_or_none()
+            if connection is None:
+                raise AuthenticationError('unknown', f"Connection {connection_id} not found")
+
+            if rejected_token is not None or not self.needs_refresh(connection):
+                # 401이면 거부된 토큰과 다를 때, 선제 갱신이면 만료가 더 이상 임박하지 않을 때 이미 갱신된 것
+                current = await decrypt_token(connection.access_token_encrypted, connection.id)
+                if rejected_token is None or current != rejected_token:
+                    await session.commit()
+                    return current
+
+            try:
+                access_token = await self._refresh(connection)
+            except AuthenticationError as e:
+                self._mark_reauth_required(connection, e)
+                await session.commit()
+                raise
+            await session.commit()
+            return access_token
+
+    async def _refresh(self, connection: ExternalConnection) -> str:
+        """제공자에서 새 토큰을 받아 암호화 저장 (커밋은 호출자)"""
+        provider = self.providers.get(connection.platform_type)
+        refresh = getattr(provider, 'refresh_access_token', None)
+        if refresh is None or not connection.refresh_token_encrypted:
+            raise AuthenticationError(connection.platform_type, "Access token expired and cannot be refreshed")
+
+        refresh_token = await decrypt_refresh_token(connection.refresh_token_encrypted, connection.id)
+        tokens = await refresh(refresh_token)
+
+        connection.access_token_encrypted = await encrypt_token(tokens.access_token, connection.id)
+        if tokens.refresh_token:
+            connection.refresh_token_encrypted = await encrypt_refresh_token(tokens.refresh_token, connection.id)
+        connection.token_expires_at = tokens.expires_at
+        connection.token_refresh_retry_at = None
+        logger.info(f"Refreshed access token for connection {connection.id} (expires {tokens.expires_at})")
+        return tokens.access_token
+
+    def _mark_reauth_required(self, connection: ExternalConnection, error: Exception):
+        """refresh token이 거부된 연결은 선제 갱신 대상에서 제외 (만료 시각을 지우고, 401 시에만 다시 시도)"""
+        logger.warning(f"Refresh token rejected for connection {connection.id}: {error}")
+        connection.token_expires_at = None
+        connection.sync_status = 'error'
+        connection.last_error = f"Reauthorization required: {error}"
+
+# Acceptance Criteria:
+# - 만료가 refresh_before 안인 연결을 SKIP LOCKED로 선점하고 잠금을 푼 뒤 백그라운드에서 미리 갱신
+# - 일시적으로 실패한 연결은 retry_after 뒤에 다시 시도, 루프는 성공한 갱신 수로만 이어서 처리
+# - 새 access/refresh token은 connection_id AAD로 다시 암호화하여 저장
+# - 401 시 연결당 한 번만 갱신, 이미 다른 곳에서 갱신된 토큰은 재사용
+# - refresh token이 거부되면 재연결 필요 오류로 표시
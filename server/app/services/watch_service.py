@@ -0,0 +1,221 @@
+"""Push notification (watch channel) service
+
+설계 의도:
+- 폴링 대신 Google events.watch 채널로 변경 알림을 받아 해당 캘린더만 delta 동기화
+- 채널은 sync_state 단위로 생성하고, 만료 전에 새 채널을 먼저 만든 뒤 기존 채널을 중지 (알림 공백 없음)
+- 갱신 대상은 SKIP LOCKED로 선점(watch_retry_at 기록)만 하고 커밋한 뒤 제공자를 호출하므로 그동안 동기화를 막지 않음
+- 실패한 캘린더는 retry_after 뒤에 다시 시도하고, 채널이 없거나 먼저 만료되는 캘린더부터 처리
+- 웹훅은 채널 ID/토큰/리소스 ID를 검증한 뒤 작업 큐에 적재만 하므로 응답이 빠름
+
+"""
+import asyncio
+import hmac
+import logging
+import os
+import secrets
+import uuid
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.orm import sessionmaker
+
+from ..integrations.base import CalendarProvider, SyncCapability
+from ..integrations.quota import quota_user
+from ..models.sync_models import SyncState, ExternalConnection
+from ..core.security import decrypt_token
+from .sync_queue import SyncJobQueue, SyncJobRequest, PostgresSyncJobQueue
+from .sync_service import SyncOptions, build_default_providers
+
+logger = logging.getLogger(__name__)
+
+class WatchChannelService:
+    """캘린더별 변경 알림 채널 생성/갱신 및 알림 처리"""
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        queue: Optional[SyncJobQueue] = None,
+        providers: Optional[Dict[str, CalendarProvider]] = None,
+        webhook_url: Optional[str] = None,
+        channel_ttl: timedelta = timedelta(days=7),
+        renew_before: timedelta = timedelta(hours=12),
+        tick_seconds: float = 600.0,
+        batch_size: int = 100,
+        retry_after: timedelta = timedelta(minutes=30)
+    ):
+        self.session_factory = session_factory
+        self.queue = queue or PostgresSyncJobQueue(session_factory)
+        self.providers = providers if providers is not None else build_default_providers()
+        self.webhook_url = webhook_url or os.getenv('GOOGLE_WEBHOOK_URL')
+        self.channel_ttl = channel_ttl
+        self.renew_before = renew_before
+        self.tick_seconds = tick_seconds
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+
+    async def handle_notification(
+        self,
+        channel_id: Optional[str],
+        resource_id: Optional[str],
+        resource_state: Optional[str],
+        channel_token: Optional[str]
+    ) -> bool:
+        """
+        웹훅 알림 처리, 유효한 채널의 알림이면 True
+
+        resource_state가 'sync'인 채널 생성 확인 알림은 적재하지 않음
+        """
+        if not channel_id:
+            return False
+
+        async with self.session_factory() as session:
+            query = select(SyncState, ExternalConnection.sync_enabled).join(
+                ExternalConnection, ExternalConnection.id == SyncState.connection_id
+            ).where(SyncState.watch_channel_id == channel_id)
+            row = (await session.execute(query)).first()
+
+        if row is None:
+            logger.info(f"Ignoring notification for unknown channel {channel_id}")
+            return False
+
+        sync_state, sync_enabled = row
+        if not hmac.compare_digest(sync_state.watch_token or '', channel_token or '') \
+                or sync_state.watch_resource_id != resource_id:
+            logger.warning(f"Rejected notification with invalid token/resource for channel {channel_id}")
+            return False
+
+        if resource_state == 'sync' or not sync_enabled:
+            return True
+
+        # 알림에는 변경 내용이 없으므로 해당 캘린더만 delta 동기화 (대기 중이면 기존 작업 유지)
+        await self.queue.enqueue([SyncJobRequest(
+            user_id=sync_state.user_id,
+            connection_id=sync_state.connection_id,
+            external_calendar_id=sync_state.external_calendar_id,
+            options=SyncOptions()
+        )])
+
+        logger.info(f"Queued delta sync for calendar {sync_state.external_calendar_id} from push notification")
+        return True
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None):
+        """stop_event가 설정될 때까지 tick_seconds마다 채널 생성/갱신"""
+        stop_event = stop_event or asyncio.Event()
+
+        if not self.webhook_url:
+            logger.warning("GOOGLE_WEBHOOK_URL not set, push notification channels disabled")
+            return
+
+        logger.info("Watch channel renewer started")
+
+        while not stop_event.is_set():
+            try:
+                await self.ensure_channels()
+            except Exception as e:
+                logger.error(f"Watch channel renewal failed: {e}")
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.tick_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Watch channel renewer stopped")
+
+    async def ensure_channels(self, now: Optional[datetime] = None) -> int:
+        """채널이 없거나 renew_before 안에 만료되는 캘린더의 채널 생성, 생성 수 반환"""
+        now = now or datetime.now(timezone.utc)
+        push_platforms = [
+            name for name, provider in self.providers.items()
+            if provider.capabilities.supports(SyncCapability.PUSH)
+        ]
+        if not push_platforms:
+            return 0
+
+        created = 0
+        for sync_state, connection in await self._claim_renewals(push_platforms, now):
+            try:
+                with quota_user(sync_state.user_id):
+                    await self._renew_channel(sync_state, connection)
+                created += 1
+            except Exception as e:
+                # 선점 시 기록한 watch_retry_at 이후에 다시 시도 (실패한 캘린더가 묶음을 차지하지 않음)
+                logger.error(
+                    f"Failed to renew watch channel for calendar {sync_state.external_calendar_id}: {e}"
+                )
+
+        return created
+
+    async def _claim_renewals(
+        self,
+        push_platforms: List[str],
+        now: datetime
+    ) -> List[Tuple[SyncState, ExternalConnection]]:
+        """갱신할 캘린더를 선점 (retry_after 동안 다른 노드/다음 tick에서 제외, 행 잠금은 바로 해제)"""
+        async with self.session_factory() as session:
+            query = select(SyncState, ExternalConnection).join(
+                ExternalConnection, ExternalConnection.id == SyncState.connection_id
+            ).where(
+                and_(
+                    ExternalConnection.sync_enabled == True,
+                    ExternalConnection.platform_type.in_(push_platforms),
+                    or_(
+                        SyncState.watch_expires_at.is_(None),
+                        SyncState.watch_expires_at <= now + self.renew_before
+                    ),
+                    or_(
+                        SyncState.watch_retry_at.is_(None),
+                        SyncState.watch_retry_at <= now
+                    )
+                )
+            ).order_by(
+                SyncState.watch_expires_at.asc().nulls_first()
+            ).limit(self.batch_size).with_for_update(skip_locked=True, of=SyncState)
+
+            rows = (await session.execute(query)).all()
+            for sync_state, _ in rows:
+                sync_state.watch_retry_at = now + self.retry_after
+            await session.commit()
+
+        return [(sync_state, connection) for sync_state, connection in rows]
+
+    async def _renew_channel(self, sync_state: SyncState, connection: ExternalConnection):
+        """새 채널 생성 및 저장 후 기존 채널 중지"""
+        provider = self.providers[connection.platform_type]
+        access_token = await decrypt_token(connection.access_token_encrypted, connection.id)
+
+        channel = await provider.watch_events(
+            access_token,
+            sync_state.external_calendar_id,
+            channel_id=str(uuid.uuid4()),
+            webhook_url=self.webhook_url,
+            token=secrets.token_urlsafe(32),
+            ttl_seconds=int(self.channel_ttl.total_seconds())
+        )
+
+        async with self.session_factory() as session:
+            await session.execute(
+                update(SyncState).where(SyncState.id == sync_state.id).values(
+                    watch_channel_id=channel.channel_id,
+                    watch_resource_id=channel.resource_id,
+                    watch_token=channel.token,
+                    watch_expires_at=channel.expires_at,
+                    watch_retry_at=None
+                )
+            )
+            await session.commit()
+
+        old_channel_id, old_resource_id = sync_state.watch_channel_id, sync_state.watch_resource_id
+        if old_channel_id and old_resource_id:
+            try:
+                await provider.stop_channel(access_token, old_channel_id, old_resource_id)
+            except Exception as e:
+                # 중지 실패한 채널은 만료 시 자동 소멸, 알림은 채널 ID 불일치로 무시됨
+                logger.warning(f"Failed to stop old watch channel {old_channel_id}: {e}")
+
+# Acceptance Criteria:
+# - push capability 제공자의 활성 캘린더마다 변경 알림 채널 유지
+# - 만료 renew_before 전에 자동 갱신, 갱신 중에도 알림 공백 없음
+# - 제공자 호출 동안 sync_state 행을 잠그지 않고, 실패한 캘린더는 retry_after 뒤 재시도
+# - 채널 토큰/리소스 ID 검증 후 변경된 캘린더만 delta 동기화 작업으로 적재
+# - 채널 생성 확인(sync) 알림과 알 수 없는 채널 알림은 무시
@@ -0,0 +1,210 @@
+"""Sync worker process
+
+설계 의도:
+- API 프로세스와 분리된 워커가 sync_jobs 큐에서 작업을 가져가 실행
+- 동시 실행 수 제한(concurrency)으로 DB/외부 API 부하를 제어 (backpressure)
+- 가져온 작업을 연결별로 묶어 CalendarSyncService.sync_connection으로 실행 (토큰은 연결당 한 번 복호화, 캘린더마다 별도 세션)
+- 캘린더 작업별로 결과/재시도/미룸 상태 기록
+
+실행: python -m app.workers.sync_worker --concurrency 8
+
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Dict, List, Optional, Tuple
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from ..integrations.base import CalendarProvider
+from ..integrations.registry import close_provider_registry, get_provider_registry
+from ..services.sync_queue import SyncJobQueue, PostgresSyncJobQueue, ClaimedSyncJob, serialize_options
+from ..services.sync_service import CalendarSyncService, SyncResult, build_default_providers
+from ..services.sync_scheduler import SyncScheduler
+from ..services.watch_service import WatchChannelService
+from ..services.token_refresh_service import TokenRefreshService
+from ..services.quota_store import PostgresQuotaStore
+
+logger = logging.getLogger(__name__)
+
+def group_jobs_by_connection(jobs: List[ClaimedSyncJob]) -> List[List[ClaimedSyncJob]]:
+    """같은 연결/옵션의 작업끼리 묶음 (묶음 하나를 sync_connection 한 번으로 실행)"""
+    groups: Dict[Tuple, List[ClaimedSyncJob]] = {}
+    for job in jobs:
+        key = (job.user_id, job.connection_id, tuple(sorted(serialize_options(job.options).items())))
+        groups.setdefault(key, []).append(job)
+    return list(groups.values())
+
+class SyncWorker:
+    """sync_jobs 큐 소비 워커"""
+    
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        queue: Optional[SyncJobQueue] = None,
+        providers: Optional[Dict[str, CalendarProvider]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 2.0,
+        stale_after: timedelta = timedelta(minutes=30),
+        worker_id: Optional[str] = None
+    ):
+        self.session_factory = session_factory
+        self.queue = queue or PostgresSyncJobQueue(session_factory)
+        self.providers = providers if providers is not None else build_default_providers()
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._in_flight: Dict[asyncio.Task, int] = {}  # 실행 중 태스크 → 태스크가 맡은 작업 수
+    
+    async def run(self, stop_event: Optional[asyncio.Event] = None):
+        """stop_event가 설정될 때까지 작업을 가져와 실행, 종료 시 실행 중 작업은 마무리"""
+        stop_event = stop_event or asyncio.Event()
+        logger.info(f"Sync worker {self.worker_id} started (concurrency={self.concurrency})")
+        
+        await self.queue.requeue_stale(self.stale_after)
+        
+        while not stop_event.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Sync worker poll failed: {e}")
+            
+            # 작업이 끝나거나 poll 주기가 지나면 다시 가져오기
+            waiters = set(self._in_flight)
+            stop_waiter = asyncio.ensure_future(stop_event.wait())
+            waiters.add(stop_waiter)
+            await asyncio.wait(waiters, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+            stop_waiter.cancel()
+        
+        if self._in_flight:
+            logger.info(f"Sync worker {self.worker_id} draining {len(self._in_flight)} jobs")
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        logger.info(f"Sync worker {self.worker_id} stopped")
+    
+    async def run_once(self) -> int:
+        """빈 슬롯만큼 작업을 가져와 시작, 시작한 작업 수 반환"""
+        free_slots = self.concurrency - sum(self._in_flight.values())
+        if free_slots <= 0:
+            return 0
+        
+        jobs = await self.queue.claim(self.worker_id, free_slots)
+        for group in group_jobs_by_connection(jobs):
+            task = asyncio.ensure_future(self._run_connection_jobs(group))
+            self._in_flight[task] = len(group)
+            task.add_done_callback(lambda done: self._in_flight.pop(done, None))
+        return len(jobs)
+    
+    async def _run_connection_jobs(self, jobs: List[ClaimedSyncJob]):
+        """같은 연결의 작업들을 sync_connection 한 번으로 실행 후 작업별 결과 기록"""
+        first = jobs[0]
+        try:
+            # 캘린더별 동기화는 sync_connection이 태스크마다 별도 세션으로 실행
+            async with self.session_factory() as session:
+                service = CalendarSyncService(session, self.providers, self.session_factory)
+                result = await service.sync_connection(
+                    first.user_id, first.connection_id,
+                    [job.external_calendar_id for job in jobs], first.options
+                )
+        except Exception as e:
+            logger.error(f"Sync jobs for connection {first.connection_id} crashed: {e}")
+            for job in jobs:
+                await self._record_failure(job, str(e))
+            return
+        
+        for job in jobs:
+            calendar_result = result.calendars.get(job.external_calendar_id)
+            if calendar_result is None:
+                # 연결 단계에서 실패 (연결 없음/비활성/토큰 복호화 실패)
+                await self._record_failure(job, result.error_message or "Sync failed")
+            else:
+                await self._record_result(job, calendar_result)
+    
+    async def _record_result(self, job: ClaimedSyncJob, result: SyncResult):
+        """캘린더 작업 하나의 결과 기록"""
+        try:
+            if result.success:
+                await self.queue.complete(job.job_id, {
+                    'events_processed': result.events_processed,
+                    'events_created': result.events_created,
+                    'events_updated': result.events_updated,
+                    'events_deleted': result.events_deleted,
+                    'events_unchanged': result.events_unchanged,
+                    'bytes_transferred': result.bytes_transferred,
+                    'bytes_per_event': result.bytes_per_event,
+                    'has_more': result.has_more
+                })
+            elif result.busy:
+                # 다른 노드가 실행 중인 캘린더: 시도 횟수를 쓰지 않고 잠시 뒤 다시 실행
+                await self.queue.defer(job.job_id, result.error_message)
+            else:
+                await self.queue.fail(job.job_id, result.error_message or "Sync failed")
+        except Exception as e:
+            logger.error(f"Failed to record sync job {job.job_id} result: {e}")
+    
+    async def _record_failure(self, job: ClaimedSyncJob, error: str):
+        try:
+            await self.queue.fail(job.job_id, error)
+        except Exception as record_error:
+            logger.error(f"Failed to record sync job {job.job_id} failure: {record_error}")
+
+async def main():
+    parser = argparse.ArgumentParser(description="Mokkoji calendar sync worker")
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('SYNC_WORKER_CONCURRENCY', '4')))
+    parser.add_argument('--poll-interval', type=float, default=2.0)
+    parser.add_argument('--with-scheduler', action='store_true',
+                        help="도래한 캘린더 적재 스케줄러, 변경 알림 채널 갱신, 토큰 선제 갱신 루프도 함께 실행")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+    
+    # 동시 작업 수 + claim/기록용 여유 연결
+    engine = create_async_engine(database_url, pool_size=args.concurrency + 2)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    # PROVIDER_QUOTA_STORE=postgres면 쿼터 버킷을 다른 워커/API 레플리카와 공유
+    get_provider_registry().use_shared_quota_store(PostgresQuotaStore(session_factory))
+    
+    worker = SyncWorker(
+        session_factory,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval
+    )
+    
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    
+    tasks = [worker.run(stop_event)]
+    if args.with_scheduler:
+        tasks.append(SyncScheduler(session_factory).run(stop_event))
+        tasks.append(WatchChannelService(session_factory).run(stop_event))
+        tasks.append(TokenRefreshService(session_factory).run(stop_event))
+    
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await close_provider_registry()
+        await engine.dispose()
+
+if __name__ == '__main__':
+    asyncio.run(main())
+
+# Acceptance Criteria:
+# - API 프로세스와 독립적으로 실행/확장되는 워커 엔트리 포인트
+# - concurrency로 동시 동기화 수 제한, 빈 슬롯만큼만 작업 획득
+# - 같은 연결의 작업은 묶어서 동시 실행하고 토큰은 연결당 한 번만 복호화
+# - 작업별 성공/실패/재시도 상태를 sync_jobs에 기록
+# - SIGTERM 시 새 작업은 가져오지 않고 실행 중 작업을 마무리
+# - --with-scheduler로 적응형 폴링 스케줄러, 알림 채널 갱신, 토큰 선제 갱신을 같은 프로세스에서 실행 가능
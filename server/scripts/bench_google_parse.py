@@ -0,0 +1,144 @@
+"""Microbenchmark for Google events.list page parsing
+
+설계 의도:
+- 2,500건(events.list maxResults 상한) 페이지를 파싱하는 처리량(events/sec)과 이벤트당 유지 메모리 측정
+- 이전 방식(__dict__ dataclass + 이벤트마다 fromisoformat/strptime, 참석자 list 생성)과 현재 fast path 비교
+- 타임스탬프 캐시는 매 반복마다 비워 캐시가 없는 첫 페이지 기준으로 측정
+
+실행: python scripts/bench_google_parse.py --events 2500 --repeat 20
+
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.integrations import google_provider  # noqa: E402
+from app.integrations.google_provider import GoogleCalendarProvider  # noqa: E402
+
+@dataclass
+class LegacyEventDTO:
+    """이전 CalendarEventDTO (slots 없음, 참석자 기본값 list factory)"""
+    external_event_id: str
+    calendar_id: str
+    title: str
+    description: Optional[str] = None
+    start_utc: datetime = field(default_factory=datetime.utcnow)
+    end_utc: Optional[datetime] = None
+    all_day: bool = False
+    location: Optional[str] = None
+    recurrence_rule: Optional[str] = None
+    attendees: List[Dict[str, Any]] = field(default_factory=list)
+    external_updated_at: datetime = field(default_factory=datetime.utcnow)
+    external_version: Optional[str] = None
+    deleted: bool = False
+
+def legacy_parse_datetime(dt_obj: Dict[str, Any]) -> datetime:
+    if 'dateTime' in dt_obj:
+        return datetime.fromisoformat(dt_obj['dateTime'].replace('Z', '+00:00')).astimezone(timezone.utc)
+    return datetime.strptime(dt_obj['date'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
+
+def legacy_parse_event(provider: GoogleCalendarProvider, event_data: Dict[str, Any]) -> LegacyEventDTO:
+    """이전 _parse_event 구현"""
+    attendees = []
+    for attendee in event_data.get('attendees', []):
+        attendees.append({
+            'email': attendee.get('email'),
+            'name': attendee.get('displayName'),
+            'status': attendee.get('responseStatus', 'needsAction')
+        })
+    return LegacyEventDTO(
+        external_event_id=event_data['id'],
+        calendar_id=event_data.get('organizer', {}).get('email', ''),
+        title=event_data.get('summary', 'No Title'),
+        description=event_data.get('description'),
+        start_utc=legacy_parse_datetime(event_data['start']),
+        end_utc=legacy_parse_datetime(event_data.get('end', event_data['start'])),
+        all_day='date' in event_data['start'],
+        location=event_data.get('location'),
+        recurrence_rule=provider._parse_recurrence(event_data.get('recurrence', [])),
+        attendees=attendees,
+        external_updated_at=datetime.fromisoformat(
+            event_data['updated'].replace('Z', '+00:00')
+        ).astimezone(timezone.utc),
+        external_version=event_data.get('etag'),
+        deleted=event_data.get('status') == 'cancelled'
+    )
+
+def sample_page(count: int) -> List[Dict[str, Any]]:
+    """업무 캘린더와 비슷한 분포의 events.list 항목 (20% 참석자, 14% 종일, 10% 반복)"""
+    items = []
+    for i in range(count):
+        day, hour = (i % 28) + 1, 8 + (i % 10)
+        item = {
+            'id': f'evt_{i}',
+            'etag': f'"{3181161784712000 + i}"',
+            'status': 'cancelled' if i % 50 == 0 else 'confirmed',
+            'updated': f'2025-03-{day:02d}T{i % 24:02d}:{i % 60:02d}:{(i * 7) % 60:02d}.{i % 1000:03d}Z',
+            'summary': f'Event {i}',
+            'start': {'dateTime': f'2025-03-{day:02d}T{hour:02d}:00:00+09:00'},
+            'end': {'dateTime': f'2025-03-{day:02d}T{hour + 1:02d}:00:00+09:00'},
+            'organizer': {'email': 'owner@example.com'}
+        }
+        if i % 5 == 0:
+            item['attendees'] = [
+                {'email': f'guest{j}@example.com', 'displayName': f'Guest {j}', 'responseStatus': 'accepted'}
+                for j in range(3)
+            ]
+        if i % 7 == 0:
+            item['start'] = {'date': f'2025-03-{day:02d}'}
+            item['end'] = {'date': f'2025-03-{day:02d}'}
+        if i % 10 == 0:
+            item['recurrence'] = ['RRULE:FREQ=WEEKLY;BYDAY=MO']
+        items.append(item)
+    return items
+
+def measure(parse: Callable[[Dict[str, Any]], Any], items: List[Dict[str, Any]], repeat: int):
+    """(최고 events/sec, 이벤트당 유지 바이트)"""
+    best = float('inf')
+    for _ in range(repeat):
+        google_provider._parse_rfc3339.cache_clear()
+        google_provider._parse_all_day_date.cache_clear()
+        started = time.perf_counter()
+        for item in items:
+            parse(item)
+        best = min(best, time.perf_counter() - started)
+
+    google_provider._parse_rfc3339.cache_clear()
+    google_provider._parse_all_day_date.cache_clear()
+    tracemalloc.start()
+    events = [parse(item) for item in items]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return len(items) / best, retained / len(items)
+
+def main():
+    parser = argparse.ArgumentParser(description="Google event parsing microbenchmark")
+    parser.add_argument('--events', type=int, default=2500)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    provider = GoogleCalendarProvider('client_id', 'client_secret')
+    items = sample_page(args.events)
+
+    before = measure(lambda item: legacy_parse_event(provider, item), items, args.repeat)
+    after = measure(provider._parse_event, items, args.repeat)
+
+    print(f"page of {args.events} events, best of {args.repeat}")
+    print(f"before: {before[0]:>10,.0f} events/sec  {before[1]:>6.0f} bytes/event")
+    print(f"after:  {after[0]:>10,.0f} events/sec  {after[1]:>6.0f} bytes/event")
+    print(f"speedup: {after[0] / before[0]:.2f}x, memory: {after[1] / before[1]:.0%}")
+
+if __name__ == '__main__':
+    main()
+
+# Acceptance Criteria:
+# - 2,500건 페이지 파싱의 events/sec와 이벤트당 유지 메모리를 이전/현재 구현으로 비교 출력
+# - 캐시가 비어 있는 상태에서 측정
@@ -0,0 +1,56 @@
+"""Local stand-in for Google Calendar push notifications
+
+설계 의도:
+- 실제 Google 없이 로컬 서버의 /api/sync/webhooks/google 엔드포인트를 검증
+- Google이 보내는 X-Goog-* 헤더를 그대로 흉내 낸 빈 본문 POST 전송
+- 채널 ID/토큰/리소스 ID는 sync_state의 watch_* 컬럼 값을 사용
+
+실행: python scripts/fake_google_push.py --channel-id <id> --resource-id <id> --token <token>
+
+"""
+import argparse
+import asyncio
+import itertools
+
+import httpx
+
+async def post_notifications(
+    base_url: str,
+    channel_id: str,
+    resource_id: str,
+    token: str,
+    states
+):
+    """채널 확인(sync) 후 변경(exists) 알림 순서로 전송"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+        for message_number, state in zip(itertools.count(1), states):
+            response = await client.post('/api/sync/webhooks/google', headers={
+                'X-Goog-Channel-ID': channel_id,
+                'X-Goog-Channel-Token': token,
+                'X-Goog-Resource-ID': resource_id,
+                'X-Goog-Resource-State': state,
+                'X-Goog-Resource-URI': 'https://www.googleapis.com/calendar/v3/calendars/primary/events',
+                'X-Goog-Message-Number': str(message_number)
+            })
+            print(f"{state}: {response.status_code} {response.text}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Send fake Google push notifications")
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--channel-id', required=True)
+    parser.add_argument('--resource-id', required=True)
+    parser.add_argument('--token', required=True)
+    parser.add_argument('--changes', type=int, default=1, help="보낼 변경(exists) 알림 수")
+    args = parser.parse_args()
+
+    states = ['sync'] + ['exists'] * args.changes
+    asyncio.run(post_notifications(
+        args.base_url, args.channel_id, args.resource_id, args.token, states
+    ))
+
+if __name__ == '__main__':
+    main()
+
+# Acceptance Criteria:
+# - 로컬 서버에 Google 형식의 sync/exists 알림 전송
+# - 응답으로 알림 수락 여부 확인 가능
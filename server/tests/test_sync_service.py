@@ -9,14 +9,25 @@
 """
 import pytest
 import asyncio
+import dataclasses
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.services.sync_service import CalendarSyncService, SyncOptions, SyncResult
-from app.integrations.base import CalendarEventDTO, ProviderError, RateLimitError
+from app.services.sync_service import CalendarSyncService, SyncOptions, SyncResult, ConnectionSyncResult
+from app.integrations.base import (
+    CalendarEventDTO, ProviderError, RateLimitError, AuthenticationError, WatchChannelDTO, paginate_events,
+    SyncResult as ProviderSyncResult
+)
 from app.models.sync_models import SyncState, ExternalConnection, Event
+from app.services.sync_queue import PostgresSyncJobQueue, SyncJobRequest
+from app.models.sync_job_models import SyncJobStatus
+from app.workers.sync_worker import SyncWorker
+from app.services.polling_policy import PollingPolicy, next_poll_interval, record_poll
+from app.services.sync_scheduler import SyncScheduler
+from app.services.watch_service import WatchChannelService
+from app.services.calendar_list_service import CalendarListService
 from app.core.database import Base
 
 class TestSyncService:
@@ -45,6 +56,8 @@ class TestSyncService:
         provider.capabilities.read = True
         provider.capabilities.write = True  
         provider.capabilities.delta = True
+        provider.fetch_events = AsyncMock()
+        provider.iter_event_pages = lambda *args, **kwargs: paginate_events(provider, *args, **kwargs)
         return provider
 
     @pytest.fixture
@@ -105,7 +118,7 @@ class TestSyncService:
         await db_session.commit()
 
         # Provider mock 설정
-        mock_provider.fetch_events.return_value = MagicMock(
+        mock_provider.fetch_events.return_value = ProviderSyncResult(
             events=sample_events,
             next_delta_token="delta_123",
             max_updated_at=datetime.now(timezone.utc)
@@ -165,7 +178,7 @@ class TestSyncService:
             external_version="v2"
         )
 
-        mock_provider.fetch_events.return_value = MagicMock(
+        mock_provider.fetch_events.return_value = ProviderSyncResult(
             events=[updated_event],
             next_delta_token="delta_456",
             max_updated_at=now
@@ -186,31 +199,684 @@ class TestSyncService:
         assert updated_in_db.external_version == "v2"
 
     @pytest.mark.asyncio
-    async def test_sync_with_rate_limit_retry(self, sync_service, mock_provider):
-        """Rate limit 재시도 테스트"""
+    async def test_sync_calendar_paginated(self, sync_service, mock_provider, sample_events, db_session):
+        """여러 페이지에 걸친 동기화 테스트"""
         # Arrange
         user_id = "user_123"
         connection_id = "conn_123"
         calendar_id = "cal_primary"
 
-        # 첫 번째 호출에서 RateLimitError, 두 번째 호출에서 성공
+        connection = ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        # 두 페이지로 나뉜 응답, delta token은 마지막 페이지에만 존재
         mock_provider.fetch_events.side_effect = [
-            RateLimitError("google", 60),  # 60초 대기
-            MagicMock(
-                events=[],
-                next_delta_token=None,
+            ProviderSyncResult(
+                events=sample_events[:1],
+                has_more=True,
+                next_page_token="page_2"
+            ),
+            ProviderSyncResult(
+                events=sample_events[1:],
+                next_delta_token="delta_789",
                 max_updated_at=datetime.now(timezone.utc)
             )
         ]
 
+        # Act
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            result = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
+
+        # Assert
+        assert result.success is True
+        assert result.events_processed == 2
+        assert result.events_created == 2
+        assert result.next_delta_token == "delta_789"
+
+        # 두 번째 요청은 첫 페이지의 next_page_token 사용
+        second_call = mock_provider.fetch_events.call_args_list[1]
+        assert second_call[1]['page_token'] == "page_2"
+
+    @pytest.mark.asyncio
+    async def test_sync_resumes_from_checkpoint(self, sync_service, mock_provider, sample_events, db_session):
+        """중단된 동기화가 체크포인트부터 재개되는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        connection = ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        mock_provider.fetch_events.side_effect = [
+            ProviderSyncResult(events=sample_events[:1], has_more=True, next_page_token="page_2"),
+            ProviderSyncResult(events=sample_events[:1], has_more=True, next_page_token="page_2"),  # 선행 다운로드분
+            ProviderSyncResult(events=sample_events[1:], next_delta_token="delta_789")
+        ]
+
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            # Act - 첫 실행은 한 페이지만 처리하고 중단
+            first = await sync_service.sync_calendar(
+                user_id, connection_id, calendar_id, SyncOptions(max_pages=1)
+            )
+            # Act - 두 번째 실행은 체크포인트에서 재개
+            second = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
+
+        # Assert
+        assert first.success is True
+        assert first.has_more is True
+        assert first.events_created == 1
+
+        assert second.success is True
+        assert second.resumed is True
+        assert second.has_more is False
+        assert second.events_created == 2  # 체크포인트의 누적 건수 포함
+        assert second.next_delta_token == "delta_789"
+
+        resume_call = mock_provider.fetch_events.call_args_list[-1]
+        assert resume_call[1]['page_token'] == "page_2"
+
+    @pytest.mark.asyncio
+    async def test_sync_refreshes_token_on_401_and_continues(self, sync_service, mock_provider, sample_events, db_session):
+        """동기화 중 401은 토큰을 한 번 갱신하고 처음부터가 아니라 다음 페이지부터 이어서 조회"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        db_session.add(ExternalConnection(
+            id=connection_id, user_id=user_id, platform_type="google",
+            access_token_encrypted="encrypted_token", sync_enabled=True
+        ))
+        await db_session.commit()
+
+        mock_provider.fetch_events.side_effect = [
+            ProviderSyncResult(events=sample_events[:1], has_more=True, next_page_token="page_2"),
+            AuthenticationError("google", "Invalid or expired token"),
+            ProviderSyncResult(events=sample_events[1:], next_delta_token="delta_789")
+        ]
+        refresh = AsyncMock(return_value="new_token")
+
+        # Act
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="old_token")), \
+                patch.object(sync_service.tokens, 'refresh_connection', refresh):
+            result = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
+
+        # Assert
+        assert result.success is True
+        assert result.events_created == 2
+        refresh.assert_awaited_once_with(connection_id, "old_token")
+        retry_call = mock_provider.fetch_events.call_args_list[-1]
+        assert retry_call[0][0] == "new_token"
+        assert retry_call[1]['page_token'] == "page_2"  # 받은 페이지는 다시 받지 않음
+
+    @pytest.mark.asyncio
+    async def test_sync_connection_concurrent(self, sync_service, mock_provider, db_session):
+        """연결 단위 동시 동기화 및 결과 집계 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_ids = ["cal_a", "cal_b", "cal_c"]
+
+        connection = ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        now = datetime.now(timezone.utc)
+        mock_provider.fetch_events.side_effect = lambda token, calendar_id, *args, **kwargs: ProviderSyncResult(
+            events=[CalendarEventDTO(
+                external_event_id=f"{calendar_id}_evt",
+                calendar_id=calendar_id,
+                title=f"Event in {calendar_id}",
+                start_utc=now,
+                external_updated_at=now
+            )],
+            next_delta_token=f"delta_{calendar_id}"
+        )
+        decrypt = AsyncMock(return_value="token")
+
+        # Act
+        with patch('app.services.sync_service.decrypt_token', decrypt):
+            result = await sync_service.sync_connection(
+                user_id, connection_id, calendar_ids, SyncOptions(max_concurrency=2)
+            )
+
+        # Assert
+        assert isinstance(result, ConnectionSyncResult)
+        assert result.success is True
+        assert set(result.calendars) == set(calendar_ids)
+        assert result.events_created == 3
+        assert result.calendars["cal_b"].next_delta_token == "delta_cal_b"
+        decrypt.assert_awaited_once()  # 토큰은 연결당 한 번만 복호화
+
+    @pytest.mark.asyncio
+    async def test_sync_job_queue_worker(self, sync_service, mock_provider, sample_events, db_session):
+        """작업 큐 적재 → 워커 실행 → 상태 기록 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+
+        connection = ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        mock_provider.fetch_events.return_value = ProviderSyncResult(
+            events=sample_events, next_delta_token="delta_123"
+        )
+        queue = PostgresSyncJobQueue(sync_service.session_factory)
+        worker = SyncWorker(
+            sync_service.session_factory, queue,
+            providers=sync_service.providers, concurrency=2
+        )
+
+        # Act
+        job_ids = await queue.enqueue([
+            SyncJobRequest(user_id, connection_id, "cal_a"),
+            SyncJobRequest(user_id, connection_id, "cal_a"),  # 이미 대기 중
+            SyncJobRequest(user_id, connection_id, "cal_b")
+        ])
+        decrypt = AsyncMock(return_value="token")
+        with patch('app.services.sync_service.decrypt_token', decrypt):
+            started = await worker.run_once()
+            await asyncio.gather(*worker._in_flight)
+
+        # Assert
+        assert job_ids[0] and job_ids[2]
+        assert job_ids[1] is None
+        assert started == 2
+        decrypt.assert_awaited_once()  # 같은 연결의 작업은 sync_connection 한 번으로 실행
+        assert await queue.claim("other_worker", 10) == []  # 남은 작업 없음
+
+        job = await queue.get_job(job_ids[0])
+        assert job.status == SyncJobStatus.SUCCEEDED
+        assert job.attempts == 1
+        assert job.result['events_created'] == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_job_queue_force_full_and_lease_contention(self, sync_service, mock_provider, db_session):
+        """대기 중 작업에 온 force_full은 반영되고, lease 경합으로 실행 못 한 작업은 시도 횟수 없이 미뤄지는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id="cal_a",
+            lease_owner="other-node",
+            lease_expires_at=datetime.utcnow() + timedelta(minutes=5)
+        ))
+        await db_session.commit()
+
+        queue = PostgresSyncJobQueue(sync_service.session_factory)
+        worker = SyncWorker(
+            sync_service.session_factory, queue,
+            providers=sync_service.providers, concurrency=2
+        )
+
+        # Act
+        first = await queue.enqueue([SyncJobRequest(user_id, connection_id, "cal_a")])
+        upgraded = await queue.enqueue([
+            SyncJobRequest(user_id, connection_id, "cal_a", SyncOptions(force_full=True))
+        ])
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            started = await worker.run_once()
+            await asyncio.gather(*worker._in_flight)
+
+        # Assert
+        assert first[0] and upgraded == [None]
+        assert started == 1
+        mock_provider.fetch_events.assert_not_called()
+
+        job = await queue.get_job(first[0])
+        assert job.status == SyncJobStatus.QUEUED
+        assert job.attempts == 0  # lease 경합은 시도 횟수를 쓰지 않음
+        assert job.run_after > datetime.utcnow()
+        assert job.options['force_full'] is True
+        assert "in progress" in job.last_error
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sync_single_flight(self, sync_service, mock_provider, sample_events, db_session):
+        """같은 캘린더 동시 동기화 요청이 하나의 실행을 공유하는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        connection = ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return ProviderSyncResult(events=sample_events, next_delta_token="delta_123")
+        mock_provider.fetch_events.side_effect = slow_fetch
+
+        # Act
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            first, second = await asyncio.gather(
+                sync_service.sync_calendar(user_id, connection_id, calendar_id),
+                sync_service.sync_calendar(user_id, connection_id, calendar_id)
+            )
+
+        # Assert
+        assert mock_provider.fetch_events.call_count == 1
+        assert first is second
+        assert first.events_created == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_skipped_when_leased_by_other_node(self, sync_service, mock_provider, db_session):
+        """다른 노드가 lease를 가진 캘린더는 동기화하지 않는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id=calendar_id,
+            lease_owner="other-node",
+            lease_expires_at=datetime.utcnow() + timedelta(minutes=5)
+        ))
+        await db_session.commit()
+
+        # Act
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            result = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
+
+        # Assert
+        assert result.success is False
+        assert "in progress" in result.error_message
+        mock_provider.fetch_events.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_delta_sync_single_commit(self, sync_service, mock_provider, db_session):
+        """한 페이지짜리 동기화는 상태 전이를 커밋 한 번으로 반영하는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id=calendar_id,
+            delta_token="delta_old"
+        ))
+        await db_session.commit()
+
+        mock_provider.fetch_events.return_value = ProviderSyncResult(
+            events=[], next_delta_token="delta_new"
+        )
+
+        # Act
+        with patch.object(db_session, 'commit', wraps=db_session.commit) as commit_spy, \
+                patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")):
+            result = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
+
+        # Assert
+        assert result.success is True
+        assert commit_spy.await_count == 1
+
+        state = await sync_service._get_or_create_sync_state(user_id, connection_id, calendar_id)
+        assert state.delta_token == "delta_new"
+        assert state.lease_owner is None
+        connection = await sync_service._get_connection(connection_id, user_id)
+        assert connection.sync_status == 'idle'
+
+    def test_polling_interval_adapts_to_change_rate(self):
+        """변경이 잦으면 간격 단축, 변경이 없으면 지수 백오프 테스트"""
+        policy = PollingPolicy(jitter_ratio=0.0)
+        now = datetime.now(timezone.utc)
+
+        busy = SyncState(last_polled_at=now - timedelta(minutes=15), poll_interval_seconds=900)
+        record_poll(busy, 12, now, policy)
+        quiet = SyncState(last_polled_at=now - timedelta(minutes=15), poll_interval_seconds=900)
+        record_poll(quiet, 0, now, policy)
+
+        assert busy.poll_interval_seconds == policy.min_interval_seconds
+        assert quiet.poll_interval_seconds == 1800
+        assert busy.next_sync_due_at < quiet.next_sync_due_at
+        assert next_poll_interval(policy, 0.0, policy.max_interval_seconds, 0) == policy.max_interval_seconds
+
+    @pytest.mark.asyncio
+    async def test_scheduler_enqueues_due_calendars(self, sync_service, db_session):
+        """next_sync_due_at이 도래한 캘린더만 적재되는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        now = datetime.utcnow()
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        for calendar_id, due_at in [
+            ("cal_due", now - timedelta(minutes=1)),
+            ("cal_new", None),
+            ("cal_later", now + timedelta(hours=1))
+        ]:
+            db_session.add(SyncState(
+                user_id=user_id,
+                connection_id=connection_id,
+                external_calendar_id=calendar_id,
+                next_sync_due_at=due_at
+            ))
+        await db_session.commit()
+
+        queue = PostgresSyncJobQueue(sync_service.session_factory)
+        scheduler = SyncScheduler(sync_service.session_factory, queue)
+
+        # Act
+        scheduled = await scheduler.schedule_due(now)
+        rescheduled = await scheduler.schedule_due(now)  # 선점된 캘린더는 다시 적재되지 않음
+
+        # Assert
+        assert scheduled == 2
+        assert rescheduled == 0
+        claimed = await queue.claim("worker_1", 10)
+        assert sorted(job.external_calendar_id for job in claimed) == ["cal_due", "cal_new"]
+
+    async def _post_google_notification(self, watch_service, state, channel_id="chan_1",
+                                        resource_id="res_1", token="secret"):
+        """Google 웹훅 헤더를 흉내 낸 가짜 알림 전송"""
+        headers = {
+            'X-Goog-Channel-ID': channel_id,
+            'X-Goog-Resource-ID': resource_id,
+            'X-Goog-Resource-State': state,
+            'X-Goog-Channel-Token': token
+        }
+        return await watch_service.handle_notification(
+            channel_id=headers['X-Goog-Channel-ID'],
+            resource_id=headers['X-Goog-Resource-ID'],
+            resource_state=headers['X-Goog-Resource-State'],
+            channel_token=headers['X-Goog-Channel-Token']
+        )
+
+    @pytest.mark.asyncio
+    async def test_google_push_notification_queues_delta_sync(self, sync_service, db_session):
+        """변경 알림이 해당 캘린더만 적재하고 잘못된 알림은 무시하는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id="cal_watched",
+            watch_channel_id="chan_1",
+            watch_resource_id="res_1",
+            watch_token="secret",
+            watch_expires_at=datetime.utcnow() + timedelta(days=1)
+        ))
+        await db_session.commit()
+
+        queue = PostgresSyncJobQueue(sync_service.session_factory)
+        watch_service = WatchChannelService(
+            sync_service.session_factory, queue, providers=sync_service.providers
+        )
+
         # Act & Assert
-        with patch('asyncio.sleep') as mock_sleep:  # sleep 모킹
+        assert await self._post_google_notification(watch_service, "sync") is True
+        assert await queue.claim("worker_1", 10) == []  # 채널 확인 알림은 적재하지 않음
+
+        assert await self._post_google_notification(watch_service, "exists", token="forged") is False
+        assert await self._post_google_notification(watch_service, "exists", channel_id="unknown") is False
+        assert await self._post_google_notification(watch_service, "exists") is True
+        assert await self._post_google_notification(watch_service, "exists") is True  # 대기 중 작업에 합쳐짐
+
+        claimed = await queue.claim("worker_1", 10)
+        assert [job.external_calendar_id for job in claimed] == ["cal_watched"]
+        assert claimed[0].options.force_full is False
+
+    @pytest.mark.asyncio
+    async def test_watch_channel_renewal(self, sync_service, mock_provider, db_session):
+        """만료 임박 채널은 새 채널 생성 후 기존 채널을 중지하는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        now = datetime.now(timezone.utc)
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id="cal_expiring",
+            watch_channel_id="old_chan",
+            watch_resource_id="old_res",
+            watch_token="old_secret",
+            watch_expires_at=now + timedelta(hours=1)
+        ))
+        db_session.add(SyncState(
+            user_id=user_id,
+            connection_id=connection_id,
+            external_calendar_id="cal_fresh",
+            watch_channel_id="fresh_chan",
+            watch_resource_id="fresh_res",
+            watch_token="fresh_secret",
+            watch_expires_at=now + timedelta(days=5)
+        ))
+        await db_session.commit()
+
+        mock_provider.watch_events = AsyncMock(side_effect=lambda *args, **kwargs: WatchChannelDTO(
+            channel_id=kwargs['channel_id'], resource_id="new_res",
+            expires_at=now + timedelta(days=7), token=kwargs['token']
+        ))
+        mock_provider.stop_channel = AsyncMock()
+        watch_service = WatchChannelService(
+            sync_service.session_factory, providers=sync_service.providers,
+            webhook_url="https://example.com/api/sync/webhooks/google"
+        )
+
+        # Act
+        with patch('app.services.watch_service.decrypt_token', AsyncMock(return_value="token")):
+            renewed = await watch_service.ensure_channels(now)
+
+        # Assert
+        assert renewed == 1
+        mock_provider.watch_events.assert_awaited_once()
+        assert mock_provider.watch_events.await_args.args[1] == "cal_expiring"
+        mock_provider.stop_channel.assert_awaited_once_with("token", "old_chan", "old_res")
+
+        state = await sync_service._get_or_create_sync_state(user_id, connection_id, "cal_expiring")
+        assert state.watch_channel_id not in (None, "old_chan")
+        assert state.watch_resource_id == "new_res"
+        assert state.watch_token != "old_secret"
+
+    @pytest.mark.asyncio
+    async def test_watch_channel_renewal_backs_off_failures(self, sync_service, mock_provider, db_session):
+        """채널 없는 캘린더부터 갱신하고, 실패한 캘린더는 retry_after 전까지 다시 선점하지 않는지 테스트"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        now = datetime.now(timezone.utc)
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        for calendar_id, expires_at in [
+            ("cal_broken", now + timedelta(minutes=30)),
+            ("cal_expiring", now + timedelta(hours=1)),
+            ("cal_new", None)
+        ]:
+            db_session.add(SyncState(
+                user_id=user_id,
+                connection_id=connection_id,
+                external_calendar_id=calendar_id,
+                watch_expires_at=expires_at
+            ))
+        await db_session.commit()
+
+        async def watch_events(access_token, calendar_id, **kwargs):
+            if calendar_id == "cal_broken":
+                raise ProviderError("Channel creation failed", "google")
+            return WatchChannelDTO(
+                channel_id=kwargs['channel_id'], resource_id=f"res_{calendar_id}",
+                expires_at=now + timedelta(days=7), token=kwargs['token']
+            )
+
+        mock_provider.watch_events = AsyncMock(side_effect=watch_events)
+        watch_service = WatchChannelService(
+            sync_service.session_factory, providers=sync_service.providers,
+            webhook_url="https://example.com/api/sync/webhooks/google", batch_size=2
+        )
+
+        # Act
+        with patch('app.services.watch_service.decrypt_token', AsyncMock(return_value="token")):
+            first = await watch_service.ensure_channels(now)
+            second = await watch_service.ensure_channels(now + timedelta(minutes=1))
+            retried = await watch_service.ensure_channels(now + watch_service.retry_after + timedelta(minutes=1))
+
+        # Assert
+        attempted = [call.args[1] for call in mock_provider.watch_events.await_args_list]
+        assert attempted == ["cal_new", "cal_broken", "cal_expiring", "cal_broken"]
+        assert (first, second, retried) == (1, 1, 0)
+
+        broken = await sync_service._get_or_create_sync_state(user_id, connection_id, "cal_broken")
+        fresh = await sync_service._get_or_create_sync_state(user_id, connection_id, "cal_new")
+        assert broken.watch_channel_id is None and broken.watch_retry_at is not None
+        assert fresh.watch_resource_id == "res_cal_new" and fresh.watch_retry_at is None
+
+    @pytest.mark.asyncio
+    async def test_calendar_list_cache_revalidation(self, sync_service, db_session):
+        """TTL 안에서는 캐시 사용, TTL 경과 시 ETag로 재검증하고 304면 목록 유지"""
+        from app.integrations.base import CalendarDTO, CacheValidators, CalendarListResult
+
+        # Arrange
+        connection = ExternalConnection(
+            id="conn_cal", user_id="user_cal", platform_type="google",
+            access_token_encrypted="x", sync_enabled=True
+        )
+        db_session.add(connection)
+        await db_session.commit()
+
+        calendars = [CalendarDTO(external_calendar_id="primary", display_name="Me", primary=True)]
+        provider = MagicMock()
+        provider.list_calendars_conditional = AsyncMock(side_effect=[
+            CalendarListResult(calendars=calendars, validators=CacheValidators(etag='"list-v1"')),
+            CalendarListResult(calendars=None, validators=CacheValidators(etag='"list-v1"'))
+        ])
+        service = CalendarListService(db_session, {"google": provider}, ttl=timedelta(hours=1))
+        now = datetime(2025, 3, 24, 9, 0, tzinfo=timezone.utc)
+
+        # Act
+        with patch('app.services.calendar_list_service.decrypt_token', AsyncMock(return_value="token")):
+            first = await service.get_calendars(connection, now=now)
+            cached = await service.get_calendars(connection, now=now + timedelta(minutes=30))
+            revalidated = await service.get_calendars(connection, now=now + timedelta(hours=2))
+
+        # Assert
+        assert [c.external_calendar_id for c in first] == ["primary"]
+        assert cached == first and revalidated == first
+        assert provider.list_calendars_conditional.await_count == 2  # TTL 안의 요청은 호출 없음
+        first_call, second_call = provider.list_calendars_conditional.await_args_list
+        assert first_call.args[1] is None
+        assert second_call.args[1].etag == '"list-v1"'
+
+    @pytest.mark.asyncio
+    async def test_sync_rate_limit_not_retried_in_service(self, sync_service, mock_provider, db_session):
+        """재시도 정책이 포기한 Rate limit은 서비스에서 다시 재시도하지 않음"""
+        # Arrange
+        user_id = "user_123"
+        connection_id = "conn_123"
+        calendar_id = "cal_primary"
+
+        db_session.add(ExternalConnection(
+            id=connection_id,
+            user_id=user_id,
+            platform_type="google",
+            access_token_encrypted="encrypted_token",
+            sync_enabled=True
+        ))
+        await db_session.commit()
+
+        # 제공자 HTTP 계층이 재시도를 마친 뒤 남은 RateLimitError
+        mock_provider.fetch_events.side_effect = RateLimitError("google", 60)
+
+        # Act & Assert
+        with patch('app.services.sync_service.decrypt_token', AsyncMock(return_value="token")), \
+                patch('asyncio.sleep') as mock_sleep:  # sleep 모킹
             result = await sync_service.sync_calendar(user_id, connection_id, calendar_id)
             
-            # 재시도가 발생했는지 확인
-            assert mock_provider.fetch_events.call_count == 2
-            mock_sleep.assert_called_once()  # sleep이 호출됨
-            assert result.success is True
+            # 서비스 계층 재시도 없이 실패로 반환 (다음 작업 실행에서 다시 시도)
+            assert mock_provider.fetch_events.call_count == 1
+            mock_sleep.assert_not_called()
+            assert result.success is False
+            assert "Rate limit exceeded" in result.error_message
 
     @pytest.mark.asyncio  
     async def test_sync_with_provider_error(self, sync_service, mock_provider):
@@ -252,20 +918,164 @@ class TestSyncService:
                 external_version="v1"
             ))
 
-        # Act - 시간 측정
-        start_time = datetime.now()
-        result = await sync_service._upsert_events(
-            user_id, platform, calendar_id, events, batch_size=100
+        # Act - 시간 측정
+        start_time = datetime.now()
+        result = await sync_service._upsert_events(
+            user_id, platform, calendar_id, events, batch_size=100
+        )
+        end_time = datetime.now()
+
+        # Assert
+        assert result['created'] == 1000
+        assert result['updated'] == 0
+        
+        # 성능 확인 (배치당 set-based 문장이므로 1초 이내)
+        processing_time = (end_time - start_time).total_seconds()
+        assert processing_time < 1.0, f"Processing took {processing_time}s, expected < 1s"
+
+    @pytest.mark.asyncio
+    async def test_batch_upsert_last_write_wins(self, sync_service, sample_events):
+        """배치 upsert의 Last-Write-Wins 가드와 생성/수정 건수 테스트"""
+        # Arrange
+        user_id = "user_123"
+        platform = "google"
+        calendar_id = "cal_primary"
+        await sync_service._upsert_events(user_id, platform, calendar_id, sample_events, batch_size=10)
+
+        stale = CalendarEventDTO(
+            external_event_id="evt_1",
+            calendar_id=calendar_id,
+            title="Stale Title",
+            start_utc=sample_events[0].start_utc,
+            external_updated_at=sample_events[0].external_updated_at - timedelta(minutes=5)
+        )
+        fresh = CalendarEventDTO(
+            external_event_id="evt_2",
+            calendar_id=calendar_id,
+            title="Fresh Title",
+            start_utc=sample_events[1].start_utc,
+            external_updated_at=sample_events[1].external_updated_at + timedelta(minutes=5)
+        )
+        new = CalendarEventDTO(
+            external_event_id="evt_3",
+            calendar_id=calendar_id,
+            title="New Event",
+            start_utc=sample_events[0].start_utc
+        )
+
+        # Act
+        result = await sync_service._upsert_events(
+            user_id, platform, calendar_id, [stale, fresh, new], batch_size=10
+        )
+
+        # Assert
+        assert result == {'created': 1, 'updated': 1, 'deleted': 0, 'unchanged': 1}
+
+        stored = await sync_service._get_event_by_external_id(user_id, platform, calendar_id, "evt_1")
+        assert stored.title == "Meeting 1"  # 더 오래된 외부 버전은 무시됨
+        stored = await sync_service._get_event_by_external_id(user_id, platform, calendar_id, "evt_2")
+        assert stored.title == "Fresh Title"
+
+    @pytest.mark.asyncio
+    async def test_upsert_skips_unchanged_content(self, sync_service):
+        """메타데이터만 바뀐 재전송은 내용을 쓰지 않고 unchanged로 집계하되 외부 버전은 앞당기는지 테스트"""
+        # Arrange: Naver ICS처럼 external_version 없이 DTSTAMP만 매번 바뀌는 이벤트
+        user_id = "user_123"
+        platform = "naver"
+        calendar_id = "cal_ics"
+        start = datetime(2025, 3, 10, 9, 0, tzinfo=timezone.utc)
+        downloaded_at = datetime.now(timezone.utc)
+
+        def delivery(title: str, dtstamp: datetime, version=None) -> CalendarEventDTO:
+            return CalendarEventDTO(
+                external_event_id="ics_1",
+                calendar_id=calendar_id,
+                title=title,
+                start_utc=start,
+                end_utc=start + timedelta(hours=1),
+                external_updated_at=dtstamp,
+                external_version=version
+            )
+
+        await sync_service._upsert_events(
+            user_id, platform, calendar_id, [delivery("Standup", downloaded_at)], batch_size=10
+        )
+        first = await sync_service._get_event_by_external_id(user_id, platform, calendar_id, "ics_1")
+        first_updated_at = first.updated_at
+
+        # Act
+        redelivered = await sync_service._upsert_events(
+            user_id, platform, calendar_id,
+            [delivery("Standup", downloaded_at + timedelta(hours=1), version='"v2"')], batch_size=10
+        )
+        untouched = await sync_service._get_event_by_external_id(user_id, platform, calendar_id, "ics_1")
+        untouched_updated_at = untouched.updated_at
+        untouched_version = (untouched.external_version, untouched.external_updated_at.replace(tzinfo=timezone.utc))
+        edited = await sync_service._upsert_events(
+            user_id, platform, calendar_id,
+            [delivery("Standup (moved)", downloaded_at + timedelta(hours=2))], batch_size=10
         )
-        end_time = datetime.now()
 
         # Assert
-        assert result['created'] == 1000
-        assert result['updated'] == 0
-        
-        # 성능 확인 (10초 이내)
-        processing_time = (end_time - start_time).total_seconds()
-        assert processing_time < 10.0, f"Processing took {processing_time}s, expected < 10s"
+        assert redelivered == {'created': 0, 'updated': 0, 'deleted': 0, 'unchanged': 1}
+        assert untouched_updated_at == first_updated_at
+        assert untouched_version == ('"v2"', downloaded_at + timedelta(hours=1))  # 버전 컬럼은 앞당김
+        assert edited == {'created': 0, 'updated': 1, 'deleted': 0, 'unchanged': 0}
+        assert delivery("Standup", downloaded_at).content_fingerprint() == \
+            delivery("Standup", downloaded_at + timedelta(days=1)).content_fingerprint()
+
+        stored = await sync_service._get_event_by_external_id(user_id, platform, calendar_id, "ics_1")
+        assert stored.title == "Standup (moved)"
+        assert stored.updated_at != first_updated_at
+
+    @pytest.mark.asyncio
+    async def test_upsert_counts_on_postgres(self):
+        """Postgres 분기(RETURNING)의 생성/수정/unchanged 집계 테스트 (sqlite 분기는 다른 경로)"""
+        import os
+        database_url = os.getenv('TEST_POSTGRES_URL')
+        if not database_url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+
+        engine = create_async_engine(database_url, echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+                service = CalendarSyncService(session, providers={})
+                user_id = "user_pg"
+                calendar_id = "cal_pg"
+                start = datetime(2025, 3, 10, 9, 0, tzinfo=timezone.utc)
+                stamp = datetime.now(timezone.utc)
+
+                def event(event_id: str, title: str, updated_at: datetime) -> CalendarEventDTO:
+                    return CalendarEventDTO(
+                        external_event_id=event_id,
+                        calendar_id=calendar_id,
+                        title=title,
+                        start_utc=start,
+                        end_utc=start + timedelta(hours=1),
+                        external_updated_at=updated_at
+                    )
+
+                created = await service._upsert_events(
+                    user_id, "google", calendar_id,
+                    [event("pg_1", "A", stamp), event("pg_2", "B", stamp)], batch_size=10
+                )
+                # Act
+                later = stamp + timedelta(minutes=5)
+                second = await service._upsert_events(
+                    user_id, "google", calendar_id,
+                    [event("pg_1", "A (moved)", later), event("pg_2", "B", later), event("pg_3", "C", later)],
+                    batch_size=10
+                )
+
+            # Assert
+            assert created == {'created': 2, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+            assert second == {'created': 1, 'updated': 1, 'deleted': 0, 'unchanged': 1}
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
 
     @pytest.mark.asyncio
     async def test_delta_token_fallback(self, sync_service, mock_provider):
@@ -279,7 +1089,7 @@ class TestSyncService:
         # 두 번째: 정상 full sync
         mock_provider.fetch_events.side_effect = [
             ProviderError("Invalid sync token", "google"),
-            MagicMock(
+            ProviderSyncResult(
                 events=[],
                 next_delta_token="new_delta_123",
                 max_updated_at=datetime.now(timezone.utc)
@@ -376,6 +1186,320 @@ class TestProviderIntegration:
         assert len(calendars) > 0
         assert any(cal.primary for cal in calendars)  # primary 캘린더 존재
 
+    def test_google_parse_event_fast_path(self):
+        """fast path 파싱 결과가 UTC 변환/종일/참석자/반복 규칙을 그대로 유지하고 DTO는 slots 사용"""
+        from app.integrations.google_provider import GoogleCalendarProvider
+
+        provider = GoogleCalendarProvider("client_id", "client_secret")
+        timed = provider._parse_event({
+            'id': 'evt_1', 'etag': '"v1"', 'status': 'confirmed', 'updated': '2025-03-17T00:00:00.000Z',
+            'summary': 'Standup', 'organizer': {'email': 'owner@example.com'},
+            'start': {'dateTime': '2025-03-17T09:00:00+09:00'}, 'end': {'dateTime': '2025-03-17T09:30:00+09:00'},
+            'attendees': [{'email': 'a@example.com', 'displayName': 'A'}],
+            'recurrence': ['RRULE:FREQ=DAILY']
+        })
+        all_day = provider._parse_event({
+            'id': 'evt_2', 'updated': '2025-03-17T00:00:00Z', 'status': 'cancelled', 'start': {'date': '2025-03-18'}
+        })
+
+        assert timed.start_utc == datetime(2025, 3, 17, 0, 0, tzinfo=timezone.utc)
+        assert timed.end_utc == datetime(2025, 3, 17, 0, 30, tzinfo=timezone.utc)
+        assert timed.external_updated_at == datetime(2025, 3, 17, tzinfo=timezone.utc)
+        assert timed.attendees == [{'email': 'a@example.com', 'name': 'A', 'status': 'needsAction'}]
+        assert timed.recurrence_rule == 'RRULE:FREQ=DAILY'
+        assert timed.calendar_id == 'owner@example.com'
+        assert all_day.all_day and all_day.deleted
+        assert all_day.start_utc == all_day.end_utc == datetime(2025, 3, 18, tzinfo=timezone.utc)
+        assert all_day.attendees == () and all_day.calendar_id == '' and all_day.title == 'No Title'
+        assert not hasattr(all_day, '__dict__')  # 이벤트마다 __dict__를 만들지 않음
+
+    @pytest.mark.asyncio
+    async def test_google_fetch_partial_response_gzip(self):
+        """fields= partial response와 gzip 요청, 페이지 수신 바이트 기록 테스트"""
+        import gzip
+        import json as json_lib
+        import httpx
+        from app.integrations.google_provider import GoogleCalendarProvider, EVENT_LIST_FIELDS
+
+        requests = []
+        payload = gzip.compress(json_lib.dumps({
+            'items': [{
+                'id': 'evt_1', 'etag': '"v1"', 'status': 'confirmed', 'summary': 'Standup',
+                'updated': '2025-03-17T00:00:00Z',
+                'start': {'dateTime': '2025-03-17T09:00:00Z'}, 'end': {'dateTime': '2025-03-17T10:00:00Z'}
+            }],
+            'nextSyncToken': 'sync_1'
+        }).encode())
+
+        class WireStream(httpx.AsyncByteStream):
+            # content=로 만든 응답은 미리 읽혀 수신 바이트가 집계되지 않으므로 스트림으로 전달
+            async def __aiter__(self):
+                yield payload
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, headers={'Content-Encoding': 'gzip'}, stream=WireStream())
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider = GoogleCalendarProvider("client_id", "client_secret", http_client=client)
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        page = await provider.fetch_events("token", "primary", since, since + timedelta(days=30))
+        await client.aclose()
+
+        # Assert
+        assert requests[0].url.params['fields'] == EVENT_LIST_FIELDS
+        assert 'gzip' in requests[0].headers['Accept-Encoding']
+        assert 'gzip' in requests[0].headers['User-Agent']
+        assert page.events[0].title == "Standup"
+        assert page.bytes_transferred == len(payload)  # 압축된 전송량 기준
+
+    @pytest.mark.asyncio
+    async def test_google_fetch_events_streaming_decode(self):
+        """events.list 응답을 작은 청크로 받아도 원소 단위로 디코딩, 끊긴 응답은 오류"""
+        import json as json_lib
+        import httpx
+        from app.integrations.base import ProviderError
+        from app.integrations.google_provider import GoogleCalendarProvider
+
+        body = json_lib.dumps({
+            'nextPageToken': 'page_2',
+            'items': [{
+                'id': f'evt_{i}', 'etag': f'"v{i}"', 'status': 'confirmed', 'summary': f'회의 {i}',
+                'updated': '2025-03-17T00:00:00Z',
+                'start': {'dateTime': '2025-03-17T09:00:00Z'}, 'end': {'dateTime': '2025-03-17T10:00:00Z'}
+            } for i in range(20)]
+        }, ensure_ascii=False).encode()
+        truncate = {'enabled': False}
+
+        class ChunkedStream(httpx.AsyncByteStream):
+            # 7바이트씩 잘라 UTF-8 문자/문자열/원소가 청크 경계에 걸치도록 전달
+            async def __aiter__(self):
+                data = body[:len(body) // 2] if truncate['enabled'] else body
+                for start in range(0, len(data), 7):
+                    yield data[start:start + 7]
+
+        def handler(request):
+            return httpx.Response(200, stream=ChunkedStream())
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider = GoogleCalendarProvider("client_id", "client_secret", http_client=client)
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        page = await provider.fetch_events("token", "primary", since, since + timedelta(days=30))
+        truncate['enabled'] = True
+        with pytest.raises(ProviderError):
+            await provider.fetch_events("token", "primary", since, since + timedelta(days=30))
+        await client.aclose()
+
+        # Assert
+        assert [event.external_event_id for event in page.events] == [f'evt_{i}' for i in range(20)]
+        assert page.events[19].title == '회의 19'
+        assert page.has_more and page.next_page_token == 'page_2'
+        assert page.bytes_transferred == len(body)
+
+    @pytest.mark.asyncio
+    async def test_google_fetch_events_parse_offload(self):
+        """임계값 이상 페이지는 프로세스 풀에서 파싱, 미만은 인라인 (네트워크/파싱 시간 분리 보고)"""
+        import json as json_lib
+        import httpx
+        from app.core.config import ParseSettings
+        from app.integrations.google_provider import GoogleCalendarProvider
+        from app.integrations.parse_executor import ParseExecutor
+
+        def page_body(count):
+            return json_lib.dumps({'items': [{
+                'id': f'evt_{i}', 'etag': f'"v{i}"', 'status': 'confirmed', 'summary': f'Event {i}',
+                'updated': '2025-03-17T00:00:00Z',
+                'start': {'dateTime': '2025-03-17T09:00:00Z'}, 'end': {'dateTime': '2025-03-17T10:00:00Z'}
+            } for i in range(count)], 'nextSyncToken': 'sync_1'}).encode()
+
+        sizes = iter([200, 2])
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=page_body(next(sizes)))
+        ))
+        executor = ParseExecutor(ParseSettings(enabled=True, threshold_bytes=4096, max_workers=1))
+        provider = GoogleCalendarProvider("client_id", "client_secret", http_client=client, parse_executor=executor)
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        try:
+            large = await provider.fetch_events("token", "primary", since, since + timedelta(days=30))
+            small = await provider.fetch_events("token", "primary", since, since + timedelta(days=30))
+        finally:
+            executor.close()
+            await client.aclose()
+
+        # Assert
+        assert [event.external_event_id for event in large.events] == [f'evt_{i}' for i in range(200)]
+        assert large.next_delta_token == 'sync_1' and large.events[0].start_utc.tzinfo is not None
+        assert len(small.events) == 2
+        assert large.parse_seconds > 0 and large.network_seconds >= 0
+        stats = executor.snapshot()
+        assert stats['offloaded'] == 1 and stats['inline'] == 1
+
+    @pytest.mark.asyncio
+    async def test_naver_ics_feed_conditional_get(self):
+        """ICS 피드는 ETag로 조건부 요청, 304면 이전 파싱 결과 재사용"""
+        import httpx
+        from app.integrations.naver_provider import NaverCalendarProvider
+
+        ics = (
+            "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:ics_1\r\nSUMMARY:Lunch\r\n"
+            "DTSTART:20250317T030000Z\r\nDTEND:20250317T040000Z\r\nEND:VEVENT\r\nEND:VCALENDAR"
+        )
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-None-Match') == '"feed-v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={'ETag': '"feed-v1"'}, text=ics)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        provider = NaverCalendarProvider("client_id", "client_secret", http_client=client)
+        url = "https://calendar.example.com/feed.ics"
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        first = await provider.fetch_events("token", url, since, since + timedelta(days=30))
+        second = await provider.fetch_events("token", url, since, since + timedelta(days=30))
+        await client.aclose()
+
+        # Assert
+        assert 'If-None-Match' not in requests[0].headers
+        assert requests[1].headers['If-None-Match'] == '"feed-v1"'
+        assert [e.external_event_id for e in second.events] == [e.external_event_id for e in first.events] == ["ics_1"]
+
+    @pytest.mark.asyncio
+    async def test_naver_keeps_rate_limit_error_type(self):
+        """Naver 429는 ProviderError로 감싸지 않고 retry_after를 가진 RateLimitError로 전달"""
+        import httpx
+        from app.integrations.naver_provider import NaverCalendarProvider
+        from app.integrations.resilience import ProviderResilience, RetryPolicy
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={'Retry-After': '30'})
+        ))
+        provider = NaverCalendarProvider(
+            "client_id", "client_secret", http_client=client,
+            resilience=ProviderResilience("naver", RetryPolicy(max_attempts=1))
+        )
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act & Assert
+        with pytest.raises(RateLimitError) as error:
+            await provider.fetch_events("token", "https://calendar.example.com/feed.ics", since, since + timedelta(days=30))
+        await client.aclose()
+        assert error.value.retry_after == 30
+
+    @pytest.mark.asyncio
+    async def test_naver_ics_feed_streaming_parse(self):
+        """ICS 피드 스트리밍 파싱: 줄 접기, TZID/VALUE=DATE, 반복 속성, 윈도우 밖 이벤트 제외"""
+        import httpx
+        from app.integrations.naver_provider import NaverCalendarProvider
+
+        ics = "\r\n".join([
+            "BEGIN:VCALENDAR",
+            "BEGIN:VEVENT",
+            "UID:old_event",
+            "DTSTART:20190101T000000Z",
+            "SUMMARY:Out of window",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "UID:meeting",
+            "DTSTART;TZID=Asia/Seoul:20250317T090000",
+            "DTEND;TZID=\"Asia/Seoul\":20250317T100000",
+            "SUMMARY:주간 회의\\, 3월",
+            "DESCRIPTION:첫 줄\\n둘째 ",
+            " 줄 이어짐",
+            "RRULE:FREQ=WEEKLY;BYDAY=MO",
+            "ATTENDEE;CN=\"Kim; Minji\";PARTSTAT=ACCEPTED:mailto:minji@example.com",
+            "ATTENDEE;PARTSTAT=DECLINED:MAILTO:lee@example.com",
+            "BEGIN:VALARM",
+            "DESCRIPTION:Reminder",
+            "END:VALARM",
+            "END:VEVENT",
+            "BEGIN:VEVENT",
+            "UID:holiday",
+            "DTSTART;VALUE=DATE:20250301",
+            "STATUS:CANCELLED",
+            "END:VEVENT",
+            "END:VCALENDAR",
+        ]).encode()
+
+        class ChunkedStream(httpx.AsyncByteStream):
+            # 청크 경계가 줄/UTF-8 문자 중간에 오도록 5바이트씩 전달
+            async def __aiter__(self):
+                for start in range(0, len(ics), 5):
+                    yield ics[start:start + 5]
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=ChunkedStream())
+        ))
+        provider = NaverCalendarProvider("client_id", "client_secret", http_client=client)
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        page = await provider.fetch_events("token", "https://calendar.example.com/feed.ics", since, since + timedelta(days=30))
+        await client.aclose()
+
+        # Assert
+        meeting, holiday = page.events
+        assert meeting.external_event_id == "meeting"
+        assert meeting.start_utc == datetime(2025, 3, 17, 0, 0, tzinfo=timezone.utc)
+        assert meeting.end_utc == datetime(2025, 3, 17, 1, 0, tzinfo=timezone.utc)
+        assert meeting.title == "주간 회의, 3월"
+        assert meeting.description == "첫 줄\n둘째 줄 이어짐"
+        assert meeting.recurrence_rule == "RRULE:FREQ=WEEKLY;BYDAY=MO"
+        assert meeting.attendees == [
+            {'email': 'minji@example.com', 'name': 'Kim; Minji', 'status': 'accepted'},
+            {'email': 'lee@example.com', 'name': None, 'status': 'declined'}
+        ]
+        assert holiday.all_day and holiday.deleted
+        assert holiday.start_utc == datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_naver_ics_feed_synthetic_delta(self):
+        """ICS 피드는 이전 색인(delta token)과 비교하여 추가/변경/삭제만 반환"""
+        import httpx
+        from app.integrations.base import ProviderError
+        from app.integrations.naver_provider import NaverCalendarProvider
+
+        def vevent(uid, day, summary):
+            return f"BEGIN:VEVENT\r\nUID:{uid}\r\nDTSTART:202503{day:02d}T030000Z\r\nSUMMARY:{summary}\r\nEND:VEVENT\r\n"
+
+        feed = {'body': ""}
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=f"BEGIN:VCALENDAR\r\n{feed['body']}END:VCALENDAR")
+        ))
+        provider = NaverCalendarProvider("client_id", "client_secret", http_client=client)
+        url = "https://calendar.example.com/feed.ics"
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        until = since + timedelta(days=30)
+
+        # Act
+        feed['body'] = vevent("same", 3, "Same") + vevent("edited", 4, "Before") + vevent("removed", 5, "Gone")
+        first = await provider.fetch_events("token", url, since, until)
+        feed['body'] = vevent("same", 3, "Same") + vevent("edited", 4, "After") + vevent("added", 6, "New")
+        second = await provider.fetch_events("token", url, since, until, delta_token=first.next_delta_token)
+        third = await provider.fetch_events("token", url, since, until, delta_token=second.next_delta_token)
+        with pytest.raises(ProviderError, match="Invalid sync token"):
+            await provider.fetch_events("token", url, since, until, delta_token="ics1:not-an-index")
+        await client.aclose()
+
+        # Assert
+        assert provider.capabilities.delta
+        assert sorted(e.external_event_id for e in first.events) == ["edited", "removed", "same"]
+        changes = {e.external_event_id: e for e in second.events}
+        assert sorted(changes) == ["added", "edited", "removed"]
+        assert changes["edited"].title == "After" and not changes["edited"].deleted
+        assert changes["removed"].deleted
+        assert changes["removed"].start_utc == datetime(2025, 3, 5, 3, 0, tzinfo=timezone.utc)
+        assert third.events == [] and third.next_delta_token == second.next_delta_token
+
     @pytest.mark.asyncio
     async def test_naver_provider_ics_parsing(self):
         """Naver Provider ICS 파싱 테스트"""
@@ -411,6 +1535,596 @@ END:VCALENDAR"""
         assert event.description == "테스트 설명"
         assert event.location == "테스트 장소"
 
+class FakeGoogleBatchServer:
+    """Google batch 엔드포인트 흉내 (multipart/mixed 요청을 하위 요청별로 응답)"""
+
+    def __init__(self, flaky_ids=(), failing_ids=()):
+        self.flaky_ids = set(flaky_ids)  # 첫 시도에서 503 반환
+        self.failing_ids = set(failing_ids)  # 항상 400 반환
+        self.calls = []
+
+    def __call__(self, request):
+        import httpx
+        import json as json_lib
+
+        boundary = request.headers['Content-Type'].split('boundary=')[1]
+        parts = [
+            part.strip('\r\n') for part in request.content.decode().split(f'--{boundary}')
+            if part.strip('\r\n') not in ('', '--')
+        ]
+        self.calls.append(len(parts))
+
+        response_parts = []
+        for part in parts:
+            part_headers, _, http_request = part.partition('\r\n\r\n')
+            content_id = part_headers.split('Content-ID: <')[1].split('>')[0]
+            request_line, _, body = http_request.partition('\r\n\r\n')
+            method, path, _ = request_line.split('\r\n')[0].split(' ')
+            event_id = path.rsplit('/', 1)[-1] if method != 'POST' else f"created_{content_id}"
+
+            if event_id in self.failing_ids:
+                status, payload = 400, {'error': {'message': 'Invalid event'}}
+            elif event_id in self.flaky_ids:
+                self.flaky_ids.discard(event_id)
+                status, payload = 503, {'error': {'message': 'Backend Error'}}
+            elif method == 'DELETE':
+                status, payload = 204, None
+            else:
+                event = json_lib.loads(body)
+                status, payload = 200, {
+                    'id': event_id, 'summary': event['summary'], 'start': event['start'],
+                    'end': event['end'], 'updated': '2025-03-17T00:00:00Z', 'etag': '"v2"'
+                }
+
+            response_parts.append('\r\n'.join([
+                '--resp', 'Content-Type: application/http', f'Content-ID: <response-{content_id}>', '',
+                f'HTTP/1.1 {status} X', 'Content-Type: application/json', '',
+                json_lib.dumps(payload) if payload is not None else ''
+            ]))
+
+        return httpx.Response(
+            200,
+            headers={'Content-Type': 'multipart/mixed; boundary=resp'},
+            content=('\r\n'.join(response_parts) + '\r\n--resp--').encode()
+        )
+
+class TestProviderRegistry:
+    """공유 제공자 레지스트리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_registry_shares_pooled_clients(self, monkeypatch):
+        """서비스 인스턴스 간 제공자/HTTP 클라이언트 공유와 풀 통계 테스트"""
+        import httpx
+        from app.core.config import load_provider_settings
+        from app.integrations.registry import ProviderRegistry, set_provider_registry
+
+        # Arrange
+        monkeypatch.setenv('GOOGLE_CLIENT_ID', 'google-client')
+        monkeypatch.setenv('PROVIDER_HTTP_MAX_CONNECTIONS', '8')
+        registry = ProviderRegistry(load_provider_settings())
+        set_provider_registry(registry)
+
+        google = registry.get('google')
+        google._http_client._transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={'items': [{'id': 'primary', 'primary': True}]})
+        )
+
+        try:
+            # Act
+            first = CalendarSyncService(MagicMock())
+            second = CalendarSyncService(MagicMock())
+            calendars = await first.providers['google'].list_calendars("token")
+            stats = registry.pool_stats()
+        finally:
+            set_provider_registry(None)
+            await registry.aclose()
+
+        # Assert
+        assert first.providers is second.providers
+        assert google.client_id == 'google-client'
+        assert calendars[0].primary is True
+        assert stats['google']['max_connections'] == 8
+        assert stats['google']['requests_sent'] == 1
+        assert google._http_client.is_closed
+
+class TestPushExecutor:
+    """순서 보장 동시 push 실행기 테스트"""
+
+    @pytest.fixture
+    def operations(self):
+        """(local_id, external_event_id, action) 목록"""
+        return [
+            ("local_a", None, "create"),
+            ("local_b", "evt_x", "update"),
+            ("local_a", "evt_a", "update"),  # local_a의 create 이후
+            ("local_c", None, "create"),
+            ("local_a", "evt_a", "delete"),
+            ("local_d", "evt_x", "delete"),  # evt_x의 update 이후
+        ]
+
+    @staticmethod
+    def keys(operation):
+        return [f"local:{operation[0]}", operation[1]]
+
+    @pytest.mark.asyncio
+    async def test_run_preserves_per_event_order(self, operations):
+        """같은 이벤트는 순서대로, 결과는 요청 순서로, 동시 실행 수는 제한되는지 테스트"""
+        from app.services.push_executor import PushExecutor
+
+        executed = []
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(operation):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # 앞선 작업일수록 오래 걸리게 해도 같은 이벤트의 순서는 유지되어야 함
+            await asyncio.sleep(0.01 * (len(operations) - operations.index(operation)))
+            executed.append(operation)
+            in_flight -= 1
+            if operation[0] == "local_c":
+                raise ProviderError("Quota exceeded", "naver")
+            return operation[2]
+
+        # Act
+        results = await PushExecutor(max_concurrency=2).run(
+            operations, self.keys, handler, on_error=lambda operation, e: f"error: {e}"
+        )
+
+        # Assert
+        assert results == ["create", "update", "update", "error: naver: Quota exceeded", "delete", "delete"]
+        assert [op[2] for op in executed if op[0] == "local_a"] == ["create", "update", "delete"]
+        assert executed.index(operations[1]) < executed.index(operations[5])
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_run_batched_splits_waves(self, operations):
+        """한 batch에 같은 이벤트가 중복되지 않고 wave 순서대로 실행되는지 테스트"""
+        from app.services.push_executor import PushExecutor
+
+        batches = []
+
+        async def batch_handler(batch):
+            batches.append(batch)
+            return [operation[2] for operation in batch]
+
+        # Act
+        results = await PushExecutor().run_batched(operations, self.keys, batch_handler)
+
+        # Assert
+        assert results == [op[2] for op in operations]
+        assert batches == [
+            [operations[0], operations[1], operations[3]],
+            [operations[2], operations[5]],
+            [operations[4]]
+        ]
+
+class TestGoogleBatch:
+    """Google batch 일괄 쓰기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_write_chunks_and_retries(self):
+        """50건 단위 분할, 작업별 결과, 일시 오류 하위 요청만 재시도 테스트"""
+        import httpx
+        from app.integrations.google_provider import GoogleCalendarProvider
+        from app.integrations.base import EventWriteOperation
+
+        # Arrange
+        server = FakeGoogleBatchServer(flaky_ids={"evt_flaky"}, failing_ids={"evt_bad"})
+        client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        provider = GoogleCalendarProvider(
+            "client_id", "client_secret", http_client=client, batch_url="http://fake-google/batch"
+        )
+        start = datetime(2025, 3, 17, 9, 0, tzinfo=timezone.utc)
+
+        def upsert(event_id):
+            return EventWriteOperation(action='upsert', calendar_id="primary", event=CalendarEventDTO(
+                external_event_id=event_id, calendar_id="primary", title=f"Event {event_id}",
+                start_utc=start, end_utc=start + timedelta(hours=1)
+            ))
+
+        operations = [upsert(None) for _ in range(49)] + [
+            upsert("evt_flaky"),
+            upsert("evt_bad"),
+            EventWriteOperation(action='delete', calendar_id="primary", external_event_id="evt_gone")
+        ]
+
+        # Act
+        with patch('app.integrations.google_provider.asyncio.sleep', AsyncMock()):
+            results = await provider.batch_write("token", operations)
+        await client.aclose()
+
+        # Assert
+        assert sorted(server.calls[:2]) == [2, 50]  # 50건 단위로 분할해 동시 전송
+        assert server.calls[2:] == [1]  # 재시도는 실패한 1건만
+        assert len(results) == len(operations)
+        assert all(result.success for result in results[:49])
+        assert results[0].event.external_event_id == "created_item-0"
+        assert results[49].success and results[49].event.external_event_id == "evt_flaky"
+        assert results[50].success is False and results[50].error == "Invalid event"
+        assert results[51].success and results[51].status_code == 204
+
+class TestGooglePatch:
+    """Google 변경분 PATCH 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_upsert_patches_only_changed_fields(self):
+        """바뀐 필드만 If-Match PATCH, 변경 없으면 호출 생략, etag 불일치는 ConflictError"""
+        import httpx
+        import json as json_lib
+        from app.integrations.google_provider import GoogleCalendarProvider
+        from app.integrations.base import ConflictError
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-Match') == '"stale"':
+                return httpx.Response(412, json={'error': {'message': 'Precondition Failed'}})
+            return httpx.Response(200, json={
+                'id': 'evt_1', 'etag': '"v2"', 'updated': '2025-03-17T10:00:00Z'
+            })
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider = GoogleCalendarProvider("client_id", "client_secret", http_client=client)
+        start = datetime(2025, 3, 17, 9, 0, tzinfo=timezone.utc)
+        previous = CalendarEventDTO(
+            external_event_id="evt_1", calendar_id="primary", title="Standup",
+            description="Daily", start_utc=start, end_utc=start + timedelta(hours=1),
+            external_version='"v1"', external_updated_at=start
+        )
+        edited = CalendarEventDTO(
+            external_event_id="evt_1", calendar_id="primary", title="Standup (moved)",
+            description="Daily", start_utc=start, end_utc=start + timedelta(hours=1)
+        )
+
+        # Act
+        patched = await provider.upsert_event("token", "primary", edited, previous=previous)
+        unchanged = await provider.upsert_event("token", "primary", previous, previous=previous)
+        with pytest.raises(ConflictError):
+            stale = dataclasses.replace(previous, external_version='"stale"')
+            await provider.upsert_event("token", "primary", edited, previous=stale)
+        await client.aclose()
+
+        # Assert
+        assert len(requests) == 2  # 변경 없는 수정은 요청하지 않음
+        assert requests[0].method == 'PATCH'
+        assert requests[0].headers['If-Match'] == '"v1"'
+        assert requests[0].url.params['fields'] == 'id,etag,updated'
+        assert json_lib.loads(requests[0].content) == {'summary': "Standup (moved)"}
+        assert patched.external_version == '"v2"'
+        assert patched.title == "Standup (moved)"
+        assert unchanged.external_version == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_patch_sends_attendees_when_baseline_unknown(self):
+        """참석자를 모르는 기준(attendees_known=False)이면 참석자를 항상 보내고, 모두 제거한 수정은 []로 전송"""
+        import httpx
+        import json as json_lib
+        from app.integrations.google_provider import GoogleCalendarProvider
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={
+                'id': 'evt_1', 'etag': f'"v{len(requests) + 1}"', 'updated': '2025-03-17T10:00:00Z'
+            })
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider = GoogleCalendarProvider("client_id", "client_secret", http_client=client)
+        start = datetime(2025, 3, 17, 9, 0, tzinfo=timezone.utc)
+        stored = CalendarEventDTO(
+            external_event_id="evt_1", calendar_id="primary", title="Standup",
+            start_utc=start, end_utc=start + timedelta(hours=1),
+            external_version='"v1"', external_updated_at=start, attendees_known=False
+        )
+        cleared = dataclasses.replace(stored, attendees=(), external_version=None, attendees_known=True)
+        assert stored.to_dict()['attendees'] == [] and stored.content_fingerprint()  # 모르는 기준도 DTO로 사용 가능
+
+        # Act: 저장된 기준(참석자 모름)에서 참석자 제거, 이어서 방금 쓴 결과를 기준으로 같은 내용 재전송
+        written = await provider.upsert_event("token", "primary", cleared, previous=stored)
+        again = await provider.upsert_event("token", "primary", cleared, previous=written)
+        await client.aclose()
+
+        # Assert
+        assert len(requests) == 1  # 쓴 결과를 기준으로 하면 같은 내용은 요청하지 않음
+        assert json_lib.loads(requests[0].content) == {'attendees': []}
+        assert requests[0].headers['If-Match'] == '"v1"'
+        assert again.external_version == written.external_version == '"v2"'
+
+class TestQuotaLimiter:
+    """제공자 쿼터 토큰 버킷 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limiter_waits_for_tokens_per_user(self):
+        """사용자 버킷이 비면 429 대신 다음 토큰까지 대기, 다른 사용자는 영향 없음"""
+        from app.core.config import QuotaSettings, ProviderQuotaSettings
+        from app.integrations.quota import QuotaLimiter, quota_user
+
+        limiter = QuotaLimiter(QuotaSettings(providers={
+            'google': ProviderQuotaSettings(rate_per_second=100.0, burst=100, user_rate_per_second=2.0, user_burst=2)
+        }))
+        sleep = AsyncMock()
+
+        # Act
+        with patch('app.integrations.quota.asyncio.sleep', sleep):
+            with quota_user("user_a"):
+                for _ in range(3):
+                    await limiter.acquire('google')
+            waits_for_a = sleep.await_count
+            with quota_user("user_b"):
+                await limiter.acquire('google')
+
+        # Assert
+        assert waits_for_a >= 1  # 세 번째 호출은 사용자 버킷 리필을 기다림
+        assert sleep.await_args_list[0].args[0] == pytest.approx(0.5, abs=0.05)
+        assert sleep.await_count == waits_for_a  # user_b는 자기 버킷이 있어 대기 없음
+        usage = {bucket['bucket']: bucket for bucket in await limiter.usage()}
+        assert usage['google:user:user_a']['throttled_total'] >= 1
+        assert usage['google']['granted_total'] == 4
+        visible_to_b = {bucket['bucket'] for bucket in await limiter.usage("user_b")}
+        assert visible_to_b == {'google', 'google:user:user_b'}  # 다른 사용자 버킷은 보이지 않음
+
+    @pytest.mark.asyncio
+    async def test_shared_store_refills_and_counts(self):
+        """DB 버킷 저장소에서 리필과 차감이 한 문장으로 처리되고 사용량이 누적됨"""
+        from app.core.config import QuotaSettings, ProviderQuotaSettings
+        from app.services.quota_store import PostgresQuotaStore
+        from app.core.database import Base as ModelBase
+        import app.models.quota_models  # noqa: F401
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(ModelBase.metadata.create_all)
+        store = PostgresQuotaStore(sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+
+        # Act: 버스트 3, 초당 1개 버킷에서 같은 시각에 4번 요청
+        waits = [await store.take('google', 1, 1.0, 3, 1000.0) for _ in range(4)]
+        later = await store.take('google', 1, 1.0, 3, 1001.0)
+        usage = await store.snapshot(1001.0)
+        await engine.dispose()
+
+        # Assert
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0)
+        assert later == 0.0  # 1초 뒤 토큰 하나 리필
+        assert usage[0].granted_total == 4 and usage[0].throttled_total == 1
+
+class TestResilience:
+    """재시도 정책/circuit breaker 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried_within_deadline(self):
+        """5xx는 deadline 안에서 재시도, deadline을 넘는 Retry-After는 기다리지 않고 실패"""
+        import httpx
+        from app.integrations.google_provider import GoogleCalendarProvider
+        from app.integrations.resilience import ProviderResilience, RetryPolicy
+        from app.integrations.base import RateLimitError
+
+        responses = [503, 502, 200, 429]
+
+        def handler(request):
+            status = responses.pop(0)
+            if status == 200:
+                return httpx.Response(200, json={'items': []})
+            return httpx.Response(status, headers={'Retry-After': '120'})
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider = GoogleCalendarProvider(
+            "client_id", "client_secret", http_client=client,
+            resilience=ProviderResilience('google', policy=RetryPolicy(max_attempts=4, deadline=30.0))
+        )
+        sleep = AsyncMock()
+
+        # Act
+        with patch('app.integrations.resilience.asyncio.sleep', sleep):
+            calendars = await provider.list_calendars("token")
+            with pytest.raises(RateLimitError):
+                await provider._request_with_retry('GET', '/users/me/calendarList', {}, endpoint='calendarList.list')
+        await client.aclose()
+
+        # Assert
+        assert calendars == []
+        assert sleep.await_count == 2  # 503, 502 뒤에만 대기
+        assert all(call.args[0] <= 10.0 for call in sleep.await_args_list)
+        assert responses == []  # 429(Retry-After 120s > deadline)는 재시도 없이 실패
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self):
+        """연속 실패가 임계값을 넘으면 HTTP 호출 없이 CircuitOpenError, 다른 엔드포인트는 영향 없음"""
+        import httpx
+        from app.integrations.resilience import ProviderResilience, RetryPolicy
+        from app.integrations.base import TransientProviderError, CircuitOpenError
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503 if request.url.path == '/down' else 200)
+
+        client = httpx.AsyncClient(base_url="http://provider", transport=httpx.MockTransport(handler))
+        resilience = ProviderResilience(
+            'google', policy=RetryPolicy(max_attempts=1), failure_threshold=3, reset_timeout=60.0
+        )
+
+        # Act
+        for _ in range(3):
+            with pytest.raises(TransientProviderError):
+                await resilience.call('down', lambda: client.get('/down'))
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await resilience.call('down', lambda: client.get('/down'))
+        healthy = await resilience.call('up', lambda: client.get('/up'))
+        await client.aclose()
+
+        # Assert
+        assert calls.count('/down') == 3  # open 이후에는 요청하지 않음
+        assert exc_info.value.retry_after > 0
+        assert healthy.status_code == 200
+        assert resilience.snapshot()['down'] == {'state': 'open', 'consecutive_failures': 3}
+        assert resilience.snapshot()['up']['state'] == 'closed'
+
+class TestHedging:
+    """GET hedging 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_get_hedged_within_budget(self):
+        """지연 백분위를 넘긴 GET은 중복 요청이 이기고, budget이 없으면 원 요청을 기다림"""
+        import httpx
+        from app.core.config import HedgeSettings
+        from app.integrations.google_provider import GoogleCalendarProvider
+        from app.integrations.hedging import RequestHedger
+
+        stalls = [5.0, 0.2]  # 첫 요청은 멈추고, 예산 없는 호출의 원 요청은 조금 늦음
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            if len(calls) in (1, 3):
+                await asyncio.sleep(stalls.pop(0))
+            return httpx.Response(200, json={'items': []})
+
+        def hedged_provider(max_extra_ratio):
+            hedger = RequestHedger(HedgeSettings(
+                enabled=True, min_samples=20, min_delay=0.01, max_extra_ratio=max_extra_ratio
+            ))
+            for _ in range(20):
+                hedger._tracker('calendarList.list').record(0.01)
+                hedger.budget.record_request()
+            return GoogleCalendarProvider("client_id", "client_secret", http_client=client, hedger=hedger), hedger
+
+        client = httpx.AsyncClient(base_url=GoogleCalendarProvider.BASE_URL, transport=httpx.MockTransport(handler))
+        provider, hedger = hedged_provider(0.1)
+        capped_provider, capped_hedger = hedged_provider(0.0)
+
+        # Act
+        started = asyncio.get_event_loop().time()
+        calendars = await provider.list_calendars("token")
+        elapsed = asyncio.get_event_loop().time() - started
+        capped = await capped_provider.list_calendars("token")
+        await client.aclose()
+
+        # Assert
+        assert calendars == [] and capped == []
+        assert elapsed < 1.0  # 멈춘 요청을 기다리지 않음
+        assert hedger.snapshot()['calendarList.list']['hedged'] == 1
+        assert hedger.snapshot()['calendarList.list']['hedge_wins'] == 1
+        assert capped_hedger.snapshot()['calendarList.list']['hedged'] == 0
+        assert capped_hedger.snapshot()['calendarList.list']['budget_denied'] == 1
+        assert len(calls) == 3  # 중복 요청은 예산 안에서 한 번만
+
+    @pytest.mark.asyncio
+    async def test_losing_response_closed_after_cancel(self):
+        """취소 시점에 이미 끝난 지는 요청의 스트리밍 응답도 닫아 연결을 풀에 반환"""
+        import httpx
+        from app.core.config import HedgeSettings
+        from app.integrations.hedging import RequestHedger
+
+        class OpenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b'{}'
+
+        hedger = RequestHedger(HedgeSettings(enabled=True, min_samples=1, min_delay=0.01, max_extra_ratio=1.0))
+        hedger._tracker('events.list').record(0.01)
+        hedger.budget.record_request()
+        responses = []
+
+        async def send():
+            response = httpx.Response(200, stream=OpenStream())
+            responses.append(response)
+            if len(responses) == 1:
+                try:
+                    await asyncio.sleep(5.0)
+                except asyncio.CancelledError:
+                    # 취소가 도착했을 때 응답 헤더는 이미 받은 상황
+                    return response
+            return response
+
+        # Act
+        winner = await hedger.run('events.list', send)
+
+        # Assert
+        assert winner is responses[1]
+        assert responses[0].is_closed
+        assert not winner.is_closed
+        await winner.aclose()
+
+class TestTokenRefresh:
+    """access token 선제 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_expiring_tokens_in_batch(self):
+        """만료가 임박한 연결만 갱신하고 새 토큰을 다시 암호화, 거부된 연결은 재연결 필요로 표시, 일시 실패는 retry_after 뒤 재시도"""
+        from app.integrations.base import OAuthTokens
+        from app.services.token_refresh_service import TokenRefreshService
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        now = datetime(2025, 4, 7, 9, 0, tzinfo=timezone.utc)
+
+        async with session_factory() as session:
+            for connection_id, expires_in, refresh_token in [
+                ("conn_soon", timedelta(minutes=5), "refresh:soon"),
+                ("conn_later", timedelta(hours=2), "refresh:later"),
+                ("conn_revoked", timedelta(minutes=1), "refresh:revoked"),
+                ("conn_flaky", timedelta(minutes=2), "refresh:flaky")
+            ]:
+                session.add(ExternalConnection(
+                    id=connection_id, user_id="user_123", platform_type="google",
+                    access_token_encrypted="enc:old", refresh_token_encrypted=f"enc:{refresh_token}",
+                    token_expires_at=now + expires_in, sync_enabled=True
+                ))
+            await session.commit()
+
+        async def refresh_access_token(refresh_token):
+            if refresh_token == "refresh:revoked":
+                raise AuthenticationError("google", "Token refresh rejected: invalid_grant")
+            if refresh_token == "refresh:flaky":
+                raise ProviderError("Token endpoint unavailable", "google")
+            return OAuthTokens(
+                access_token="access:new", expires_at=now + timedelta(hours=1), refresh_token="refresh:rotated"
+            )
+
+        provider = MagicMock()
+        provider.refresh_access_token = AsyncMock(side_effect=refresh_access_token)
+        service = TokenRefreshService(session_factory, {"google": provider}, refresh_before=timedelta(minutes=10))
+
+        async def encrypt(value, connection_id):
+            return f"enc:{value}"
+
+        async def decrypt(value, connection_id):
+            return value[len("enc:"):]
+
+        # Act
+        with patch('app.services.token_refresh_service.encrypt_token', encrypt), \
+                patch('app.services.token_refresh_service.encrypt_refresh_token', encrypt), \
+                patch('app.services.token_refresh_service.decrypt_refresh_token', decrypt):
+            refreshed = await service.refresh_expiring(now)
+            backing_off = await service.refresh_expiring(now + timedelta(seconds=30))
+
+        async with session_factory() as session:
+            soon = await session.get(ExternalConnection, "conn_soon")
+            later = await session.get(ExternalConnection, "conn_later")
+            revoked = await session.get(ExternalConnection, "conn_revoked")
+            flaky = await session.get(ExternalConnection, "conn_flaky")
+        await engine.dispose()
+
+        # Assert
+        assert refreshed == 1  # 성공한 갱신만 집계
+        assert backing_off == 0
+        assert provider.refresh_access_token.await_count == 3  # 실패한 연결은 retry_after 전에 다시 시도하지 않음
+        assert flaky.token_refresh_retry_at.replace(tzinfo=timezone.utc) == now + service.retry_after
+        assert soon.token_refresh_retry_at is None
+        assert soon.access_token_encrypted == "enc:access:new"
+        assert soon.refresh_token_encrypted == "enc:refresh:rotated"
+        assert soon.token_expires_at.replace(tzinfo=timezone.utc) == now + timedelta(hours=1)
+        assert later.access_token_encrypted == "enc:old"
+        assert revoked.token_expires_at is None  # 선제 갱신 대상에서 제외
+        assert revoked.last_error.startswith("Reauthorization required")
+
 @pytest.mark.performance  
 class TestPerformance:
     """성능 테스트"""